@@ -0,0 +1,212 @@
+"""
+ac_sweep.py
+-----------
+Varredura AC (diagrama de Bode) de filtros RC, RL e RLC.
+
+Cada rede é uma função de transferência racional H(s) = N(s)/D(s) cujos
+coeficientes são arrays NumPy. Um lote de conjuntos de componentes
+(variações de R, L e C) e uma grade de 10⁵ frequências formam uma única
+expressão complexa por broadcasting, com a frequência no último eixo.
+
+O atraso de grupo é calculado em forma fechada a partir das derivadas
+de N(jω) e D(jω), τg = -d(arg N - arg D)/dω, sem derivar numericamente
+a fase (o que exigiria desdobrá-la e amplificaria ruído).
+"""
+
+import math
+from typing import Callable, Dict, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+# Nível de -3 dB exato: |H|² = 1/2
+HALF_POWER_DB = -10 * math.log10(2)
+
+
+class BodeResult(NamedTuple):
+    frequencies: np.ndarray    # (N,) em Hz
+    magnitude_db: np.ndarray   # (..., N) 20·log10|H|
+    phase_deg: np.ndarray      # (..., N) fase contínua ao longo da frequência (graus)
+    group_delay: np.ndarray    # (..., N) -dφ/dω (s)
+
+
+# ==================== REDES ====================
+# Coeficientes em potências crescentes de s: (N, D) com N(s) = Σ n_k·s^k
+
+def _rc_lowpass(R, C):
+    return (1.0,), (1.0, R * C)
+
+
+def _rc_highpass(R, C):
+    return (0.0, R * C), (1.0, R * C)
+
+
+def _rl_lowpass(R, L):
+    return (1.0,), (1.0, L / R)
+
+
+def _rl_highpass(R, L):
+    return (0.0, L / R), (1.0, L / R)
+
+
+def _rlc_lowpass(R, L, C):
+    return (1.0,), (1.0, R * C, L * C)
+
+
+def _rlc_parallel_lowpass(R, L, C):
+    return (1.0,), (1.0, L / R, L * C)
+
+
+def _rlc_bandpass(R, L, C):
+    return (0.0, R * C), (1.0, R * C, L * C)
+
+
+def _rlc_highpass(R, L, C):
+    return (0.0, 0.0, L * C), (1.0, R * C, L * C)
+
+
+def _rlc_bandstop(R, L, C):
+    return (1.0, 0.0, L * C), (1.0, R * C, L * C)
+
+
+# nome -> (componentes, coeficientes, descrição); RLC em série com a fonte,
+# exceto o paralelo (fonte de corrente, saída iL/Is)
+NETWORKS: Dict[str, Tuple[Tuple[str, ...], Callable, str]] = {
+    "rc_lowpass": (("R", "C"), _rc_lowpass, "Passa-baixas RC (saída em C)"),
+    "rc_highpass": (("R", "C"), _rc_highpass, "Passa-altas RC (saída em R)"),
+    "rl_lowpass": (("R", "L"), _rl_lowpass, "Passa-baixas RL (saída em R)"),
+    "rl_highpass": (("R", "L"), _rl_highpass, "Passa-altas RL (saída em L)"),
+    "rlc_lowpass": (("R", "L", "C"), _rlc_lowpass, "Passa-baixas RLC (saída em C)"),
+    "rlc_parallel_lowpass": (("R", "L", "C"), _rlc_parallel_lowpass,
+                             "Passa-baixas RLC paralelo (iL/Is)"),
+    "rlc_bandpass": (("R", "L", "C"), _rlc_bandpass, "Passa-faixa RLC (saída em R)"),
+    "rlc_highpass": (("R", "L", "C"), _rlc_highpass, "Passa-altas RLC (saída em L)"),
+    "rlc_bandstop": (("R", "L", "C"), _rlc_bandstop, "Rejeita-faixa RLC (saída em L+C)"),
+}
+
+
+def characteristic_frequency(network: str, **params) -> np.ndarray:
+    """fc = 1/(2πRC) ou R/(2πL) (primeira ordem), f0 = 1/(2π√LC) (RLC)."""
+    names = NETWORKS[network][0]
+    values = {name: np.asarray(params[name], dtype=float) for name in names}
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if "L" in values and "C" in values:
+            return 1 / (2 * np.pi * np.sqrt(values["L"] * values["C"]))
+        if "C" in values:
+            return 1 / (2 * np.pi * values["R"] * values["C"])
+        return values["R"] / (2 * np.pi * values["L"])
+
+
+# ==================== AVALIAÇÃO ====================
+
+def _polynomial_jw(coefficients: Sequence, omega: np.ndarray):
+    """Partes real e imaginária de P(jω) e suas derivadas em ω.
+
+    Com coeficientes reais, as potências pares de jω são reais e as
+    ímpares imaginárias (j^k = 1, j, -1, -j): tudo em aritmética real,
+    com as potências de ω calculadas uma vez para o lote inteiro.
+    """
+    parts = [0.0, 0.0, 0.0, 0.0]  # re, im, d(re)/dω, d(im)/dω
+    power = np.ones_like(omega)
+    previous = np.zeros_like(omega)
+    for k, c in enumerate(coefficients):
+        c = np.asarray(c, dtype=float)[..., np.newaxis]
+        if np.any(c != 0):
+            sign = 1.0 if k % 4 < 2 else -1.0
+            parts[k % 2] = parts[k % 2] + sign * c * power
+            parts[2 + k % 2] = parts[2 + k % 2] + sign * k * c * previous
+        previous = power
+        power = power * omega
+    return [np.broadcast_to(part, np.shape(part)) for part in parts]
+
+
+def response(network: str, frequencies, **params) -> np.ndarray:
+    """H(j2πf) complexo de `network` (lote de componentes × frequências)."""
+    names, coefficients, _ = NETWORKS[network]
+    omega = 2 * np.pi * np.asarray(frequencies, dtype=float)
+    numerator, denominator = coefficients(*(np.asarray(params[n], dtype=float) for n in names))
+    n_re, n_im, _, _ = _polynomial_jw(numerator, omega)
+    d_re, d_im, _, _ = _polynomial_jw(denominator, omega)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (n_re + 1j * n_im) / (d_re + 1j * d_im)
+
+
+def sweep(network: str, frequencies, **params) -> BodeResult:
+    """Bode de `network` nas frequências dadas, para um lote de componentes.
+
+    Os componentes (ex.: R=..., C=...) podem ser arrays de qualquer
+    forma compatível; o resultado tem essa forma seguida das N frequências.
+    """
+    names, coefficients, _ = NETWORKS[network]
+    missing = set(names) - set(params)
+    if missing:
+        raise ValueError(f"Componentes ausentes: {', '.join(sorted(missing))}")
+    frequencies = np.asarray(frequencies, dtype=float)
+    omega = 2 * np.pi * frequencies
+    numerator, denominator = coefficients(*(np.asarray(params[n], dtype=float) for n in names))
+    n_re, n_im, dn_re, dn_im = _polynomial_jw(numerator, omega)
+    d_re, d_im, dd_re, dd_im = _polynomial_jw(denominator, omega)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        n_abs2 = n_re * n_re + n_im * n_im
+        d_abs2 = d_re * d_re + d_im * d_im
+        magnitude_db = 10 * np.log10(np.maximum(n_abs2 / d_abs2, 1e-300))
+        # Coeficientes >= 0 e grau <= 2 (redes passivas acima): N(jω) e
+        # D(jω) ficam no semiplano superior, então arg N - arg D já é
+        # contínua e dispensa np.unwrap (a etapa mais cara da varredura)
+        phase = np.arctan2(n_im, n_re) - np.arctan2(d_im, d_re)
+        if max(len(numerator), len(denominator)) > 3:
+            phase = np.unwrap(phase, axis=-1)
+        # d(arg P)/dω = (re·im' - im·re')/|P|²
+        group_delay = ((d_re * dd_im - d_im * dd_re) / d_abs2
+                       - (n_re * dn_im - n_im * dn_re) / n_abs2)
+    shape = np.broadcast_shapes(np.shape(magnitude_db), np.shape(phase), np.shape(group_delay))
+    return BodeResult(frequencies, *(np.broadcast_to(field, shape)
+                                     for field in (magnitude_db, np.degrees(phase), group_delay)))
+
+
+def crossings(frequencies, magnitude_db, level_db: float = HALF_POWER_DB
+              ) -> Tuple[np.ndarray, np.ndarray]:
+    """Primeira e última frequência em que o módulo cruza `level_db`.
+
+    Interpolação linear em log f entre as amostras vizinhas; nan para as
+    curvas que não cruzam o nível. Passa-baixas/altas têm um cruzamento
+    (primeira = última), passa-faixa e rejeita-faixa têm dois.
+    """
+    log_f = np.log(np.asarray(frequencies, dtype=float))
+    magnitude_db = np.asarray(magnitude_db, dtype=float)
+    above = magnitude_db >= level_db
+    change = above[..., 1:] != above[..., :-1]
+    found = change.any(axis=-1)
+    first = np.argmax(change, axis=-1)
+    last = change.shape[-1] - 1 - np.argmax(change[..., ::-1], axis=-1)
+
+    def interpolate(k):
+        m0 = np.take_along_axis(magnitude_db, k[..., np.newaxis], axis=-1)[..., 0]
+        m1 = np.take_along_axis(magnitude_db, k[..., np.newaxis] + 1, axis=-1)[..., 0]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x = log_f[k] + (level_db - m0) / (m1 - m0) * (log_f[k + 1] - log_f[k])
+        return np.where(found, np.exp(x), np.nan)[()]
+
+    return interpolate(first), interpolate(last)
+
+
+def log_columns(frequencies, values, columns: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Reduz curvas numa grade log de frequência a mínimo/máximo por coluna.
+
+    Todas as curvas do lote compartilham as frequências, então os
+    limites das colunas são calculados uma vez e a redução é um único
+    reduceat no último eixo. Devolve (x, y) em zigue-zague, dois
+    vértices por coluna - picos de ressonância mais estreitos que um
+    pixel continuam visíveis.
+    """
+    frequencies = np.asarray(frequencies, dtype=float)
+    values = np.asarray(values, dtype=float)
+    if frequencies.size <= 2 * columns:
+        return frequencies, values
+    log_f = np.log(frequencies)
+    edges = np.linspace(log_f[0], log_f[-1], int(columns) + 1)
+    starts = np.unique(np.searchsorted(log_f, edges[:-1]))
+    centers = np.exp((log_f[starts] + log_f[np.append(starts[1:], log_f.size) - 1]) / 2)
+    lo = np.minimum.reduceat(values, starts, axis=-1)
+    hi = np.maximum.reduceat(values, starts, axis=-1)
+    zigzag = np.stack([lo, hi], axis=-1).reshape(values.shape[:-1] + (-1,))
+    return np.repeat(centers, 2), zigzag
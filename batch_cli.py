@@ -0,0 +1,427 @@
+"""
+batch_cli.py
+------------
+Modo em lote, sem interface gráfica: avalia um circuito registrado em
+circuit_solvers.CIRCUITS para cada conjunto de parâmetros de um arquivo
+CSV ou JSONL (ou da entrada padrão) e grava os resultados em streaming.
+
+A entrada é lida em blocos de `--chunk-size` linhas: cada bloco vira
+um array NumPy por entrada do circuito, é avaliado numa única chamada
+vetorizada e escrito antes de o próximo ser lido. A memória fica
+limitada ao tamanho do bloco, qualquer que seja o tamanho do arquivo.
+
+Colunas com o nome de uma entrada do circuito são parâmetros; entradas
+ausentes usam --set NOME=VALOR ou o valor padrão do registro; valores
+com sufixo SPICE (4.7k, 10u) também são aceitos. As demais
+colunas (ex.: um identificador) são copiadas como estão para a saída.
+
+Exemplos:
+    python batch_cli.py --list
+    python batch_cli.py common_emitter_em -i casos.csv -o resultados.csv
+    gerador | python batch_cli.py rc_circuit --format jsonl --outputs tau,fc
+    python batch_cli.py rc_circuit -i casos.csv -o resultados.npy
+"""
+
+import argparse
+import contextlib
+import csv
+import itertools
+import json
+import math
+import os
+import sys
+import time
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, TextIO
+
+import numpy as np
+
+import circuit_solvers as cs
+import export_io
+import nodal
+
+FORMATS = ("csv", "jsonl")
+BINARY_FORMATS = ("npy", "raw")
+DEFAULT_CHUNK = 65536
+
+
+class Chunk(NamedTuple):
+    first_line: int                  # número da primeira linha de dados no arquivo
+    size: int                        # linhas de dados no bloco
+    values: Dict[str, np.ndarray]    # entrada do circuito -> (n,) float
+    passthrough: Dict[str, list]     # coluna não reconhecida -> valores originais
+
+
+class BatchError(ValueError):
+    """Erro nos dados de entrada, com a linha em que ocorreu."""
+
+
+# ==================== LEITURA ====================
+
+def detect_format(path: Optional[str], first_line: str = "") -> str:
+    """Formato pela extensão do arquivo ou, na entrada padrão, pela primeira linha."""
+    if path and path != "-":
+        lower = path.lower()
+        if lower.endswith((".jsonl", ".ndjson", ".json")):
+            return "jsonl"
+        if lower.endswith((".csv", ".txt")):
+            return "csv"
+        for fmt in BINARY_FORMATS:
+            if lower.endswith("." + fmt):
+                return fmt
+    return "jsonl" if first_line.lstrip().startswith("{") else "csv"
+
+
+def _to_float(rows: List[list], columns: Sequence[str], first_line: int,
+              line_numbers: Optional[List[int]] = None) -> Dict[str, np.ndarray]:
+    """Colunas de texto/número -> arrays float; a conversão é feita pelo NumPy."""
+    values = {}
+    for k, name in enumerate(columns):
+        column = [row[k] for row in rows]
+        try:
+            values[name] = np.asarray(column).astype(float)
+        except (TypeError, ValueError):
+            # Caminho lento, valor a valor: sufixos SPICE ("4.7k", "10u") e
+            # a linha exata de um valor inválido
+            parsed = np.empty(len(column))
+            for i, value in enumerate(column):
+                try:
+                    parsed[i] = nodal.parse_value(value) if isinstance(value, str) else float(value)
+                except (TypeError, ValueError):
+                    line = line_numbers[i] if line_numbers else first_line + i
+                    raise BatchError(f"linha {line}: valor inválido para {name}: {value!r}")
+            values[name] = parsed
+    return values
+
+
+def read_csv(stream: Iterable[str], inputs: Sequence[str], chunk_size: int) -> Iterator[Chunk]:
+    """Blocos de um CSV com cabeçalho (separador detectado: vírgula ou ponto e vírgula).
+
+    Linhas vazias são ignoradas sem encerrar a leitura, e cada bloco e
+    mensagem de erro usa o número da linha física no arquivo:
+
+    >>> chunks = read_csv(["V,R", "1,2", "", "3,4", "5,6"], ["V", "R"], 1)
+    >>> [(chunk.first_line, chunk.size) for chunk in chunks]
+    [(2, 1), (4, 1), (5, 1)]
+    """
+    stream = iter(stream)
+    header_line = next(stream, "")
+    if not header_line.strip():
+        return
+    delimiter = ";" if header_line.count(";") > header_line.count(",") else ","
+    header = [name.strip() for name in next(csv.reader([header_line], delimiter=delimiter))]
+    if len(set(header)) != len(header):
+        raise BatchError("linha 1: colunas repetidas no cabeçalho")
+    numeric = [k for k, name in enumerate(header) if name in inputs]
+    other = [k for k, name in enumerate(header) if name not in inputs]
+    reader = csv.reader(stream, delimiter=delimiter)
+
+    def numbered_rows():
+        # (linha física, campos) das linhas não vazias; o cabeçalho é a linha 1
+        while True:
+            line = reader.line_num + 2
+            row = next(reader, None)
+            if row is None:
+                return
+            if row:
+                yield line, row
+
+    rows_left = numbered_rows()
+    while True:
+        batch = list(itertools.islice(rows_left, chunk_size))
+        if not batch:
+            return
+        numbers = [line for line, _ in batch]
+        rows = [row for _, row in batch]
+        short = next((i for i, row in enumerate(rows) if len(row) != len(header)), None)
+        if short is not None:
+            raise BatchError(f"linha {numbers[short]}: {len(rows[short])} colunas, "
+                             f"o cabeçalho tem {len(header)}")
+        values = _to_float([[row[k] for k in numeric] for row in rows],
+                           [header[k] for k in numeric], numbers[0], numbers)
+        passthrough = {header[k]: [row[k] for row in rows] for k in other}
+        yield Chunk(numbers[0], len(rows), values, passthrough)
+
+
+def read_jsonl(stream: Iterable[str], inputs: Sequence[str], chunk_size: int) -> Iterator[Chunk]:
+    """Blocos de um JSONL (um objeto por linha; linhas vazias são ignoradas)."""
+    stream = iter(stream)
+    line = 1
+    while True:
+        lines = list(itertools.islice(stream, chunk_size))
+        if not lines:
+            return
+        records, numbers = [], []
+        for i, text in enumerate(lines):
+            if not text.strip():
+                continue
+            try:
+                record = json.loads(text)
+            except json.JSONDecodeError as error:
+                raise BatchError(f"linha {line + i}: JSON inválido ({error.msg})")
+            if not isinstance(record, dict):
+                raise BatchError(f"linha {line + i}: esperado um objeto JSON")
+            records.append(record)
+            numbers.append(line + i)
+        if records:
+            keys = list(dict.fromkeys(key for record in records for key in record))
+            numeric = [key for key in keys if key in inputs]
+            missing = next(((numbers[i], key) for i, record in enumerate(records)
+                            for key in numeric if key not in record), None)
+            if missing:
+                raise BatchError(f"linha {missing[0]}: falta o parâmetro {missing[1]}")
+            values = _to_float([[record[key] for key in numeric] for record in records],
+                               numeric, numbers[0], numbers)
+            passthrough = {key: [record.get(key) for record in records]
+                           for key in keys if key not in inputs}
+            yield Chunk(numbers[0], len(records), values, passthrough)
+        line += len(lines)
+
+
+# ==================== AVALIAÇÃO ====================
+
+def evaluate_chunk(circuit: str, chunk: Chunk, fixed: Dict[str, float],
+                   outputs: Sequence[str]) -> Dict[str, np.ndarray]:
+    """Avalia um bloco inteiro numa chamada; saídas com uma entrada por linha."""
+    values = dict(fixed)
+    values.update(chunk.values)
+    result = cs.evaluate(circuit, values)
+    return {name: np.broadcast_to(np.asarray(getattr(result, name), dtype=float), (chunk.size,))
+            for name in outputs}
+
+
+# ==================== ESCRITA ====================
+
+def _csv_field(value) -> str:
+    """Texto de uma coluna copiada, entre aspas quando o CSV exige."""
+    text = "" if value is None else str(value)
+    if any(c in text for c in ',;"\r\n'):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def _numeric_columns(chunk: Chunk, results: Dict[str, np.ndarray], include_inputs: bool):
+    numeric = dict(chunk.values) if include_inputs else {}
+    numeric.update(results)
+    return numeric
+
+
+def write_csv(stream: TextIO, chunk: Chunk, results: Dict[str, np.ndarray],
+              include_inputs: bool, precision: int, header: bool) -> None:
+    columns = list(chunk.passthrough)
+    numeric = _numeric_columns(chunk, results, include_inputs)
+    if header:
+        csv.writer(stream, lineterminator="\n").writerow(columns + list(numeric))
+    # Um único % por linha (nan e inf saem como no Python): formatar valor
+    # a valor custaria uma chamada por célula
+    template = ",".join(["%s"] * len(columns) + [f"%.{precision}g"] * len(numeric)) + "\n"
+    fields = [[_csv_field(v) for v in chunk.passthrough[name]] for name in columns]
+    fields += [array.tolist() for array in numeric.values()]
+    stream.writelines(template % row for row in zip(*fields))
+
+
+def write_jsonl(stream: TextIO, chunk: Chunk, results: Dict[str, np.ndarray],
+                include_inputs: bool, precision: int, header: bool) -> None:
+    numeric = _numeric_columns(chunk, results, include_inputs)
+    slots, fields = [], []
+    for name, values in chunk.passthrough.items():
+        slots.append(json.dumps(name, ensure_ascii=False).replace("%", "%%") + ": %s")
+        fields.append([json.dumps(v, ensure_ascii=False) for v in values])
+    for name, array in numeric.items():
+        key = json.dumps(name, ensure_ascii=False).replace("%", "%%")
+        if np.isfinite(array).all():
+            slots.append(f"{key}: %.{precision}g")
+            fields.append(array.tolist())
+        else:
+            # JSON não tem NaN/inf: nessas colunas os não finitos viram null
+            slots.append(f"{key}: %s")
+            fields.append([f"{v:.{precision}g}" if math.isfinite(v) else "null"
+                           for v in array.tolist()])
+    template = "{" + ", ".join(slots) + "}\n"
+    stream.writelines(template % row for row in zip(*fields))
+
+
+class BinarySink:
+    """Saída .npy/.raw (export_io): tabela float64 das colunas numéricas, bloco a bloco.
+
+    Colunas de texto copiadas não cabem numa tabela numérica e são
+    descartadas (com um aviso); o arquivo pode ser lido com memmap
+    enquanto outras ferramentas processam os resultados.
+    """
+
+    def __init__(self, path: str, fmt: str, metadata: dict) -> None:
+        self.path = path
+        self.format = fmt
+        self.metadata = metadata
+        self.writer = None
+
+    def append(self, chunk: Chunk, results: Dict[str, np.ndarray], include_inputs: bool) -> None:
+        table = export_io.as_table(_numeric_columns(chunk, results, include_inputs))
+        if self.writer is None:
+            if chunk.passthrough:
+                sys.stderr.write("batch_cli: aviso: colunas não numéricas descartadas na saída "
+                                 f"binária: {', '.join(chunk.passthrough)}\n")
+            if self.format == "npy":
+                self.writer = export_io.NpyWriter(self.path, table.dtype)
+            else:
+                self.writer = export_io.RawWriter(self.path, table.dtype, metadata=self.metadata)
+        elif table.dtype.names != self.writer.dtype.names:
+            raise BatchError(f"linha {chunk.first_line}: colunas diferentes das do primeiro bloco")
+        self.writer.append(table)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        if self.writer is None:
+            # Entrada vazia: ainda assim um arquivo válido, sem linhas
+            self.writer = export_io.NpyWriter(self.path, np.float64) if self.format == "npy" \
+                else export_io.RawWriter(self.path, np.float64, metadata=self.metadata)
+        self.writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def write_binary(sink: BinarySink, chunk: Chunk, results: Dict[str, np.ndarray],
+                 include_inputs: bool, precision: int, header: bool) -> None:
+    sink.append(chunk, results, include_inputs)
+
+
+READERS = {"csv": read_csv, "jsonl": read_jsonl}
+WRITERS = {"csv": write_csv, "jsonl": write_jsonl, "npy": write_binary, "raw": write_binary}
+
+
+def run(circuit: str, source: Iterable[str], sink: TextIO, input_format: str = "csv",
+        output_format: str = "csv", chunk_size: int = DEFAULT_CHUNK,
+        fixed: Optional[Dict[str, float]] = None, outputs: Optional[Sequence[str]] = None,
+        include_inputs: bool = True, precision: int = 10) -> int:
+    """Processa `source` bloco a bloco; devolve o número de linhas avaliadas."""
+    spec = cs.CIRCUITS[circuit]
+    inputs = [s.name for s in spec.inputs]
+    outputs = list(outputs) if outputs else [s.name for s in spec.outputs]
+    write = WRITERS[output_format]
+    total = 0
+    for chunk in READERS[input_format](source, inputs, chunk_size):
+        results = evaluate_chunk(circuit, chunk, fixed or {}, outputs)
+        write(sink, chunk, results, include_inputs, precision, total == 0)
+        total += chunk.size
+    return total
+
+
+# ==================== LINHA DE COMANDO ====================
+
+def list_circuits(stream: TextIO) -> None:
+    for name, spec in cs.CIRCUITS.items():
+        stream.write(f"{name}: {spec.title}\n")
+        stream.write("  entradas: " + ", ".join(f"{s.name}={s.default:g}" for s in spec.inputs)
+                     + "\n")
+        stream.write("  saídas:   " + ", ".join(s.name for s in spec.outputs) + "\n")
+
+
+def _parse_fixed(items: Sequence[str], inputs: Sequence[str]) -> Dict[str, float]:
+    fixed = {}
+    for item in items:
+        name, sep, value = item.partition("=")
+        if not sep or name not in inputs:
+            raise BatchError(f"--set {item}: esperado NOME=VALOR com NOME em {', '.join(inputs)}")
+        try:
+            fixed[name] = nodal.parse_value(value)
+        except ValueError:
+            raise BatchError(f"--set {item}: valor inválido")
+    return fixed
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="batch_cli",
+        description="Avalia um circuito para cada linha de um CSV/JSONL, em blocos.")
+    parser.add_argument("circuit", nargs="?", help="nome do circuito (ver --list)")
+    parser.add_argument("-i", "--input", default="-",
+                        help="arquivo de parâmetros (padrão: entrada padrão)")
+    parser.add_argument("-o", "--output", default="-",
+                        help="arquivo de resultados (padrão: saída padrão)")
+    parser.add_argument("--format", choices=FORMATS,
+                        help="formato da entrada (padrão: pela extensão ou pelo conteúdo)")
+    parser.add_argument("--output-format", choices=FORMATS + BINARY_FORMATS,
+                        help="formato da saída (padrão: pela extensão ou o da entrada); "
+                             "npy/raw gravam uma tabela binária lida com memmap")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK,
+                        help=f"linhas por bloco (padrão: {DEFAULT_CHUNK})")
+    parser.add_argument("--set", action="append", default=[], metavar="NOME=VALOR",
+                        help="valor fixo para uma entrada ausente da tabela")
+    parser.add_argument("--outputs", help="saídas separadas por vírgula (padrão: todas)")
+    parser.add_argument("--no-inputs", action="store_true",
+                        help="não repetir as entradas do circuito na saída")
+    parser.add_argument("--precision", type=int, default=10,
+                        help="algarismos significativos (padrão: 10)")
+    parser.add_argument("--list", action="store_true", help="lista os circuitos e sai")
+    parser.add_argument("-q", "--quiet", action="store_true",
+                        help="sem resumo em stderr")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.list:
+        list_circuits(sys.stdout)
+        return 0
+    if args.circuit not in cs.CIRCUITS:
+        parser.error(f"circuito desconhecido: {args.circuit!r} (use --list)")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size deve ser positivo")
+    spec = cs.CIRCUITS[args.circuit]
+    names = [s.name for s in spec.outputs]
+    outputs = [name.strip() for name in args.outputs.split(",")] if args.outputs else names
+    unknown = [name for name in outputs if name not in names]
+    if unknown:
+        parser.error(f"saídas desconhecidas: {', '.join(unknown)} (disponíveis: {', '.join(names)})")
+
+    t0 = time.perf_counter()
+    try:
+        fixed = _parse_fixed(args.set, [s.name for s in spec.inputs])
+        handle = sys.stdin if args.input == "-" else open(args.input, newline="",
+                                                         encoding="utf-8")
+        with handle if handle is not sys.stdin else contextlib.nullcontext():
+            source, input_format = handle, args.format
+            if input_format is None and args.input == "-":
+                # Espia a primeira linha e a devolve ao início do fluxo
+                first = handle.readline()
+                source = itertools.chain([first], handle)
+                input_format = detect_format(None, first)
+            input_format = input_format or detect_format(args.input)
+            if input_format not in FORMATS:
+                raise BatchError(f"{args.input}: a entrada deve ser CSV ou JSONL")
+            output_format = args.output_format or (
+                detect_format(args.output) if args.output != "-" else input_format)
+            if output_format in BINARY_FORMATS:
+                if args.output == "-":
+                    raise BatchError(f"a saída {output_format} exige um arquivo (-o)")
+                sink = BinarySink(args.output, output_format,
+                                  {"circuito": args.circuit, "fixos": fixed})
+            else:
+                sink = sys.stdout if args.output == "-" else open(args.output, "w", newline="",
+                                                                 encoding="utf-8")
+            with sink if sink is not sys.stdout else contextlib.nullcontext():
+                total = run(args.circuit, source, sink, input_format, output_format,
+                            args.chunk_size, fixed, outputs, not args.no_inputs, args.precision)
+                sink.flush()
+    except BrokenPipeError:
+        # Leitor da saída fechou (ex.: `| head`): encerra sem traceback
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    except (BatchError, OSError) as error:
+        sys.stderr.write(f"batch_cli: erro: {error}\n")
+        return 1
+    if not args.quiet:
+        elapsed = time.perf_counter() - t0
+        sys.stderr.write(f"{total} linhas de {args.circuit} em {elapsed:.2f} s "
+                         f"({total / max(elapsed, 1e-9):.0f} linhas/s)\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
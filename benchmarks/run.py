@@ -0,0 +1,572 @@
+"""
+benchmarks/run.py
+-----------------
+Benchmarks reproduzíveis de desempenho do Visual Spreadsheets.
+
+Grupos medidos (cada caso em vários tamanhos de dados quando faz sentido):
+
+* import    - partida a frio: importar a interface, load_numerics() e
+              load_plotting(), cada medição num interpretador novo;
+* solver    - núcleos vetorizados: cada circuito de cs.CIRCUITS em lotes
+              de 1 a 10⁵ pontos, varredura AC, análise nodal, onda quadrada;
+* plot      - redesenho LivePlot sobre FigureCanvasAgg (sem display):
+              blit, renderização completa e envelope mín./máx., de 10³ a
+              10⁶ pontos;
+* screen    - construção de cada tela show_* (cache de telas vazio);
+* calculate - latência do botão de cálculo de cada tela, variando o
+              campo de tamanho (pontos da varredura, ciclos, amostras...).
+
+Os grupos screen e calculate precisam do Tk; sem display (ex.: servidor
+de CI) eles são pulados - rode com xvfb-run para incluí-los. Os gráficos
+usam o backend Agg (MPLBACKEND=Agg), sem janela na tela.
+
+Uso:
+    python benchmarks/run.py                    # tudo; compara com baseline.json
+    python benchmarks/run.py --quick            # só o menor tamanho de cada caso
+    python benchmarks/run.py --groups solver,plot --filter ac_sweep
+    python benchmarks/run.py --save-baseline    # grava o resultado como referência
+    python benchmarks/run.py --compare antes.json depois.json
+
+O resultado vai para um JSON (mediana, mínimo e máximo de cada caso,
+mais a máquina e o commit). Um caso é regressão quando a mediana passa
+de `threshold` vezes a da referência e a diferença é maior que
+`floor-ms`; havendo regressões o processo termina com código 1.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HERE = os.path.dirname(os.path.abspath(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+RESULTS_FORMAT = "visual-spreadsheets-benchmarks"
+RESULTS_VERSION = 1
+GROUPS = ("import", "solver", "plot", "screen", "calculate")
+DEFAULT_OUTPUT = os.path.join(HERE, "results.json")
+DEFAULT_BASELINE = os.path.join(HERE, "baseline.json")
+DEFAULT_THRESHOLD = 1.25
+DEFAULT_FLOOR_MS = 1.0
+
+
+class Case(NamedTuple):
+    group: str
+    name: str
+    size: Optional[int]
+    run: Callable[[], None]                    # uma execução medida
+    setup: Optional[Callable[[], None]] = None  # antes de cada execução, fora da medida
+
+
+class Result(NamedTuple):
+    key: str
+    group: str
+    name: str
+    size: Optional[int]
+    median_s: float
+    min_s: float
+    max_s: float
+    repeats: int
+
+
+class Skipped(Exception):
+    """O caso não pode rodar neste ambiente (ex.: sem display para o Tk)."""
+
+
+def case_key(group: str, name: str, size: Optional[int]) -> str:
+    return f"{group}/{name}" + (f"[{size}]" if size is not None else "")
+
+
+# ==================== MEDIÇÃO ====================
+
+def measure(run: Callable[[], None], setup: Optional[Callable[[], None]] = None,
+            min_repeats: int = 3, max_repeats: int = 15, budget_s: float = 1.0) -> List[float]:
+    """Tempos de `run` (uma chamada de aquecimento não entra na conta).
+
+    Repete até `budget_s` segundos medidos ou `max_repeats` execuções,
+    com pelo menos `min_repeats` - casos rápidos ganham mais amostras.
+    """
+    if setup is not None:
+        setup()
+    run()
+    times: List[float] = []
+    while len(times) < min_repeats or (len(times) < max_repeats and sum(times) < budget_s):
+        if setup is not None:
+            setup()
+        t0 = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - t0)
+    return times
+
+
+def summarize(case: Case, times: Sequence[float]) -> Result:
+    return Result(case_key(case.group, case.name, case.size), case.group, case.name, case.size,
+                  statistics.median(times), min(times), max(times), len(times))
+
+
+# ==================== IMPORTAÇÃO (PARTIDA A FRIO) ====================
+
+_IMPORT_SCRIPT = """
+import json, sys, time
+t0 = time.perf_counter()
+import visual_spreadsheets_complete as vs
+t1 = time.perf_counter()
+vs.load_numerics()
+t2 = time.perf_counter()
+vs.load_plotting()
+t3 = time.perf_counter()
+print(json.dumps({"gui_module": t1 - t0, "numerics": t2 - t1, "plotting": t3 - t2}))
+"""
+
+
+def import_times(repeats: int) -> Dict[str, List[float]]:
+    """Tempos de importação, cada repetição num interpretador novo."""
+    times: Dict[str, List[float]] = {}
+    env = dict(os.environ, MPLBACKEND="Agg", PYTHONDONTWRITEBYTECODE="1")
+    for _ in range(repeats):
+        out = subprocess.run([sys.executable, "-c", _IMPORT_SCRIPT], cwd=ROOT, env=env,
+                             capture_output=True, text=True, check=True).stdout
+        for name, seconds in json.loads(out.splitlines()[-1]).items():
+            times.setdefault(name, []).append(seconds)
+    return times
+
+
+# ==================== NÚCLEOS DE CÁLCULO ====================
+
+def _sizes(sizes: Tuple[int, ...], quick: bool) -> Tuple[int, ...]:
+    return sizes[:1] if quick else sizes
+
+
+def solver_cases(quick: bool) -> Iterable[Case]:
+    import numpy as np
+    import ac_sweep
+    import circuit_solvers as cs
+    import nodal
+    import waveforms
+
+    for index, (circuit, spec) in enumerate(cs.CIRCUITS.items()):
+        for n in _sizes((1, 1000, 100000), quick):
+            # Semente por caso: as entradas não dependem de quais casos rodam
+            # (--quick, --filter), e cada caso mede o mesmo que na referência
+            rng = np.random.default_rng((2024, index, n))
+            values = {}
+            for s in spec.inputs:
+                u = rng.random(n)
+                values[s.name] = (s.low * (s.high / s.low) ** u if s.log and s.low > 0
+                                  else s.low + (s.high - s.low) * u)
+            yield Case("solver", circuit, n,
+                       lambda circuit=circuit, values=values: cs.evaluate(circuit, values))
+
+    for n in _sizes((1000, 100000, 1000000), quick):
+        frequencies = np.geomspace(1, 1e6, n)
+        yield Case("solver", "ac_sweep_rlc_bandpass", n,
+                   lambda f=frequencies: ac_sweep.sweep("rlc_bandpass", f, R=10, L=0.01, C=1e-5))
+    for n in _sizes((32, 100, 317), quick):
+        yield Case("solver", "nodal_grid", n,
+                   lambda n=n: nodal.solve(nodal.grid_netlist(n, n, 1.0, 1.0)))
+    for n in _sizes((100, 10000, 1000000), quick):
+        yield Case("solver", "square_wave_envelope", n,
+                   lambda n=n: waveforms.square_wave(0.4e-3, 1e-3, n, columns=1000))
+
+
+# ==================== GRÁFICOS (AGG, SEM DISPLAY) ====================
+
+def plot_cases(quick: bool) -> Iterable[Case]:
+    import numpy as np
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    import live_plot
+    import waveforms
+
+    for n in _sizes((1000, 10000, 100000, 1000000), quick):
+        figure = Figure(figsize=(9, 4), dpi=100)
+        canvas = FigureCanvasAgg(figure)
+        plot = live_plot.LivePlot(canvas, figure.add_subplot(111))
+        plot.line("y", color="cyan", linewidth=1)
+        t = np.linspace(0, 1, n)
+        wave = np.sin(2 * np.pi * 50 * t)
+        plot.set_line("y", t, wave)
+        plot.rescale(xlim=(0, 1), ylim=(-1.2, 1.2))
+        plot.redraw(full=True)
+        # A amplitude muda a cada quadro, como ao arrastar um controle
+        phase = [0.0]
+
+        def update(plot=plot, t=t, wave=wave, phase=phase):
+            phase[0] = 0.9 if phase[0] == 1.0 else 1.0
+            plot.set_line("y", t, wave * phase[0])
+
+        def blit(plot=plot, update=update):
+            update()
+            plot.redraw()
+
+        def full(plot=plot, update=update):
+            update()
+            plot.redraw(full=True)
+
+        def envelope(plot=plot, t=t, wave=wave, phase=phase):
+            phase[0] = 0.9 if phase[0] == 1.0 else 1.0
+            plot.set_line("y", *waveforms.minmax_envelope(t, wave * phase[0], 1000))
+            plot.redraw()
+
+        yield Case("plot", "blit", n, blit)
+        yield Case("plot", "full", n, full)
+        yield Case("plot", "envelope_blit", n, envelope)
+
+
+# ==================== TELAS (TK) ====================
+
+# (tela, botão de cálculo, campo de tamanho, tamanhos); sem campo: só o padrão
+CALCULATIONS: Tuple[Tuple[str, str, Optional[str], Tuple[int, ...]], ...] = (
+    ("show_ohms_law", "CALCULAR", None, ()),
+    ("show_voltage_divider", "CALCULAR", None, ()),
+    ("show_current_divider", "CALCULAR", None, ()),
+    ("show_current_divider", "RESOLVER GRADE", "Nós por Lado:", (32, 100, 317)),
+    ("show_rc_circuit", "CALCULAR", "Pontos na Varredura:", (1000, 100000, 1000000)),
+    ("show_rlc_circuit", "CALCULAR E PLOTAR", "Pontos na Varredura:", (1000, 100000, 1000000)),
+    ("show_rl_response", "CALCULAR E PLOTAR", "Pontos na Varredura:", (1000, 100000, 1000000)),
+    ("show_555_astable", "CALCULAR E PLOTAR", "Ciclos no Gráfico:", (3, 1000, 100000)),
+    ("show_pwm_analysis", "CALCULAR E PLOTAR", "Ciclos no Gráfico:", (3, 1000, 100000)),
+    ("show_buck_converter", "CALCULAR E PLOTAR", None, ()),
+    ("show_buck_converter", "SIMULAR MALHA FECHADA", None, ()),
+    ("show_rlc_transient", "CALCULAR E PLOTAR", "Número de Curvas:", (100, 10000, 100000)),
+    ("show_design_explorer", "CALCULAR E PLOTAR", "Resolução (pontos/eixo):", (100, 500, 1000)),
+    ("show_tolerance", "SIMULAR", "Nº de Amostras:", (10000, 100000, 1000000)),
+    ("show_standard_resistors", "BUSCAR PARES", None, ()),
+    ("show_common_emitter", "CALCULAR E PLOTAR", None, ()),
+    ("show_common_emitter", "SIMULAR TRANSITÓRIO", "Ciclos simulados:", (5, 20, 80)),
+    ("show_common_emitter", "VARRER AMPLITUDE", "Amplitudes:", (10, 100)),
+    ("show_common_emitter", "SIMULAR LOTE", "Combinações:", (1000, 10000, 100000)),
+    ("show_three_phase", "CALCULAR", None, ()),
+    ("show_three_phase", "PERFIL SINTÉTICO", "Horas do Perfil Sintético:", (8760, 100000, 1000000)),
+)
+
+
+class _Dialogs:
+    """Substitui as caixas de mensagem (modais) por um registro durante a medição."""
+
+    NAMES = ("showerror", "showwarning", "showinfo")
+
+    def __init__(self, messagebox) -> None:
+        self.messagebox = messagebox
+        self.errors: List[str] = []
+        self._original = {name: getattr(messagebox, name) for name in self.NAMES}
+
+    def __enter__(self):
+        for name in self.NAMES:
+            setattr(self.messagebox, name, self._record(name))
+        return self
+
+    def _record(self, name):
+        def record(title=None, message=None, **options):
+            if name != "showinfo":
+                self.errors.append(f"{title}: {message}")
+            return "ok"
+        return record
+
+    def __exit__(self, *exc) -> None:
+        for name, function in self._original.items():
+            setattr(self.messagebox, name, function)
+
+
+def _open_app():
+    """(tkinter, módulo da interface, app) com a janela oculta; Skipped sem display."""
+    import tkinter as tk
+    try:
+        root = tk.Tk()
+    except tk.TclError as error:
+        raise Skipped(f"Tk indisponível ({error}); rode com xvfb-run") from None
+    root.withdraw()
+    import visual_spreadsheets_complete as vs
+    vs.load_plotting()
+    return tk, vs, vs.VisualSpreadsheetsCompleto(root)
+
+
+def _walk(widget):
+    yield widget
+    for child in widget.winfo_children():
+        yield from _walk(child)
+
+
+def _button(tk, app, text: str):
+    for widget in _walk(app.workspace):
+        if isinstance(widget, tk.Button) and widget.cget("text") == text:
+            return widget
+    raise LookupError(f"{app.screens.current}: botão {text!r} não encontrado")
+
+
+def screen_names(app) -> List[str]:
+    """Telas implementadas (as pendentes só mostram o aviso e não mudam de tela)."""
+    names = []
+    for name in sorted(n for n in dir(app) if n.startswith("show_")):
+        if getattr(getattr(type(app), name), "__wrapped__", None) is not None:
+            names.append(name)
+    return names
+
+
+def screen_cases(app_parts) -> Iterable[Case]:
+    tk, vs, app = app_parts
+    for name in screen_names(app):
+        def setup(name=name):
+            app.screens.clear()
+            app.show_welcome()
+
+        def build(name=name):
+            getattr(app, name)()
+            app.root.update_idletasks()
+
+        yield Case("screen", name, None, build, setup)
+
+
+def calculate_cases(app_parts, quick: bool) -> Iterable[Case]:
+    tk, vs, app = app_parts
+    for screen, button, field, sizes in CALCULATIONS:
+        name = f"{screen}:{button.lower().replace(' ', '_')}"
+        for size in _sizes(sizes, quick) or (None,):
+            def setup(screen=screen, field=field, size=size):
+                getattr(app, screen)()
+                if field is not None:
+                    entry = app.screens.entry(screen, field)
+                    entry.delete(0, tk.END)
+                    entry.insert(0, str(size))
+
+            def run(button=button):
+                _button(tk, app, button).invoke()
+                app.compute.wait()
+                app.root.update_idletasks()
+
+            yield Case("calculate", name, size, run, setup)
+
+
+# ==================== EXECUÇÃO ====================
+
+def collect(groups: Sequence[str], quick: bool, name_filter: Optional[str],
+            log=print) -> Tuple[List[Result], Dict[str, str]]:
+    """Roda os grupos pedidos; devolve (resultados, casos pulados -> motivo)."""
+    results: List[Result] = []
+    skipped: Dict[str, str] = {}
+    budget = 0.3 if quick else 1.0
+
+    def wanted(key: str) -> bool:
+        return name_filter is None or name_filter in key
+
+    if "import" in groups:
+        repeats = 3 if quick else 7
+        for name, times in import_times(repeats).items():
+            case = Case("import", name, None, lambda: None)
+            if wanted(case_key("import", name, None)):
+                results.append(summarize(case, times))
+                log(_line(results[-1]))
+
+    generators: List[Tuple[str, Callable[[], Iterable[Case]]]] = []
+    if "solver" in groups:
+        generators.append(("solver", lambda: solver_cases(quick)))
+    if "plot" in groups:
+        generators.append(("plot", lambda: plot_cases(quick)))
+    if "screen" in groups or "calculate" in groups:
+        app_parts: List = []
+
+        def tk_cases(group):
+            if not app_parts:
+                app_parts.append(_open_app())
+            return screen_cases(app_parts[0]) if group == "screen" else \
+                calculate_cases(app_parts[0], quick)
+        for group in ("screen", "calculate"):
+            if group in groups:
+                generators.append((group, lambda group=group: tk_cases(group)))
+
+    for group, make in generators:
+        try:
+            cases = list(make())
+        except Skipped as reason:
+            skipped[group] = str(reason)
+            log(f"{group:10s} pulado: {reason}")
+            continue
+        for case in cases:
+            key = case_key(case.group, case.name, case.size)
+            if not wanted(key):
+                continue
+            try:
+                results.append(summarize(case, _measure_case(case, budget)))
+            except Exception as error:     # um caso com erro não derruba os outros
+                skipped[key] = f"{type(error).__name__}: {error}"
+                log(f"{key:60s} erro: {skipped[key]}")
+                continue
+            log(_line(results[-1]))
+    return results, skipped
+
+
+def _measure_case(case: Case, budget: float) -> List[float]:
+    if case.group not in ("screen", "calculate"):
+        return measure(case.run, case.setup, budget_s=budget)
+    from tkinter import messagebox
+    with _Dialogs(messagebox) as dialogs:
+        times = measure(case.run, case.setup, budget_s=budget)
+    if dialogs.errors:
+        raise RuntimeError(dialogs.errors[0])
+    return times
+
+
+def _line(result: Result) -> str:
+    return (f"{result.key:60s} {result.median_s * 1e3:10.3f} ms"
+            f"  (mín. {result.min_s * 1e3:.3f}, n={result.repeats})")
+
+
+def machine_info() -> Dict[str, object]:
+    info: Dict[str, object] = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpus": os.cpu_count(),
+    }
+    for module in ("numpy", "matplotlib", "scipy"):
+        try:
+            info[module] = __import__(module).__version__
+        except ImportError:
+            info[module] = None
+    try:
+        info["commit"] = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                                        capture_output=True, text=True,
+                                        check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        info["commit"] = None
+    return info
+
+
+def write_results(path: str, results: Sequence[Result], skipped: Dict[str, str],
+                  quick: bool) -> None:
+    document = {
+        "format": RESULTS_FORMAT,
+        "version": RESULTS_VERSION,
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "quick": quick,
+        "machine": machine_info(),
+        "results": [r._asdict() for r in results],
+        "skipped": skipped,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(document, f, ensure_ascii=False, indent=1)
+        f.write("\n")
+
+
+def read_results(path: str) -> Dict[str, object]:
+    with open(path, encoding="utf-8") as f:
+        document = json.load(f)
+    if document.get("format") != RESULTS_FORMAT or document.get("version") != RESULTS_VERSION:
+        raise ValueError(f"{path}: não é um arquivo de resultados de benchmark (versão "
+                         f"{RESULTS_VERSION})")
+    return document
+
+
+# ==================== COMPARAÇÃO ====================
+
+class Comparison(NamedTuple):
+    key: str
+    before_s: float
+    after_s: float
+    ratio: float
+    status: str      # "regressão", "melhora" ou "" (dentro da tolerância)
+
+
+def compare(before: Dict[str, object], after: Dict[str, object],
+            threshold: float = DEFAULT_THRESHOLD,
+            floor_s: float = DEFAULT_FLOOR_MS / 1e3) -> List[Comparison]:
+    """Compara as medianas dos casos presentes nos dois resultados."""
+    reference = {r["key"]: r["median_s"] for r in before["results"]}
+    rows = []
+    for r in after["results"]:
+        if r["key"] not in reference:
+            continue
+        old, new = reference[r["key"]], r["median_s"]
+        ratio = new / old if old > 0 else float("inf")
+        status = ""
+        if ratio > threshold and new - old > floor_s:
+            status = "regressão"
+        elif ratio < 1 / threshold and old - new > floor_s:
+            status = "melhora"
+        rows.append(Comparison(r["key"], old, new, ratio, status))
+    return rows
+
+
+def print_comparison(rows: Sequence[Comparison], before: Dict[str, object],
+                     after: Dict[str, object], out=sys.stdout) -> None:
+    if before["machine"].get("platform") != after["machine"].get("platform") or \
+            before["machine"].get("cpus") != after["machine"].get("cpus"):
+        print("Aviso: referência medida em outra máquina "
+              f"({before['machine'].get('platform')}, {before['machine'].get('cpus')} CPUs)",
+              file=out)
+    print(f"{'caso':60s} {'antes (ms)':>12s} {'depois (ms)':>12s} {'razão':>7s}", file=out)
+    for row in rows:
+        print(f"{row.key:60s} {row.before_s * 1e3:12.3f} {row.after_s * 1e3:12.3f} "
+              f"{row.ratio:7.2f} {row.status}", file=out)
+    regressions = sum(row.status == "regressão" for row in rows)
+    improvements = sum(row.status == "melhora" for row in rows)
+    print(f"{len(rows)} casos comparados: {regressions} regressões, {improvements} melhoras",
+          file=out)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="benchmarks/run.py",
+        description="Mede importação, solvers, gráficos e telas e compara com a referência.")
+    parser.add_argument("--groups", default=",".join(GROUPS),
+                        help=f"grupos separados por vírgula (padrão: {','.join(GROUPS)})")
+    parser.add_argument("--filter", help="só os casos cujo nome contém este texto")
+    parser.add_argument("--quick", action="store_true",
+                        help="só o menor tamanho de cada caso e menos repetições")
+    parser.add_argument("-o", "--output", default=DEFAULT_OUTPUT,
+                        help="arquivo JSON de resultados (padrão: benchmarks/results.json)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE,
+                        help="referência para comparar (padrão: benchmarks/baseline.json)")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="grava o resultado também como a nova referência")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"razão acima da qual é regressão (padrão: {DEFAULT_THRESHOLD})")
+    parser.add_argument("--floor-ms", type=float, default=DEFAULT_FLOOR_MS,
+                        help="diferenças menores que isto nunca são regressão "
+                             f"(padrão: {DEFAULT_FLOOR_MS} ms)")
+    parser.add_argument("--compare", nargs=2, metavar=("ANTES", "DEPOIS"),
+                        help="só compara dois arquivos de resultados, sem medir")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    floor_s = args.floor_ms / 1e3
+    if args.compare:
+        before, after = (read_results(path) for path in args.compare)
+        rows = compare(before, after, args.threshold, floor_s)
+        print_comparison(rows, before, after)
+        return int(any(row.status == "regressão" for row in rows))
+
+    groups = [g.strip() for g in args.groups.split(",") if g.strip()]
+    unknown = set(groups) - set(GROUPS)
+    if unknown:
+        build_parser().error(f"grupos desconhecidos: {', '.join(sorted(unknown))}")
+    results, skipped = collect(groups, args.quick, args.filter)
+    write_results(args.output, results, skipped, args.quick)
+    print(f"{len(results)} casos gravados em {args.output}")
+    if args.save_baseline:
+        write_results(args.baseline, results, skipped, args.quick)
+        print(f"Referência atualizada: {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print("Sem referência para comparar (use --save-baseline)")
+        return 0
+    before, after = read_results(args.baseline), read_results(args.output)
+    rows = compare(before, after, args.threshold, floor_s)
+    print_comparison(rows, before, after)
+    return int(any(row.status == "regressão" for row in rows))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
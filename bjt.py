@@ -0,0 +1,402 @@
+"""
+bjt.py
+------
+Ponto de operação DC do transistor bipolar NPN pelo modelo de Ebers-Moll.
+
+O estágio emissor comum com polarização por divisor é reduzido ao
+equivalente de Thévenin da base (VTH = VCC·R2/(R1+R2), RTH = R1 || R2),
+e as tensões de base, emissor e coletor saem de um Newton 3×3 sobre as
+leis de Kirchhoff com as correntes exponenciais das junções - sem
+supor VBE fixo, IC ≈ IE ou divisor sem carga.
+
+Tudo é vetorizado: β, temperatura e resistores podem ser arrays e cada
+combinação é um sistema independente, resolvido em lote pela regra de
+Cramer. A convergência é protegida como nos simuladores SPICE: o passo
+das tensões de junção é limitado, o expoente é saturado e cada ponto
+para de ser atualizado assim que converge.
+
+O transitório de grande sinal (amplifier_transient) resolve o estágio
+completo - fonte com RS, capacitores de acoplamento e de desacoplamento
+e carga - passo a passo com capacitores trapezoidais, um Newton por
+passo para todas as amplitudes de uma vez. compression_sweep extrai daí
+o ganho da fundamental, o THD, o ceifamento e o ponto de 1 dB.
+"""
+
+from typing import Callable, NamedTuple, Optional
+
+import numpy as np
+
+BOLTZMANN_Q = 8.617333262e-5   # k/q (V/K)
+T_NOMINAL = 25.0               # °C em que IS e β são especificados
+EG = 1.11                      # energia da banda proibida do silício (eV)
+XTI = 3.0                      # expoente de temperatura de IS
+XTB = 1.5                      # expoente de temperatura de β
+
+CUTOFF, ACTIVE, SATURATION = 0, 1, 2
+REGIONS = ("corte", "ativa", "saturação")
+
+# Maior expoente avaliado (acima dele a exponencial segue pela tangente)
+_MAX_EXPONENT = 80.0
+
+
+class OperatingPoint(NamedTuple):
+    VB: np.ndarray
+    VE: np.ndarray
+    VC: np.ndarray
+    IB: np.ndarray
+    IC: np.ndarray
+    IE: np.ndarray
+    VBE: np.ndarray
+    VCE: np.ndarray
+    re: np.ndarray           # VT/IE (inf se IE <= 0)
+    region: np.ndarray       # CUTOFF, ACTIVE ou SATURATION
+    converged: np.ndarray    # bool por ponto
+    iterations: int
+
+
+def thermal_voltage(T) -> np.ndarray:
+    """VT = kT/q com T em °C."""
+    return BOLTZMANN_Q * (np.asarray(T, dtype=float) + 273.15)
+
+
+def saturation_current(IS, T) -> np.ndarray:
+    """IS(T) = IS·(T/T0)^XTI·exp(EG/k·(1/T0 - 1/T)), temperaturas em °C."""
+    T = np.asarray(T, dtype=float) + 273.15
+    T0 = T_NOMINAL + 273.15
+    return IS * (T / T0) ** XTI * np.exp(EG / BOLTZMANN_Q * (1 / T0 - 1 / T))
+
+
+def beta_at(beta, T) -> np.ndarray:
+    """β(T) = β·(T/T0)^XTB."""
+    T = np.asarray(T, dtype=float) + 273.15
+    return np.asarray(beta, dtype=float) * (T / (T_NOMINAL + 273.15)) ** XTB
+
+
+def _exp_limited(x):
+    """(e^x, d e^x/dx) com prolongamento linear acima de _MAX_EXPONENT."""
+    clipped = np.minimum(x, _MAX_EXPONENT)
+    value = np.exp(clipped)
+    return value * (1 + x - clipped), value
+
+
+def _pnjlim(v_new, v_old, vt, v_crit):
+    """Limitação de tensão de junção do SPICE (pnjlim).
+
+    Acima de v_crit, onde a exponencial passa a dominar, um passo maior
+    que 2·VT é trocado pelo passo logarítmico equivalente em corrente.
+    Devolve (tensão limitada, máscara dos pontos limitados).
+    """
+    limit = (v_new > v_crit) & (np.abs(v_new - v_old) > 2 * vt)
+    arg = 1 + (v_new - v_old) / vt
+    with np.errstate(divide="ignore", invalid="ignore"):
+        from_on = np.where(arg > 0, v_old + vt * np.log(np.where(arg > 0, arg, 1.0)), v_crit)
+        from_off = vt * np.log(np.maximum(v_new / vt, 1.0))
+    return np.where(limit, np.where(v_old > 0, from_on, from_off), v_new), limit
+
+
+def _companion(vbe, vbc, vbe_l, vbc_l, vt, i_s, bf, br):
+    """Correntes de Ebers-Moll linearizadas no ponto limitado (vbe_l, vbc_l).
+
+    Devolve (IC, IB, dIC, dIB): as correntes estendidas pela tangente até
+    as tensões atuais (vbe, vbc) e as derivadas, cada uma como o par
+    (d/dVBE, d/dVBC).
+    """
+    ebe, gbe = _exp_limited(vbe_l / vt)
+    ebc, gbc = _exp_limited(vbc_l / vt)
+    gbe, gbc = i_s * gbe / vt, i_s * gbc / vt
+    dIC = (gbe, -gbc * (1 + 1 / br))
+    dIB = (gbe / bf, gbc / br)
+    IC = (i_s * (ebe - ebc) - i_s / br * (ebc - 1)
+          + dIC[0] * (vbe - vbe_l) + dIC[1] * (vbc - vbc_l))
+    IB = (i_s / bf * (ebe - 1) + i_s / br * (ebc - 1)
+          + dIB[0] * (vbe - vbe_l) + dIB[1] * (vbc - vbc_l))
+    return IC, IB, dIC, dIB
+
+
+def _node_gradient(d):
+    """(d/dVBE, d/dVBC) -> derivadas em (VB, VE, VC), último eixo."""
+    return np.stack([d[0] + d[1], -d[0], -d[1]], axis=-1)
+
+
+def _region(IC, VBC, VCC, RC, RE):
+    """Corte se IC < 0,1% de VCC/(RC+RE), saturação se VBC > 0,4 V."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        IC_max = VCC / (RC + RE)
+    return np.where(IC < 1e-3 * IC_max, CUTOFF, np.where(VBC > 0.4, SATURATION, ACTIVE))
+
+
+def _solve3(J, F):
+    """Resolve J·dx = F em lote (J: (..., 3, 3), F: (..., 3)) por Cramer."""
+    def det(m):
+        return (m[..., 0, 0] * (m[..., 1, 1] * m[..., 2, 2] - m[..., 1, 2] * m[..., 2, 1])
+                - m[..., 0, 1] * (m[..., 1, 0] * m[..., 2, 2] - m[..., 1, 2] * m[..., 2, 0])
+                + m[..., 0, 2] * (m[..., 1, 0] * m[..., 2, 1] - m[..., 1, 1] * m[..., 2, 0]))
+    d = det(J)
+    dx = np.empty_like(F)
+    for k in range(3):
+        Jk = J.copy()
+        Jk[..., :, k] = F
+        dx[..., k] = det(Jk) / d
+    return dx
+
+
+def operating_point(VCC, RC, RE, R1, R2, beta, T=T_NOMINAL, IS=1e-14,
+                    beta_r=1.0, max_iter: int = 100, tol: float = 1e-9) -> OperatingPoint:
+    """Ponto de operação do emissor comum por Newton sobre Ebers-Moll.
+
+    Incógnitas: VB, VE e VC. Equações (em volts, sem dividir por R, de
+    modo que RE = 0 ou RC = 0 continuam válidos):
+        VTH - VB - RTH·IB = 0,  RE·IE - VE = 0,  VCC - VC - RC·IC = 0
+    `beta` e `IS` são os valores a 25 °C; `T` em °C.
+    """
+    inputs = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (VCC, RC, RE, R1, R2, beta, T, IS, beta_r)))
+    shape = inputs[0].shape
+    # Lote achatado: cada ponto é um sistema 3×3 independente
+    VCC, RC, RE, R1, R2, beta, T, IS, beta_r = (v.ravel() for v in inputs)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        VTH = VCC * R2 / (R1 + R2)
+        RTH = R1 * R2 / (R1 + R2)
+    VT = thermal_voltage(T)
+    IS_T = saturation_current(IS, T)
+    beta_f = beta_at(beta, T)
+
+    # Estimativa inicial: VBE de condução com a carga da base já incluída
+    VBE0 = VT * np.log1p(1e-3 / IS_T)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        IB0 = np.maximum((VTH - VBE0) / (RTH + (beta_f + 1) * RE), 0.0)
+    IB0 = np.nan_to_num(IB0, nan=0.0, posinf=0.0)
+    x = np.stack([VTH - RTH * IB0, (beta_f + 1) * IB0 * RE,
+                  np.maximum(VCC - RC * beta_f * IB0, 0.0)], axis=-1)
+    x = np.nan_to_num(x)
+    active = np.isfinite(VTH) & np.isfinite(RTH)
+    converged = np.zeros(VTH.shape, dtype=bool)
+
+    # Tensões de junção em que o modelo é linearizado (limitadas por pnjlim)
+    v_crit = VT * np.log(VT / (np.sqrt(2) * IS_T))
+    vbe_lin = x[:, 0] - x[:, 1]
+    vbc_lin = np.minimum(x[:, 0] - x[:, 2], 0.0)
+
+    iterations = 0
+    for iterations in range(1, max_iter + 1):
+        idx = np.flatnonzero(active)
+        if not idx.size:
+            break
+        xa = x[idx]
+        vt, i_s = VT[idx], IS_T[idx]
+        bf, br = beta_f[idx], beta_r[idx]
+        rth, re_, rc = RTH[idx], RE[idx], RC[idx]
+        VB, VE, VC = xa[:, 0], xa[:, 1], xa[:, 2]
+        vbe, vbc = VB - VE, VB - VC
+        vbe_l, limited_be = _pnjlim(vbe, vbe_lin[idx], vt, v_crit[idx])
+        vbc_l, limited_bc = _pnjlim(vbc, vbc_lin[idx], vt, v_crit[idx])
+        vbe_lin[idx], vbc_lin[idx] = vbe_l, vbc_l
+
+        # Modelo companheiro: correntes e condutâncias no ponto limitado,
+        # estendidas pela tangente até as tensões atuais dos nós
+        IC, IB, dIC, dIB = _companion(vbe, vbc, vbe_l, vbc_l, vt, i_s, bf, br)
+        gIC, gIB = _node_gradient(dIC), _node_gradient(dIB)
+        F = np.stack([VTH[idx] - VB - rth * IB,
+                      re_ * (IC + IB) - VE,
+                      VCC[idx] - VC - rc * IC], axis=-1)
+        J = np.empty(F.shape + (3,))
+        J[:, 0, :] = -rth[:, None] * gIB
+        J[:, 0, 0] -= 1
+        J[:, 1, :] = re_[:, None] * (gIC + gIB)
+        J[:, 1, 1] -= 1
+        J[:, 2, :] = -rc[:, None] * gIC
+        J[:, 2, 2] -= 1
+
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            dx = -_solve3(J, F)
+        bad = ~np.all(np.isfinite(dx), axis=-1)
+        dx[bad] = 0.0
+        x[idx] = xa + dx
+
+        done = (~(limited_be | limited_bc) & ~bad
+                & (np.max(np.abs(dx), axis=-1) <= tol * (1 + np.abs(VCC[idx]))))
+        converged[idx] = done
+        active[idx] = ~(done | bad)
+
+    VB, VE, VC = x[..., 0], x[..., 1], x[..., 2]
+    ebe, _ = _exp_limited((VB - VE) / VT)
+    ebc, _ = _exp_limited((VB - VC) / VT)
+    IC = IS_T * (ebe - ebc) - IS_T / beta_r * (ebc - 1)
+    IB = IS_T / beta_f * (ebe - 1) + IS_T / beta_r * (ebc - 1)
+    IE = IC + IB
+    with np.errstate(divide="ignore"):
+        re = np.where(IE > 0, VT / np.where(IE > 0, IE, 1.0), np.inf)
+    region = _region(IC, VB - VC, VCC, RC, RE)
+    fields = (VB, VE, VC, IB, IC, IE, VB - VE, VC - VE, re, region, converged)
+    return OperatingPoint(*(field.reshape(shape)[()] for field in fields), iterations)
+
+
+# ==================== TRANSITÓRIO DE GRANDE SINAL ====================
+
+class TransientResult(NamedTuple):
+    t: np.ndarray            # (N,) instantes (s)
+    vin: np.ndarray          # (K, N) tensão da fonte senoidal
+    vout: np.ndarray         # (K, N) tensão na carga RL (após Co)
+    vc: np.ndarray           # (K, N) tensão no coletor
+    ic: np.ndarray           # (K, N) corrente de coletor
+    region: np.ndarray       # (K, N) região de operação em cada instante
+    converged: np.ndarray    # (K,) Newton convergiu em todos os passos
+
+
+class CompressionResult(NamedTuple):
+    amplitudes: np.ndarray   # (K,) amplitude de pico da fonte (V)
+    output: np.ndarray       # (K,) amplitude da fundamental na carga (V)
+    gain_db: np.ndarray      # (K,) 20·log10(saída/entrada) da fundamental
+    thd: np.ndarray          # (K,) distorção harmônica total (razão)
+    clipped: np.ndarray      # (K,) o transistor saturou ou cortou na janela
+    small_signal_db: float   # ganho na menor amplitude (dB)
+    clip_amplitude: float    # menor amplitude com ceifamento (nan se nenhuma)
+    p1db_amplitude: float    # entrada no ponto de compressão de 1 dB (nan se não houver)
+    transient: TransientResult
+
+
+def amplifier_transient(amplitudes, frequency: float, VCC: float, RC: float, RE: float,
+                        R1: float, R2: float, beta: float, T: float = T_NOMINAL,
+                        RS: float = 50.0, RL: float = 10e3, CI: float = 10e-6,
+                        CE: float = 100e-6, CO: float = 10e-6, cycles: int = 20,
+                        samples_per_cycle: int = 100, IS: float = 1e-14, beta_r: float = 1.0,
+                        max_iter: int = 50, tol: float = 1e-9,
+                        progress: Optional[Callable[[int, int], None]] = None) -> TransientResult:
+    """Emissor comum completo excitado por vs = A·sin(2πft), um lote de amplitudes.
+
+    Nós: fonte após RS (A), base (B), emissor (E), coletor (C) e carga (O),
+    com Ci entre A e B, CE do emissor à terra e Co entre C e O. Os
+    capacitores usam o modelo companheiro trapezoidal e o transistor o
+    modelo de Ebers-Moll; cada passo de tempo é um Newton 5×5 resolvido
+    em lote para todas as amplitudes, partindo do ponto de operação DC
+    (capacitores carregados com as tensões de polarização).
+    `progress(passo, passos)` é chamada a cada passo de tempo.
+    """
+    if frequency <= 0 or min(RS, RC, RE, RL, R1, R2) <= 0:
+        raise ValueError("Frequência e resistores devem ser positivos")
+    if min(CI, CE, CO) <= 0 or int(cycles) < 1 or int(samples_per_cycle) < 8:
+        raise ValueError("Capacitâncias, ciclos ou amostras por ciclo inválidos")
+    amplitudes = np.atleast_1d(np.asarray(amplitudes, dtype=float))
+    K = amplitudes.size
+    steps = int(cycles) * int(samples_per_cycle)
+    h = 1 / (frequency * samples_per_cycle)
+    t = np.arange(steps + 1) * h
+
+    op = operating_point(VCC, RC, RE, R1, R2, beta, T, IS, beta_r)
+    if not op.converged:
+        raise ValueError("O ponto de operação DC não convergiu")
+    vt = float(thermal_voltage(T))
+    i_s = float(saturation_current(IS, T))
+    bf = float(beta_at(beta, T))
+    v_crit = vt * np.log(vt / (np.sqrt(2) * i_s))
+
+    # x = (VA, VB, VE, VC, VO); sem sinal, VA = VO = 0
+    x = np.tile([0.0, op.VB, op.VE, op.VC, 0.0], (K, 1))
+    g_i, g_e, g_o = 2 * CI / h, 2 * CE / h, 2 * CO / h
+    i_ci = np.zeros(K)
+    i_ce = np.zeros(K)
+    i_co = np.zeros(K)
+    vbe_lin = x[:, 1] - x[:, 2]
+    vbc_lin = x[:, 1] - x[:, 3]
+    converged = np.ones(K, dtype=bool)
+
+    vin = amplitudes[:, None] * np.sin(2 * np.pi * frequency * t)
+    out = np.empty((4, K, steps + 1))
+    out[:, :, 0] = np.array([0.0, op.VC, op.IC, op.VB])[:, None]
+
+    # Parte constante da jacobiana (resistores e capacitores)
+    J0 = np.zeros((5, 5))
+    J0[0, :2] = -1 / RS - g_i, g_i
+    J0[1, :2] = g_i, -g_i - 1 / R1 - 1 / R2
+    J0[2, 2] = -1 / RE - g_e
+    J0[3, 3:] = -1 / RC - g_o, g_o
+    J0[4, 3:] = g_o, -g_o - 1 / RL
+
+    for n in range(1, steps + 1):
+        # Fontes equivalentes dos capacitores: i = g·v + h_eq
+        h_ci = -g_i * (x[:, 0] - x[:, 1]) - i_ci
+        h_ce = -g_e * x[:, 2] - i_ce
+        h_co = -g_o * (x[:, 3] - x[:, 4]) - i_co
+        vs = vin[:, n]
+        for _ in range(max_iter):
+            VA, VB, VE, VC, VO = x.T
+            vbe, vbc = VB - VE, VB - VC
+            vbe_l, limited_be = _pnjlim(vbe, vbe_lin, vt, v_crit)
+            vbc_l, limited_bc = _pnjlim(vbc, vbc_lin, vt, v_crit)
+            vbe_lin, vbc_lin = vbe_l, vbc_l
+            IC, IB, dIC, dIB = _companion(vbe, vbc, vbe_l, vbc_l, vt, i_s, bf, beta_r)
+            gIC, gIB = _node_gradient(dIC), _node_gradient(dIB)
+
+            ci = g_i * (VA - VB) + h_ci
+            co = g_o * (VC - VO) + h_co
+            F = np.stack([(vs - VA) / RS - ci,
+                          ci + (VCC - VB) / R1 - VB / R2 - IB,
+                          IC + IB - VE / RE - (g_e * VE + h_ce),
+                          (VCC - VC) / RC - IC - co,
+                          co - VO / RL], axis=-1)
+            J = np.broadcast_to(J0, (K, 5, 5)).copy()
+            J[:, 1, 1:4] -= gIB
+            J[:, 2, 1:4] += gIC + gIB
+            J[:, 3, 1:4] -= gIC
+            dx = np.linalg.solve(J, -F[..., None])[..., 0]
+            x += dx
+            if (not (limited_be.any() or limited_bc.any())
+                    and np.max(np.abs(dx)) <= tol * (1 + abs(VCC))):
+                break
+        else:
+            converged &= np.max(np.abs(dx), axis=-1) <= tol * (1 + abs(VCC))
+
+        i_ci = g_i * (x[:, 0] - x[:, 1]) + h_ci
+        i_ce = g_e * x[:, 2] + h_ce
+        i_co = g_o * (x[:, 3] - x[:, 4]) + h_co
+        vbe, vbc = x[:, 1] - x[:, 2], x[:, 1] - x[:, 3]
+        IC, _, _, _ = _companion(vbe, vbc, vbe, vbc, vt, i_s, bf, beta_r)
+        out[:, :, n] = x[:, 4], x[:, 3], IC, x[:, 1]
+        if progress is not None:
+            progress(n, steps)
+
+    vout, vc, ic, vb = out
+    converged &= np.all(np.isfinite(out), axis=(0, 2))
+    return TransientResult(t, vin, vout, vc, ic, _region(ic, vb - vc, VCC, RC, RE), converged)
+
+
+def compression_sweep(amplitudes, frequency: float, *circuit, analysis_cycles: int = 2,
+                      **options) -> CompressionResult:
+    """Ganho da fundamental, THD e ceifamento em função da amplitude de entrada.
+
+    Todas as amplitudes são simuladas num único transitório em lote
+    (amplifier_transient, com os mesmos argumentos de circuito); a
+    análise usa os últimos `analysis_cycles` ciclos, já perto do regime.
+    O ganho de pequenos sinais é o da menor amplitude e o ponto de 1 dB
+    é interpolado em log da amplitude, como o ceifamento não tem como
+    ser: este é a primeira amplitude em que o transistor deixa a região
+    ativa em algum instante da janela.
+    """
+    amplitudes = np.sort(np.atleast_1d(np.asarray(amplitudes, dtype=float)))
+    if amplitudes[0] <= 0:
+        raise ValueError("As amplitudes devem ser positivas")
+    result = amplifier_transient(amplitudes, frequency, *circuit, **options)
+    samples = options.get("samples_per_cycle", 100)
+    cycles = options.get("cycles", 20)
+    m = min(int(analysis_cycles), cycles) * samples
+    window = result.vout[:, -m - 1:-1]
+
+    # Número inteiro de ciclos na janela: a fundamental cai no bin `ciclos`
+    fundamental = np.abs(np.fft.rfft(window, axis=-1)[:, m // samples]) * 2 / m
+    ac_power = np.var(window, axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        thd = np.sqrt(np.maximum(ac_power - fundamental ** 2 / 2, 0.0)) / (fundamental / np.sqrt(2))
+        gain_db = 20 * np.log10(fundamental / amplitudes)
+    clipped = np.any(result.region[:, -m - 1:-1] != ACTIVE, axis=-1)
+
+    small_signal_db = float(gain_db[0])
+    clip_amplitude = float(amplitudes[np.argmax(clipped)]) if clipped.any() else np.nan
+    below = gain_db < small_signal_db - 1
+    p1db_amplitude = np.nan
+    if below.any() and np.argmax(below) > 0:
+        k = int(np.argmax(below))
+        g0, g1 = gain_db[k - 1] - small_signal_db + 1, gain_db[k] - small_signal_db + 1
+        a0, a1 = np.log(amplitudes[k - 1]), np.log(amplitudes[k])
+        p1db_amplitude = float(np.exp(a0 + g0 / (g0 - g1) * (a1 - a0)))
+    return CompressionResult(amplitudes, fundamental, gain_db, thd, clipped, small_signal_db,
+                             clip_amplitude, p1db_amplitude, result)
@@ -0,0 +1,252 @@
+"""
+buck_sim.py
+-----------
+Simulação no tempo do conversor buck em malha fechada (controle PI em
+modo tensão), com partida suave e degrau de carga.
+
+O estado (iL, vC) é avançado intervalo a intervalo - chave ligada,
+chave desligada e, em DCM, indutor vazio - pela solução exata da EDO
+linear de cada topologia: x(h) = x_eq + e^(A·h)·(x0 - x_eq), com a
+exponencial 2x2 em forma fechada. Assim cada ciclo de chaveamento custa
+poucas operações escalares, independentemente de f, L ou C, e não há
+passo de integração a escolher.
+
+Quando a corrente do indutor zera durante o intervalo desligado, o
+instante exato é encontrado por falsa posição e o circuito passa à
+topologia DCM. Ao detectar regime periódico (estado no início do ciclo
+repetindo-se), a simulação salta até o próximo evento (fim da partida
+suave ou degrau de carga) replicando o último ciclo, e termina assim
+que o regime é atingido depois do último evento.
+"""
+
+import math
+from typing import Callable, List, NamedTuple, Optional
+
+import numpy as np
+
+
+class BuckSimParams(NamedTuple):
+    Vin: float = 12.0
+    Vref: float = 5.0          # tensão de saída desejada (V)
+    f: float = 50000.0         # frequência de chaveamento (Hz)
+    L: float = 0.0001
+    C: float = 0.00001
+    R: float = 10.0            # carga inicial (Ω)
+    R_step: float = 5.0        # carga após o degrau (Ω)
+    t_step: float = 0.02       # instante do degrau de carga (s)
+    t_soft: float = 0.005      # duração da rampa de referência (s)
+    Kp: float = 0.02           # ganho proporcional (1/V)
+    Ki: float = 200.0          # ganho integral (1/(V·s))
+    D_max: float = 0.95
+    cycles: int = 10000
+    rL: float = 0.0            # resistência série do indutor (Ω)
+
+
+class BuckSimResult(NamedTuple):
+    t: np.ndarray              # instantes dos eventos (início, desliga, iL=0)
+    iL: np.ndarray
+    vC: np.ndarray
+    cycle_t: np.ndarray        # início de cada ciclo
+    duty: np.ndarray           # ciclo de trabalho aplicado em cada ciclo
+    dcm: np.ndarray            # True se o ciclo terminou em DCM
+    cycles_simulated: int      # ciclos efetivamente integrados
+    cycles_skipped: int        # ciclos replicados em regime periódico
+    t_end: float               # fim da simulação (pode ser antes do previsto)
+
+
+class _Topology:
+    """Sistema linear dx/dt = A·x + b com e^(A·h) em forma fechada.
+
+    Com s = tr(A)/2 e M = A - s·I, vale M² = (s² - det A)·I, logo
+    e^(A·h) = e^(s·h)·[c(h)·I + g(h)·M], com c e g em cosh/sinh,
+    cos/sin ou 1/h conforme o sinal de s² - det A.
+    """
+
+    def __init__(self, a11: float, a12: float, a21: float, a22: float,
+                 b1: float, b2: float) -> None:
+        self.s = (a11 + a22) / 2
+        self.m11, self.m12 = a11 - self.s, a12
+        self.m21, self.m22 = a21, a22 - self.s
+        det = a11 * a22 - a12 * a21
+        disc = self.s * self.s - det
+        self.w = math.sqrt(abs(disc))
+        self.kind = 0 if disc == 0 else (1 if disc > 0 else -1)
+        # Ponto de equilíbrio: A·x_eq + b = 0
+        self.x1 = (-b1 * a22 + b2 * a12) / det
+        self.x2 = (-a11 * b2 + a21 * b1) / det
+
+    def advance(self, x1: float, x2: float, h: float):
+        """Estado após h segundos partindo de (x1, x2)."""
+        if self.kind > 0:
+            c, g = math.cosh(self.w * h), math.sinh(self.w * h) / self.w
+        elif self.kind < 0:
+            c, g = math.cos(self.w * h), math.sin(self.w * h) / self.w
+        else:
+            c, g = 1.0, h
+        e = math.exp(self.s * h)
+        d1, d2 = x1 - self.x1, x2 - self.x2
+        return (self.x1 + e * (c * d1 + g * (self.m11 * d1 + self.m12 * d2)),
+                self.x2 + e * (c * d2 + g * (self.m21 * d1 + self.m22 * d2)))
+
+
+def _zero_crossing(topology: _Topology, x1: float, x2: float, h: float) -> float:
+    """Instante em (0, h) em que x1 cruza zero (falsa posição de Illinois)."""
+    a, fa = 0.0, x1
+    b, fb = h, topology.advance(x1, x2, h)[0]
+    side = 0
+    for _ in range(60):
+        t = (a * fb - b * fa) / (fb - fa)
+        ft = topology.advance(x1, x2, t)[0]
+        if abs(ft) <= 1e-12 * max(abs(x1), 1e-12) or b - a <= 1e-15 * h:
+            return t
+        if ft * fb > 0:
+            b, fb = t, ft
+            if side == -1:
+                fa /= 2
+            side = -1
+        else:
+            a, fa = t, ft
+            if side == 1:
+                fb /= 2
+            side = 1
+    return t
+
+
+def simulate_buck(p: BuckSimParams = BuckSimParams(), tol: float = 1e-7,
+                  settle_cycles: int = 50,
+                  progress: Optional[Callable[[int, int], None]] = None) -> BuckSimResult:
+    """Simula `p.cycles` ciclos de chaveamento do buck em malha fechada.
+
+    O controlador amostra vC no início de cada ciclo e calcula o ciclo de
+    trabalho D = Kp·e + ∫Ki·e dt (com anti-windup por integração
+    condicional), sendo a referência uma rampa de 0 a Vref em t_soft.
+    `progress(ciclo, p.cycles)` é chamada a cada ciclo simulado.
+    """
+    if p.f <= 0 or p.L <= 0 or p.C <= 0 or p.R <= 0 or p.R_step <= 0:
+        raise ValueError("f, L, C e as cargas devem ser positivos")
+    T = 1.0 / p.f
+    events = sorted({e for e in (p.t_soft, p.t_step) if 0 < e < p.cycles * T})
+
+    def topologies(R):
+        # Estados: iL e vC; entradas: tensão no nó de chaveamento
+        on = _Topology(-p.rL / p.L, -1 / p.L, 1 / p.C, -1 / (R * p.C), p.Vin / p.L, 0.0)
+        off = _Topology(-p.rL / p.L, -1 / p.L, 1 / p.C, -1 / (R * p.C), 0.0, 0.0)
+        return on, off
+
+    on, off = topologies(p.R)
+    R_now = p.R
+    tolerance_i = tol * p.Vin / min(p.R, p.R_step)
+    tolerance_v = tol * p.Vin
+
+    t_list: List[float] = []
+    i_list: List[float] = []
+    v_list: List[float] = []
+    cycle_t: List[float] = []
+    duty: List[float] = []
+    dcm_flags: List[bool] = []
+    chunks = []  # blocos replicados: (t, iL, vC, cycle_t, duty, dcm)
+
+    iL = vC = integral = 0.0
+    t = 0.0
+    k = 0
+    simulated = skipped = 0
+    steady = 0
+    prev = None
+    while k < p.cycles:
+        t = k * T
+        if t >= p.t_step and R_now != p.R_step:
+            on, off = topologies(p.R_step)
+            R_now = p.R_step
+            steady = 0
+
+        ref = p.Vref * min(1.0, t / p.t_soft) if p.t_soft > 0 else p.Vref
+        error = ref - vC
+        D = p.Kp * error + integral
+        if 0.0 < D < p.D_max or (D >= p.D_max and error < 0) or (D <= 0 and error > 0):
+            integral += p.Ki * error * T
+        D = min(max(D, 0.0), p.D_max)
+
+        start = len(t_list)
+        t_list.append(t)
+        i_list.append(iL)
+        v_list.append(vC)
+        t_on = D * T
+        if t_on > 0:
+            iL, vC = on.advance(iL, vC, t_on)
+            t_list.append(t + t_on)
+            i_list.append(iL)
+            v_list.append(vC)
+        t_off = T - t_on
+        in_dcm = False
+        if t_off > 0:
+            i_end, v_end = off.advance(iL, vC, t_off)
+            if i_end < 0:
+                # Diodo bloqueia: iL fica em zero e C descarrega só pela carga
+                tz = _zero_crossing(off, iL, vC, t_off)
+                _, vC = off.advance(iL, vC, tz)
+                t_list.append(t + t_on + tz)
+                i_list.append(0.0)
+                v_list.append(vC)
+                iL, vC = 0.0, vC * math.exp(-(t_off - tz) / (R_now * p.C))
+                in_dcm = True
+            else:
+                iL, vC = i_end, v_end
+        cycle_t.append(t)
+        duty.append(D)
+        dcm_flags.append(in_dcm)
+        simulated += 1
+        k += 1
+        if progress is not None:
+            progress(k, p.cycles)
+
+        state = (iL, vC, D)
+        if prev is not None and abs(iL - prev[0]) <= tolerance_i \
+                and abs(vC - prev[1]) <= tolerance_v and abs(D - prev[2]) <= tol:
+            steady += 1
+        else:
+            steady = 0
+        prev = state
+        if steady < settle_cycles or t < (p.t_soft if p.t_soft > 0 else 0):
+            continue
+
+        # Regime periódico: salta até o próximo evento ou encerra
+        upcoming = [e for e in events if e > k * T]
+        if not upcoming:
+            break
+        target = min(p.cycles, int(math.ceil(upcoming[0] / T - 1e-9)))
+        n_skip = target - k
+        if n_skip <= 0:
+            continue
+        pattern_t = np.array(t_list[start:]) - t
+        offsets = (np.arange(n_skip) + k) * T
+        chunks.append((len(t_list), len(cycle_t), (
+            (offsets[:, None] + pattern_t).ravel(),
+            np.tile(i_list[start:], n_skip),
+            np.tile(v_list[start:], n_skip),
+            offsets,
+            np.full(n_skip, D),
+            np.full(n_skip, in_dcm),
+        )))
+        skipped += n_skip
+        k = target
+        steady = 0
+
+    t_end = k * T
+    t_list.append(t_end)
+    i_list.append(iL)
+    v_list.append(vC)
+
+    arrays = [np.array(t_list), np.array(i_list), np.array(v_list),
+              np.array(cycle_t), np.array(duty), np.array(dcm_flags, dtype=bool)]
+    if chunks:
+        # Insere os blocos replicados nas posições em que foram gerados
+        event_index = [c[0] for c in chunks]
+        cycle_index = [c[1] for c in chunks]
+        for n, index in enumerate((event_index, event_index, event_index,
+                                   cycle_index, cycle_index, cycle_index)):
+            parts = np.split(arrays[n], index)
+            pieces = [parts[0]]
+            for (_, _, block), part in zip(chunks, parts[1:]):
+                pieces.extend((block[n], part))
+            arrays[n] = np.concatenate(pieces)
+    return BuckSimResult(*arrays, simulated, skipped, t_end)
@@ -0,0 +1,604 @@
+"""
+circuit_solvers.py
+------------------
+Núcleo de cálculo (sem interface gráfica) do Visual Spreadsheets.
+
+Cada função recebe escalares ou arrays NumPy (com broadcasting entre
+todas as entradas) e devolve uma tupla nomeada com os resultados, de
+modo que a mesma fórmula serve tanto para a tela Tk quanto para
+avaliar milhões de pontos de projeto de uma só vez.
+
+Divisões por zero não levantam exceção: o resultado correspondente
+fica inf/nan, e cabe a quem chama validar os valores.
+"""
+
+from typing import Callable, Dict, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+import bjt
+import e_series
+import rlc_transient
+import three_phase
+
+
+def _as_float(*values):
+    """Converte as entradas para arrays float64 (sem copiar se possível)."""
+    return [np.asarray(v, dtype=float) for v in values]
+
+
+# ==================== LEI DE OHM ====================
+
+class OhmsLawResult(NamedTuple):
+    I: np.ndarray
+    P: np.ndarray
+
+
+def ohms_law(V, R) -> OhmsLawResult:
+    """I = V/R e P = V×I."""
+    V, R = _as_float(V, R)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        I = V / R
+        P = V * I
+    return OhmsLawResult(I, P)
+
+
+# ==================== DIVISOR DE TENSÃO ====================
+
+class VoltageDividerResult(NamedTuple):
+    Vout: np.ndarray
+    ratio: np.ndarray
+
+
+def voltage_divider(Vin, R1, R2) -> VoltageDividerResult:
+    """Vout = Vin × R2/(R1+R2); razão = Vout/Vin (0 quando Vin = 0)."""
+    Vin, R1, R2 = _as_float(Vin, R1, R2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        Vout = Vin * R2 / (R1 + R2)
+        ratio = np.where(Vin != 0, Vout / Vin, 0.0)[()]
+    return VoltageDividerResult(Vout, ratio)
+
+
+# ==================== CIRCUITO RC ====================
+
+class RCCircuitResult(NamedTuple):
+    tau: np.ndarray
+    fc: np.ndarray
+    t5tau: np.ndarray
+
+
+def rc_circuit(R, C) -> RCCircuitResult:
+    """Constante de tempo, frequência de corte e tempo de 5τ."""
+    R, C = _as_float(R, C)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        tau = R * C
+        fc = 1 / (2 * np.pi * R * C)
+        t5tau = 5 * tau
+    return RCCircuitResult(tau, fc, t5tau)
+
+
+# ==================== TIMER 555 ASTÁVEL ====================
+
+class Astable555Result(NamedTuple):
+    T_high: np.ndarray
+    T_low: np.ndarray
+    T_total: np.ndarray
+    frequency: np.ndarray
+    duty_cycle: np.ndarray  # em %
+
+
+def astable_555(R1, R2, C, VCC=12.0) -> Astable555Result:
+    """Tempos, frequência e ciclo de trabalho do 555 astável.
+
+    VCC não altera a temporização; é aceito para manter a mesma
+    assinatura da tela.
+    """
+    R1, R2, C = _as_float(R1, R2, C)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        T_high = 0.693 * (R1 + R2) * C
+        T_low = 0.693 * R2 * C
+        T_total = T_high + T_low
+        frequency = 1 / T_total
+        duty_cycle = (T_high / T_total) * 100
+    return Astable555Result(T_high, T_low, T_total, frequency, duty_cycle)
+
+
+class Astable555Design(NamedTuple):
+    R1: np.ndarray
+    R2: np.ndarray
+    C: np.ndarray
+    frequency: np.ndarray
+    duty_cycle: np.ndarray  # em %
+    frequency_error: np.ndarray  # relativo
+    duty_error: np.ndarray  # relativo
+
+
+def astable_555_inverse(frequency: float, duty_cycle: float, tolerance: float = 0.05,
+                        r_series: str = "E24", c_series: str = "E12",
+                        r_range=(1e3, 1e6), c_range=(100e-12, 1e-3),
+                        top: int = 20, neighbors: int = 2) -> Astable555Design:
+    """Combinações padronizadas R1/R2/C para f e D alvo (D em %, > 50%).
+
+    Para cada C da tabela, R2 e R1 ideais saem em forma fechada
+    (TL = 0.693·R2·C, TH = 0.693·(R1+R2)·C); os capacitores cujos
+    resistores ideais caem fora da faixa são descartados e, para os
+    demais, só os `neighbors` vizinhos de cada lado do R2 ideal e do R1
+    que corrige a frequência são avaliados. O resultado vem ordenado
+    pelo maior dos dois erros relativos e limitado à banda `tolerance`.
+    """
+    D = duty_cycle / 100
+    if not (0.5 < D < 1):
+        raise ValueError("O 555 astável básico exige ciclo de trabalho entre 50% e 100%")
+    if frequency <= 0:
+        raise ValueError("A frequência deve ser positiva")
+    T = 1 / frequency
+    resistors = e_series.table(r_series, *r_range)
+    C = e_series.table(c_series, *c_range)
+
+    # Poda: R1 e R2 ideais precisam caber na faixa de resistores
+    R2_ideal = (1 - D) * T / (0.693 * C)
+    R1_ideal = (2 * D - 1) * T / (0.693 * C)
+    slack = 1 + tolerance
+    keep = ((R2_ideal * slack >= resistors[0]) & (R2_ideal <= resistors[-1] * slack) &
+            (R1_ideal * slack >= resistors[0]) & (R1_ideal <= resistors[-1] * slack))
+    C, R2_ideal = C[keep], R2_ideal[keep]
+    if C.size == 0:
+        empty = np.empty(0)
+        return Astable555Design(*(empty,) * 7)
+
+    offsets = np.arange(-neighbors, neighbors)
+
+    # (nC, k) candidatos de R2 em torno do ideal
+    idx = np.searchsorted(resistors, R2_ideal)[:, np.newaxis] + offsets
+    R2 = resistors[np.clip(idx, 0, resistors.size - 1)]
+    C = np.broadcast_to(C[:, np.newaxis], R2.shape)
+
+    # (nC, k, k) candidatos de R1 que corrigem a frequência para cada R2
+    R1_fix = T / (0.693 * C) - 2 * R2
+    idx = np.searchsorted(resistors, R1_fix)[..., np.newaxis] + offsets
+    R1 = resistors[np.clip(idx, 0, resistors.size - 1)]
+    R2 = np.broadcast_to(R2[..., np.newaxis], R1.shape).ravel()
+    C = np.broadcast_to(C[..., np.newaxis], R1.shape).ravel()
+    R1 = R1.ravel()
+
+    result = astable_555(R1, R2, C)
+    f_err = result.frequency / frequency - 1
+    d_err = result.duty_cycle / duty_cycle - 1
+    score = np.maximum(np.abs(f_err), np.abs(d_err))
+
+    ok = score <= tolerance
+    candidates = np.stack([R1, R2, C])[:, ok]
+    _, unique = np.unique(candidates, axis=1, return_index=True)
+    order = unique[np.argsort(score[ok][unique], kind="stable")][:top]
+    pick = np.flatnonzero(ok)[order]
+    return Astable555Design(R1[pick], R2[pick], C[pick], result.frequency[pick],
+                            result.duty_cycle[pick], f_err[pick], d_err[pick])
+
+
+# ==================== CONVERSOR BUCK ====================
+
+class BuckConverterResult(NamedTuple):
+    Vout: np.ndarray
+    Iout: np.ndarray
+    delta_IL: np.ndarray
+    delta_VC: np.ndarray
+    D2: np.ndarray      # fração do período com o diodo conduzindo
+    dcm: np.ndarray     # True em modo de condução descontínua
+
+
+def buck_converter(Vin, D, f, L, C, R) -> BuckConverterResult:
+    """Tensões, correntes e ondulações do buck ideal em regime (CCM ou DCM).
+
+    O modo descontínuo ocorre quando K = 2L·f/R < 1 - D; nele a corrente
+    do indutor parte de zero a cada ciclo e Vout passa a depender da carga.
+    """
+    Vin, D, f, L, C, R = _as_float(Vin, D, f, L, C, R)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        K = 2 * L * f / R
+        dcm = K < 1 - D
+        Vout = np.where(dcm, Vin * 2 / (1 + np.sqrt(1 + 4 * K / D**2)), D * Vin)
+        Iout = Vout / R
+        delta_IL = (Vin - Vout) * D / (L * f)
+        D2 = np.where(dcm, np.where(Vout > 0, D * (Vin - Vout) / Vout, 0.0), 1 - D)
+        # Carga acima de Iout no triângulo de corrente (base (D+D2)T, pico ΔIL)
+        charge = np.where(delta_IL > 0, (D + D2) / (2 * f) * (delta_IL - Iout)**2 / delta_IL, 0.0)
+        delta_VC = np.where(dcm, charge / C, delta_IL / (8 * f * C))
+    return BuckConverterResult(Vout[()], Iout, delta_IL, delta_VC[()], D2[()], dcm[()])
+
+
+# ==================== RESPOSTA RL ====================
+
+class RLResponseResult(NamedTuple):
+    tau: np.ndarray
+    I_final: np.ndarray
+    t5tau: np.ndarray
+
+
+def rl_response(V, R, L) -> RLResponseResult:
+    """Constante de tempo e corrente final do RL ao degrau."""
+    V, R, L = _as_float(V, R, L)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        tau = L / R
+        I_final = V / R
+        t5tau = 5 * tau
+    return RLResponseResult(tau, I_final, t5tau)
+
+
+def rl_current(t, V, R, L):
+    """Corrente i(t) = V/R × (1 - e^(-t/τ)) para o RL ao degrau."""
+    t, V, R, L = _as_float(t, V, R, L)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return V / R * (1 - np.exp(-t * R / L))
+
+
+# ==================== PWM ====================
+
+class PWMResult(NamedTuple):
+    T: np.ndarray
+    Ton: np.ndarray
+    Toff: np.ndarray
+    Vavg: np.ndarray
+
+
+def pwm_analysis(Vhigh, Vlow, D, f) -> PWMResult:
+    """Período, tempos ligado/desligado e tensão média (D de 0 a 1)."""
+    Vhigh, Vlow, D, f = _as_float(Vhigh, Vlow, D, f)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        T = 1 / f
+        Ton = D * T
+        Toff = (1 - D) * T
+        Vavg = D * Vhigh + (1 - D) * Vlow
+    return PWMResult(T, Ton, Toff, Vavg)
+
+
+# ==================== EMISSOR COMUM ====================
+
+class CommonEmitterResult(NamedTuple):
+    VB: np.ndarray
+    VE: np.ndarray
+    IE: np.ndarray
+    IC: np.ndarray
+    IB: np.ndarray
+    VC: np.ndarray
+    VCE: np.ndarray
+    re: np.ndarray
+    Av: np.ndarray
+    Zi: np.ndarray
+    IC_sat: np.ndarray
+
+
+def common_emitter(VCC, RC, RE, R1, R2, beta, VBE=0.7) -> CommonEmitterResult:
+    """Ponto de operação DC e ganho AC aproximados (IC ≈ IE)."""
+    VCC, RC, RE, R1, R2, beta, VBE = _as_float(VCC, RC, RE, R1, R2, beta, VBE)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        VB = (R2 / (R1 + R2)) * VCC
+        VE = VB - VBE
+        IE = VE / RE
+        IC = IE
+        IB = IC / beta
+        VC = VCC - IC * RC
+        VCE = VC - VE
+        # Resistência intrínseca do emissor (26mV/IE); sem condução, re = inf
+        re = np.where(IE > 0, 0.026 / np.where(IE > 0, IE, 1.0), np.inf)
+        Av = -RC / re  # Negativo indica inversão de fase
+        Zi = (R1 * R2) / (R1 + R2)  # Aproximação simples
+        IC_sat = VCC / (RC + RE)
+    return CommonEmitterResult(VB, VE, IE, IC, IB, VC, VCE, re, Av, Zi, IC_sat)
+
+
+class CommonEmitterEMResult(NamedTuple):
+    VB: np.ndarray
+    VE: np.ndarray
+    IE: np.ndarray
+    IC: np.ndarray
+    IB: np.ndarray
+    VC: np.ndarray
+    VCE: np.ndarray
+    VBE: np.ndarray
+    re: np.ndarray
+    Av: np.ndarray
+    Zi: np.ndarray
+    region: np.ndarray
+    converged: np.ndarray
+
+
+def common_emitter_em(VCC, RC, RE, R1, R2, beta, T=bjt.T_NOMINAL) -> CommonEmitterEMResult:
+    """Ponto de operação DC pelo modelo de Ebers-Moll (ver bjt.py).
+
+    A base é o equivalente de Thévenin do divisor, com a corrente de base
+    carregando-o; VBE, β e IS variam com a temperatura T (°C).
+    """
+    VCC, RC, RE, R1, R2, beta, T = _as_float(VCC, RC, RE, R1, R2, beta, T)
+    op = bjt.operating_point(VCC, RC, RE, R1, R2, beta, T)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        Av = -RC / op.re  # Emissor desacoplado em AC
+        RTH = (R1 * R2) / (R1 + R2)
+        r_in = (bjt.beta_at(beta, T) + 1) * op.re
+        Zi = RTH * r_in / (RTH + r_in)
+    Zi = np.where(np.isinf(op.re), RTH, Zi)
+    return CommonEmitterEMResult(op.VB, op.VE, op.IE, op.IC, op.IB, op.VC, op.VCE, op.VBE,
+                                 op.re, Av, Zi[()], op.region, op.converged)
+
+
+# ==================== RLC ====================
+
+def rlc_series(R, L, C) -> rlc_transient.RLCMetrics:
+    """ζ, ω0, sobressinal e tempo de acomodação do RLC série ao degrau."""
+    return rlc_transient.metrics(*rlc_transient.series_coefficients(R, L, C))
+
+
+def rlc_parallel(R, L, C) -> rlc_transient.RLCMetrics:
+    """ζ, ω0, sobressinal e tempo de acomodação do RLC paralelo ao degrau."""
+    return rlc_transient.metrics(*rlc_transient.parallel_coefficients(R, L, C))
+
+
+# ==================== SISTEMA TRIFÁSICO ====================
+
+class ThreePhaseLoadResult(NamedTuple):
+    Ia: np.ndarray
+    Ib: np.ndarray
+    Ic: np.ndarray
+    In: np.ndarray
+    P: np.ndarray
+    Q: np.ndarray
+    S: np.ndarray
+    pf: np.ndarray
+    unbalance: np.ndarray
+
+
+def _three_phase_load(connection, VL, Pa, Qa, Pb, Qb, Pc, Qc, neutral=True) -> ThreePhaseLoadResult:
+    P = np.stack(np.broadcast_arrays(*_as_float(Pa, Pb, Pc)), axis=-1)
+    Q = np.stack(np.broadcast_arrays(*_as_float(Qa, Qb, Qc)), axis=-1)
+    r = three_phase.profile(connection, VL, P, Q, neutral)
+    I = np.abs(r.I_line)
+    return ThreePhaseLoadResult(I[..., 0][()], I[..., 1][()], I[..., 2][()], np.abs(r.I_neutral),
+                                r.P_total, r.Q_total, r.apparent_total, r.power_factor,
+                                100 * r.unbalance)
+
+
+def three_phase_wye(VL, Pa, Qa, Pb, Qb, Pc, Qc) -> ThreePhaseLoadResult:
+    """Correntes, potências totais e desequilíbrio de cargas P + jQ em estrela com neutro."""
+    return _three_phase_load("estrela", VL, Pa, Qa, Pb, Qb, Pc, Qc)
+
+
+def three_phase_delta(VL, Pa, Qa, Pb, Qb, Pc, Qc) -> ThreePhaseLoadResult:
+    """O mesmo para cargas em triângulo (a, b, c = ramos ab, bc, ca); In = 0."""
+    return _three_phase_load("triângulo", VL, Pa, Qa, Pb, Qb, Pc, Qc)
+
+
+# ==================== REGISTRO DE CIRCUITOS ====================
+
+class InputSpec(NamedTuple):
+    name: str
+    label: str
+    default: float
+    low: float
+    high: float
+    log: bool = True
+
+
+class OutputSpec(NamedTuple):
+    name: str
+    label: str
+
+
+class CircuitSpec(NamedTuple):
+    title: str
+    solver: Callable
+    inputs: Tuple[InputSpec, ...]
+    outputs: Tuple[OutputSpec, ...]
+
+    def input(self, name: str) -> InputSpec:
+        """Especificação da entrada com o nome dado."""
+        for spec in self.inputs:
+            if spec.name == name:
+                return spec
+        raise KeyError(name)
+
+    def output(self, name: str) -> OutputSpec:
+        """Especificação da saída com o nome dado."""
+        for spec in self.outputs:
+            if spec.name == name:
+                return spec
+        raise KeyError(name)
+
+
+# Entradas com os mesmos valores padrão das telas (em unidades do solver)
+CIRCUITS = {
+    "ohms_law": CircuitSpec(
+        "Lei de Ohm", ohms_law,
+        (InputSpec("V", "Tensão V (V)", 12.0, 0.0, 24.0, log=False),
+         InputSpec("R", "Resistência R (Ω)", 1000.0, 10.0, 1e6)),
+        (OutputSpec("I", "Corrente I (A)"),
+         OutputSpec("P", "Potência P (W)")),
+    ),
+    "voltage_divider": CircuitSpec(
+        "Divisor de Tensão", voltage_divider,
+        (InputSpec("Vin", "Tensão Entrada Vin (V)", 12.0, 0.0, 24.0, log=False),
+         InputSpec("R1", "Resistor R1 (Ω)", 10000.0, 100.0, 1e6),
+         InputSpec("R2", "Resistor R2 (Ω)", 10000.0, 100.0, 1e6)),
+        (OutputSpec("Vout", "Vout (V)"),
+         OutputSpec("ratio", "Razão Vout/Vin")),
+    ),
+    "rc_circuit": CircuitSpec(
+        "Circuito RC", rc_circuit,
+        (InputSpec("R", "Resistência R (Ω)", 10000.0, 10.0, 1e6),
+         InputSpec("C", "Capacitância C (F)", 0.0001, 1e-9, 1e-3)),
+        (OutputSpec("tau", "Constante de Tempo τ (s)"),
+         OutputSpec("fc", "Frequência de Corte fc (Hz)"),
+         OutputSpec("t5tau", "Tempo de Estabilização 5τ (s)")),
+    ),
+    "astable_555": CircuitSpec(
+        "Timer 555 Astável", astable_555,
+        (InputSpec("R1", "R1 (Ω)", 75000.0, 1e3, 1e6),
+         InputSpec("R2", "R2 (Ω)", 30000.0, 1e3, 1e6),
+         InputSpec("C", "C (F)", 0.000000047, 1e-9, 1e-5),
+         InputSpec("VCC", "VCC (V)", 12.0, 4.5, 16.0, log=False)),
+        (OutputSpec("frequency", "Frequência f (Hz)"),
+         OutputSpec("duty_cycle", "Ciclo de Trabalho D (%)"),
+         OutputSpec("T_high", "Tempo Alto TH (s)"),
+         OutputSpec("T_low", "Tempo Baixo TL (s)"),
+         OutputSpec("T_total", "Período T (s)")),
+    ),
+    "buck_converter": CircuitSpec(
+        "Conversor Buck", buck_converter,
+        (InputSpec("Vin", "Tensão Entrada Vin (V)", 12.0, 5.0, 48.0, log=False),
+         InputSpec("D", "Ciclo de Trabalho D (0-1)", 0.5, 0.05, 0.95, log=False),
+         InputSpec("f", "Freq. Chaveamento f (Hz)", 50000.0, 1e4, 1e6),
+         InputSpec("L", "Indutância L (H)", 0.0001, 1e-6, 1e-3),
+         InputSpec("C", "Capacitância C (F)", 0.00001, 1e-6, 1e-3),
+         InputSpec("R", "Resistência Carga R (Ω)", 10.0, 1.0, 100.0)),
+        (OutputSpec("Vout", "Tensão Saída Vout (V)"),
+         OutputSpec("Iout", "Corrente Saída Iout (A)"),
+         OutputSpec("delta_IL", "Ondulação Indutor ΔIL (A pp)"),
+         OutputSpec("delta_VC", "Ondulação Capacitor ΔVC (V pp)")),
+    ),
+    "rl_response": CircuitSpec(
+        "Resposta RL", rl_response,
+        (InputSpec("V", "Tensão Fonte V (V)", 10.0, 0.0, 24.0, log=False),
+         InputSpec("R", "Resistência R (Ω)", 100.0, 1.0, 1e4),
+         InputSpec("L", "Indutância L (H)", 0.5, 1e-3, 10.0)),
+        (OutputSpec("tau", "Constante de Tempo τ (s)"),
+         OutputSpec("I_final", "Corrente Final I(∞) (A)"),
+         OutputSpec("t5tau", "Tempo Estabilização 5τ (s)")),
+    ),
+    "pwm_analysis": CircuitSpec(
+        "Análise PWM", pwm_analysis,
+        (InputSpec("Vhigh", "Nível Alto Vhigh (V)", 5.0, 0.0, 24.0, log=False),
+         InputSpec("Vlow", "Nível Baixo Vlow (V)", 0.0, -5.0, 5.0, log=False),
+         InputSpec("D", "Ciclo Trabalho D (0-1)", 0.5, 0.0, 1.0, log=False),
+         InputSpec("f", "Frequência f (Hz)", 1000.0, 10.0, 1e6)),
+        (OutputSpec("Vavg", "Tensão Média Vavg (V)"),
+         OutputSpec("T", "Período T (s)"),
+         OutputSpec("Ton", "Tempo Ligado Ton (s)"),
+         OutputSpec("Toff", "Tempo Desligado Toff (s)")),
+    ),
+    "rlc_series": CircuitSpec(
+        "RLC Série", rlc_series,
+        (InputSpec("R", "Resistência R (Ω)", 10.0, 0.1, 1e4),
+         InputSpec("L", "Indutância L (H)", 0.01, 1e-6, 1.0),
+         InputSpec("C", "Capacitância C (F)", 0.00001, 1e-9, 1e-3)),
+        (OutputSpec("zeta", "Fator de Amortecimento ζ"),
+         OutputSpec("omega0", "Frequência Natural ω0 (rad/s)"),
+         OutputSpec("overshoot", "Sobressinal (%)"),
+         OutputSpec("settling_time", "Tempo de Acomodação 2% (s)"),
+         OutputSpec("omega_d", "Frequência Amortecida ωd (rad/s)")),
+    ),
+    "rlc_parallel": CircuitSpec(
+        "RLC Paralelo", rlc_parallel,
+        (InputSpec("R", "Resistência R (Ω)", 100.0, 0.1, 1e5),
+         InputSpec("L", "Indutância L (H)", 0.01, 1e-6, 1.0),
+         InputSpec("C", "Capacitância C (F)", 0.00001, 1e-9, 1e-3)),
+        (OutputSpec("zeta", "Fator de Amortecimento ζ"),
+         OutputSpec("omega0", "Frequência Natural ω0 (rad/s)"),
+         OutputSpec("overshoot", "Sobressinal (%)"),
+         OutputSpec("settling_time", "Tempo de Acomodação 2% (s)"),
+         OutputSpec("omega_d", "Frequência Amortecida ωd (rad/s)")),
+    ),
+    "common_emitter": CircuitSpec(
+        "Emissor Comum", common_emitter,
+        (InputSpec("VCC", "VCC (V)", 12.0, 5.0, 24.0, log=False),
+         InputSpec("RC", "RC - Coletor (Ω)", 2200.0, 100.0, 1e5),
+         InputSpec("RE", "RE - Emissor (Ω)", 1000.0, 10.0, 1e4),
+         InputSpec("R1", "R1 - Base sup. (Ω)", 47000.0, 1e3, 1e6),
+         InputSpec("R2", "R2 - Base inf. (Ω)", 10000.0, 1e3, 1e6),
+         InputSpec("beta", "β (hFE)", 100.0, 20.0, 500.0),
+         InputSpec("VBE", "VBE (V)", 0.7, 0.5, 0.8, log=False)),
+        (OutputSpec("VCE", "VCE (V)"),
+         OutputSpec("IC", "Corrente Coletor IC (A)"),
+         OutputSpec("VB", "Tensão Base VB (V)"),
+         OutputSpec("VE", "Tensão Emissor VE (V)"),
+         OutputSpec("VC", "Tensão Coletor VC (V)"),
+         OutputSpec("IB", "Corrente Base IB (A)"),
+         OutputSpec("Av", "Ganho de Tensão Av"),
+         OutputSpec("Zi", "Impedância Entrada Zi (Ω)")),
+    ),
+    "common_emitter_em": CircuitSpec(
+        "Emissor Comum (Ebers-Moll)", common_emitter_em,
+        (InputSpec("VCC", "VCC (V)", 12.0, 5.0, 24.0, log=False),
+         InputSpec("RC", "RC - Coletor (Ω)", 2200.0, 100.0, 1e5),
+         InputSpec("RE", "RE - Emissor (Ω)", 1000.0, 10.0, 1e4),
+         InputSpec("R1", "R1 - Base sup. (Ω)", 47000.0, 1e3, 1e6),
+         InputSpec("R2", "R2 - Base inf. (Ω)", 10000.0, 1e3, 1e6),
+         InputSpec("beta", "β (hFE)", 100.0, 20.0, 500.0),
+         InputSpec("T", "Temperatura (°C)", 25.0, -55.0, 150.0, log=False)),
+        (OutputSpec("VCE", "VCE (V)"),
+         OutputSpec("IC", "Corrente Coletor IC (A)"),
+         OutputSpec("VBE", "Tensão Base-Emissor VBE (V)"),
+         OutputSpec("VB", "Tensão Base VB (V)"),
+         OutputSpec("VE", "Tensão Emissor VE (V)"),
+         OutputSpec("VC", "Tensão Coletor VC (V)"),
+         OutputSpec("IB", "Corrente Base IB (A)"),
+         OutputSpec("Av", "Ganho de Tensão Av"),
+         OutputSpec("Zi", "Impedância Entrada Zi (Ω)")),
+    ),
+    "three_phase_wye": CircuitSpec(
+        "Sistema Trifásico - Estrela", three_phase_wye,
+        (InputSpec("VL", "Tensão de Linha VL (V)", 380.0, 100.0, 34500.0),
+         InputSpec("Pa", "P Fase a (W)", 5000.0, 0.0, 20000.0, log=False),
+         InputSpec("Qa", "Q Fase a (var)", 2000.0, -10000.0, 10000.0, log=False),
+         InputSpec("Pb", "P Fase b (W)", 3000.0, 0.0, 20000.0, log=False),
+         InputSpec("Qb", "Q Fase b (var)", 1000.0, -10000.0, 10000.0, log=False),
+         InputSpec("Pc", "P Fase c (W)", 4000.0, 0.0, 20000.0, log=False),
+         InputSpec("Qc", "Q Fase c (var)", 1500.0, -10000.0, 10000.0, log=False)),
+        (OutputSpec("Ia", "Corrente de Linha Ia (A)"),
+         OutputSpec("Ib", "Corrente de Linha Ib (A)"),
+         OutputSpec("Ic", "Corrente de Linha Ic (A)"),
+         OutputSpec("In", "Corrente de Neutro In (A)"),
+         OutputSpec("P", "Potência Ativa Total P (W)"),
+         OutputSpec("Q", "Potência Reativa Total Q (var)"),
+         OutputSpec("S", "Potência Aparente Total S (VA)"),
+         OutputSpec("pf", "Fator de Potência"),
+         OutputSpec("unbalance", "Desequilíbrio de Corrente I2/I1 (%)")),
+    ),
+    "three_phase_delta": CircuitSpec(
+        "Sistema Trifásico - Triângulo", three_phase_delta,
+        (InputSpec("VL", "Tensão de Linha VL (V)", 380.0, 100.0, 34500.0),
+         InputSpec("Pa", "P Ramo ab (W)", 5000.0, 0.0, 20000.0, log=False),
+         InputSpec("Qa", "Q Ramo ab (var)", 2000.0, -10000.0, 10000.0, log=False),
+         InputSpec("Pb", "P Ramo bc (W)", 3000.0, 0.0, 20000.0, log=False),
+         InputSpec("Qb", "Q Ramo bc (var)", 1000.0, -10000.0, 10000.0, log=False),
+         InputSpec("Pc", "P Ramo ca (W)", 4000.0, 0.0, 20000.0, log=False),
+         InputSpec("Qc", "Q Ramo ca (var)", 1500.0, -10000.0, 10000.0, log=False)),
+        (OutputSpec("Ia", "Corrente de Linha Ia (A)"),
+         OutputSpec("Ib", "Corrente de Linha Ib (A)"),
+         OutputSpec("Ic", "Corrente de Linha Ic (A)"),
+         OutputSpec("P", "Potência Ativa Total P (W)"),
+         OutputSpec("Q", "Potência Reativa Total Q (var)"),
+         OutputSpec("S", "Potência Aparente Total S (VA)"),
+         OutputSpec("pf", "Fator de Potência"),
+         OutputSpec("unbalance", "Desequilíbrio de Corrente I2/I1 (%)")),
+    ),
+}
+
+
+def evaluate(circuit: str, values: Dict[str, object]):
+    """Avalia o circuito registrado; entradas ausentes usam o valor padrão."""
+    spec = CIRCUITS[circuit]
+    kwargs = {s.name: values.get(s.name, s.default) for s in spec.inputs}
+    return spec.solver(**kwargs)
+
+
+def axis_values(low: float, high: float, n: int, log: bool = False) -> np.ndarray:
+    """Valores igualmente espaçados (linear ou logarítmico) de low a high."""
+    if log:
+        return np.geomspace(low, high, n)
+    return np.linspace(low, high, n)
+
+
+def sweep_2d(circuit: str, x_name: str, x_values, y_name: str, y_values,
+             output: str, fixed: Optional[Dict[str, float]] = None) -> np.ndarray:
+    """Avalia uma saída sobre a grade (y, x) numa única passada vetorizada.
+
+    O resultado tem forma (len(y_values), len(x_values)), pronto para
+    imshow/contourf, mesmo quando a saída não depende de um dos eixos.
+    """
+    if x_name == y_name:
+        raise ValueError("Os eixos X e Y devem ser entradas diferentes")
+    x_values = np.asarray(x_values, dtype=float)
+    y_values = np.asarray(y_values, dtype=float)
+    values = dict(fixed or {})
+    values[x_name] = x_values[np.newaxis, :]
+    values[y_name] = y_values[:, np.newaxis]
+    result = getattr(evaluate(circuit, values), output)
+    return np.broadcast_to(result, (y_values.size, x_values.size))
@@ -0,0 +1,286 @@
+"""
+compute_executor.py
+-------------------
+Cálculos pesados fora da thread do Tk.
+
+Varreduras grandes, transitórios longos e Monte Carlo rodam num de dois
+pools, escolhido por quem submete:
+
+* "thread"  - ThreadPoolExecutor, para trabalho em arrays NumPy grandes
+  (as operações soltam o GIL, então a interface continua respondendo);
+* "process" - ProcessPoolExecutor (início "spawn", criado na primeira
+  tarefa), para laços Python que prenderiam o GIL: passo a passo de
+  transitórios, ciclo a ciclo de conversores.
+
+A função recebe o argumento nomeado `progress`, um chamável
+progress(feito, total) que publica o andamento e levanta Cancelled se a
+tarefa foi cancelada. Cada tarefa tem uma chave (ex.: o botão que a
+disparou); submeter outra com a mesma chave cancela a anterior, e o
+resultado de uma tarefa que não é mais a última da sua chave é
+descartado. Resultados, erros e progresso voltam para a interface só
+pela thread do Tk, num laço root.after que roda enquanto houver tarefas.
+"""
+
+import concurrent.futures
+import os
+import queue
+import time
+from typing import Callable, Dict, Hashable, List, Optional
+
+import tracing
+
+POOLS = ("thread", "process")
+POLL_MS = 50
+PROGRESS_SLOTS = 64
+
+
+class Cancelled(Exception):
+    """A tarefa foi cancelada ou substituída por uma mais nova da mesma chave."""
+
+
+# ==================== PROGRESSO ====================
+
+class _ThreadProgress:
+    """progress(feito, total) para as tarefas do pool de threads."""
+
+    def __init__(self) -> None:
+        self.fraction = 0.0
+        self.cancelled = False
+
+    def __call__(self, done: float, total: float = 1.0) -> None:
+        self.fraction = done / total if total else 1.0
+        if self.cancelled:
+            raise Cancelled
+
+
+def _no_progress(done: float, total: float = 1.0) -> None:
+    pass
+
+
+# Memória compartilhada com os processos de trabalho (definida por
+# _init_worker em cada processo): uma posição por tarefa em andamento
+_SHARED_FRACTION = None
+_SHARED_CANCEL = None
+
+
+def _init_worker(fraction, cancel) -> None:
+    global _SHARED_FRACTION, _SHARED_CANCEL
+    _SHARED_FRACTION, _SHARED_CANCEL = fraction, cancel
+
+
+class _SharedProgress:
+    """progress(feito, total) para o pool de processos (serializável)."""
+
+    def __init__(self, slot: int) -> None:
+        self.slot = slot
+
+    def __call__(self, done: float, total: float = 1.0) -> None:
+        _SHARED_FRACTION[self.slot] = done / total if total else 1.0
+        if _SHARED_CANCEL[self.slot]:
+            raise Cancelled
+
+
+def _timed(function: Callable, args: tuple, kwargs: dict):
+    """Roda a função no trabalhador e mede só a execução (sem a fila)."""
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+# ==================== TAREFAS ====================
+
+class Job:
+    """Uma tarefa submetida; os callbacks rodam na thread do Tk."""
+
+    def __init__(self, key: Hashable, name: str, on_done: Callable,
+                 on_error: Optional[Callable], on_progress: Optional[Callable],
+                 is_alive: Optional[Callable[[], bool]]) -> None:
+        self.key = key
+        self.name = name
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.is_alive = is_alive
+        self.future: Optional[concurrent.futures.Future] = None
+        self.progress = None        # _ThreadProgress ou _SharedProgress
+        self.cancelled = False
+        self.fraction = 0.0
+        self.submitted_ns = time.perf_counter_ns()
+
+
+class ComputeExecutor:
+    """Pools de threads e de processos com entrega dos resultados via root.after."""
+
+    def __init__(self, root, threads: Optional[int] = None,
+                 processes: Optional[int] = None, poll_ms: int = POLL_MS) -> None:
+        cpus = os.cpu_count() or 1
+        self.root = root
+        self.threads = threads or min(4, cpus)
+        self.processes = processes or max(1, cpus - 1)
+        self.poll_ms = poll_ms
+        self._thread_pool = None
+        self._process_pool = None
+        self._fraction = self._cancel = None      # arrays compartilhados do pool de processos
+        self._free_slots: List[int] = []
+        self._latest: Dict[Hashable, Job] = {}    # chave -> tarefa mais recente
+        self._pending: List[Job] = []             # submetidas e ainda não entregues
+        self._finished: "queue.Queue[Job]" = queue.Queue()
+        self._poll_job = None
+
+    # ==================== POOLS ====================
+
+    def _pool(self, kind: str):
+        if kind == "thread":
+            if self._thread_pool is None:
+                self._thread_pool = concurrent.futures.ThreadPoolExecutor(
+                    self.threads, thread_name_prefix="compute")
+            return self._thread_pool
+        if kind == "process":
+            if self._process_pool is None:
+                # "spawn": um fork levaria junto o estado do Tk e das threads
+                import multiprocessing
+                context = multiprocessing.get_context("spawn")
+                self._fraction = context.RawArray("d", PROGRESS_SLOTS)
+                self._cancel = context.RawArray("b", PROGRESS_SLOTS)
+                self._free_slots = list(range(PROGRESS_SLOTS))
+                self._process_pool = concurrent.futures.ProcessPoolExecutor(
+                    self.processes, mp_context=context, initializer=_init_worker,
+                    initargs=(self._fraction, self._cancel))
+            return self._process_pool
+        raise ValueError(f"Pool desconhecido: {kind} (use {', '.join(POOLS)})")
+
+    # ==================== SUBMISSÃO E CANCELAMENTO ====================
+
+    def submit(self, key: Hashable, function: Callable, *args, on_done: Callable,
+               on_error: Optional[Callable] = None, on_progress: Optional[Callable] = None,
+               is_alive: Optional[Callable[[], bool]] = None, pool: str = "thread",
+               **kwargs) -> Job:
+        """Roda function(*args, progress=..., **kwargs) no pool escolhido.
+
+        Na thread do Tk, depois: on_done(resultado, segundos) ou
+        on_error(exceção); on_progress(fração) a cada mudança do
+        andamento. A tarefa anterior da mesma chave é cancelada, e nada
+        é entregue se is_alive() for falso (ex.: a janela foi fechada).
+        """
+        self.cancel(key)
+        executor = self._pool(pool)
+        job = Job(key, function.__name__, on_done, on_error, on_progress, is_alive)
+        if pool == "process":
+            slot = self._free_slots.pop() if self._free_slots else None
+            if slot is not None:
+                self._fraction[slot] = 0.0
+                self._cancel[slot] = 0
+                job.progress = _SharedProgress(slot)
+        else:
+            job.progress = _ThreadProgress()
+        # Sem posição livre a tarefa roda sem progresso; o resultado velho ainda é descartado
+        kwargs["progress"] = job.progress if job.progress is not None else _no_progress
+        job.future = executor.submit(_timed, function, args, kwargs)
+        job.future.add_done_callback(lambda _: self._finished.put(job))
+        self._latest[key] = job
+        self._pending.append(job)
+        self._schedule()
+        return job
+
+    def cancel(self, key: Hashable) -> bool:
+        """Cancela a tarefa da chave; devolve True se havia uma em andamento."""
+        job = self._latest.pop(key, None)
+        if job is None:
+            return False
+        self._cancel_job(job)
+        return True
+
+    def cancel_all(self) -> None:
+        for key in list(self._latest):
+            self.cancel(key)
+
+    def _cancel_job(self, job: Job) -> None:
+        job.cancelled = True
+        if job.future.cancel():
+            return
+        if isinstance(job.progress, _SharedProgress):
+            self._cancel[job.progress.slot] = 1
+        elif job.progress is not None:
+            job.progress.cancelled = True
+
+    def running(self, key: Hashable) -> bool:
+        return key in self._latest
+
+    # ==================== ENTREGA (THREAD DO TK) ====================
+
+    def _schedule(self) -> None:
+        if self._poll_job is None:
+            self._poll_job = self.root.after(self.poll_ms, self._poll)
+
+    def _poll(self) -> None:
+        self._poll_job = None
+        while True:
+            try:
+                job = self._finished.get_nowait()
+            except queue.Empty:
+                break
+            self._deliver(job)
+        for job in list(self._pending):
+            if job.cancelled:
+                continue
+            if job.is_alive is not None and not job.is_alive():
+                self.cancel(job.key)     # o dono sumiu (janela fechada, tela descartada)
+                continue
+            if job.on_progress is None or job.progress is None:
+                continue
+            fraction = (self._fraction[job.progress.slot]
+                        if isinstance(job.progress, _SharedProgress) else job.progress.fraction)
+            if fraction != job.fraction:
+                job.fraction = fraction
+                job.on_progress(fraction)
+        if self._pending:
+            self._schedule()
+
+    def _deliver(self, job: Job) -> None:
+        self._pending.remove(job)
+        if isinstance(job.progress, _SharedProgress):
+            self._free_slots.append(job.progress.slot)
+        if self._latest.get(job.key) is not job:
+            return      # cancelada ou substituída: resultado velho
+        del self._latest[job.key]
+        if job.is_alive is not None and not job.is_alive():
+            return
+        if tracing.TRACER.enabled:
+            tracing.TRACER.record(job.name, "compute", job.submitted_ns, time.perf_counter_ns())
+        error = job.future.exception()
+        if isinstance(error, Cancelled):
+            return
+        if error is not None:
+            if job.on_error is None:
+                raise error
+            job.on_error(error)
+            return
+        result, elapsed = job.future.result()
+        job.on_done(result, elapsed)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Bloqueia até entregar todas as tarefas (lote, benchmarks e testes).
+
+        Devolve False se o tempo acabar antes.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._pending:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            futures = [job.future for job in self._pending]
+            concurrent.futures.wait(futures, remaining, concurrent.futures.FIRST_COMPLETED)
+            if deadline is not None and time.monotonic() >= deadline and \
+                    not any(f.done() for f in futures):
+                return False
+            self._poll()
+        return True
+
+    def shutdown(self) -> None:
+        """Cancela tudo e libera os pools sem esperar as tarefas em andamento."""
+        self.cancel_all()
+        if self._poll_job is not None:
+            self.root.after_cancel(self._poll_job)
+            self._poll_job = None
+        for pool in (self._thread_pool, self._process_pool):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+        self._thread_pool = self._process_pool = None
@@ -0,0 +1,165 @@
+"""
+e_series.py
+-----------
+Valores padronizados das séries E (IEC 60063), de E6 a E192.
+
+As tabelas de cada série são montadas uma única vez por faixa (todas as
+décadas já multiplicadas e ordenadas) e as buscas usam np.searchsorted,
+ou seja, O(log n) por valor e totalmente vetorizadas. A busca de pares
+(série, paralelo, razão de divisor) testa para cada valor da tabela
+apenas os vizinhos do complemento ideal, em vez de todas as n² combinações.
+"""
+
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+E6 = (1.0, 1.5, 2.2, 3.3, 4.7, 6.8)
+
+E12 = (1.0, 1.2, 1.5, 1.8, 2.2, 2.7, 3.3, 3.9, 4.7, 5.6, 6.8, 8.2)
+
+E24 = (1.0, 1.1, 1.2, 1.3, 1.5, 1.6, 1.8, 2.0, 2.2, 2.4, 2.7, 3.0,
+       3.3, 3.6, 3.9, 4.3, 4.7, 5.1, 5.6, 6.2, 6.8, 7.5, 8.2, 9.1)
+
+E96 = (1.00, 1.02, 1.05, 1.07, 1.10, 1.13, 1.15, 1.18, 1.21, 1.24, 1.27, 1.30,
+       1.33, 1.37, 1.40, 1.43, 1.47, 1.50, 1.54, 1.58, 1.62, 1.65, 1.69, 1.74,
+       1.78, 1.82, 1.87, 1.91, 1.96, 2.00, 2.05, 2.10, 2.15, 2.21, 2.26, 2.32,
+       2.37, 2.43, 2.49, 2.55, 2.61, 2.67, 2.74, 2.80, 2.87, 2.94, 3.01, 3.09,
+       3.16, 3.24, 3.32, 3.40, 3.48, 3.57, 3.65, 3.74, 3.83, 3.92, 4.02, 4.12,
+       4.22, 4.32, 4.42, 4.53, 4.64, 4.75, 4.87, 4.99, 5.11, 5.23, 5.36, 5.49,
+       5.62, 5.76, 5.90, 6.04, 6.19, 6.34, 6.49, 6.65, 6.81, 6.98, 7.15, 7.32,
+       7.50, 7.68, 7.87, 8.06, 8.25, 8.45, 8.66, 8.87, 9.09, 9.31, 9.53, 9.76)
+
+E48 = E96[::2]
+
+# E192 segue 10^(i/192) arredondado a 3 algarismos, exceto 9.20 (e não 9.19)
+E192 = tuple(9.20 if i == 185 else round(10 ** (i / 192), 2) for i in range(192))
+
+SERIES = {"E6": E6, "E12": E12, "E24": E24, "E48": E48, "E96": E96, "E192": E192}
+
+SERIES_TOLERANCE = {"E6": 0.20, "E12": 0.10, "E24": 0.05,
+                    "E48": 0.02, "E96": 0.01, "E192": 0.005}
+
+RESISTOR_RANGE = (1.0, 10e6)
+CAPACITOR_RANGE = (1e-12, 10e-3)
+
+PAIR_MODES = {
+    "series": "Série (R1 + R2)",
+    "parallel": "Paralelo (R1 ∥ R2)",
+    "ratio": "Divisor (R2 / (R1 + R2))",
+}
+
+
+class PairResult(NamedTuple):
+    R1: np.ndarray
+    R2: np.ndarray
+    value: np.ndarray   # valor obtido (resistência ou razão)
+    error: np.ndarray   # erro relativo em relação ao alvo
+
+
+@lru_cache(maxsize=None)
+def table(series: str = "E24", low: float = RESISTOR_RANGE[0],
+          high: float = RESISTOR_RANGE[1]) -> np.ndarray:
+    """Todos os valores da série entre low e high, ordenados (somente leitura)."""
+    base = SERIES[series]
+    first = int(np.floor(np.log10(low))) - 1
+    last = int(np.ceil(np.log10(high))) + 1
+    # Converter via texto evita resíduos binários como 4.700000000000001e-09
+    values = np.array([float(f"{b:.2f}e{k}") for k in range(first, last + 1) for b in base])
+    values = values[(values >= low * (1 - 1e-9)) & (values <= high * (1 + 1e-9))]
+    values.sort()
+    values.setflags(write=False)
+    return values
+
+
+def _neighbors(values: np.ndarray, x):
+    """Índices dos vizinhos inferior e superior de cada x na tabela."""
+    upper = np.clip(np.searchsorted(values, x), 0, values.size - 1)
+    lower = np.clip(upper - 1, 0, values.size - 1)
+    return lower, upper
+
+
+def nearest(x, series: str = "E24", low: float = RESISTOR_RANGE[0],
+            high: float = RESISTOR_RANGE[1]) -> np.ndarray:
+    """Valor padronizado mais próximo (em escala logarítmica) de cada x."""
+    values = table(series, low, high)
+    x = np.asarray(x, dtype=float)
+    lower, upper = _neighbors(values, x)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        use_upper = values[upper] * values[lower] < x * x
+    return np.where(use_upper, values[upper], values[lower])[()]
+
+
+def bracket(x, series: str = "E24", low: float = RESISTOR_RANGE[0],
+            high: float = RESISTOR_RANGE[1]):
+    """Valores padronizados imediatamente abaixo (ou igual) e acima de x."""
+    values = table(series, low, high)
+    x = np.asarray(x, dtype=float)
+    upper = np.clip(np.searchsorted(values, x, side="right"), 0, values.size - 1)
+    lower = np.clip(upper - 1, 0, values.size - 1)
+    return values[lower][()], values[upper][()]
+
+
+def pair_value(R1, R2, mode: str):
+    """Valor obtido por um par conforme o modo (série, paralelo ou razão)."""
+    R1 = np.asarray(R1, dtype=float)
+    R2 = np.asarray(R2, dtype=float)
+    if mode == "series":
+        return R1 + R2
+    if mode == "parallel":
+        return R1 * R2 / (R1 + R2)
+    if mode == "ratio":
+        return R2 / (R1 + R2)
+    raise ValueError(f"Modo desconhecido: {mode}")
+
+
+def find_pairs(target: float, mode: str = "series", series: str = "E24",
+               top: int = 10, total: Optional[float] = None,
+               low: float = RESISTOR_RANGE[0], high: float = RESISTOR_RANGE[1]
+               ) -> PairResult:
+    """Melhores pares padronizados para um valor (série/paralelo) ou razão.
+
+    Para cada R1 da tabela calcula-se o R2 ideal e apenas seus dois
+    vizinhos na tabela são avaliados. No modo "ratio", `total` (soma
+    desejada R1+R2) restringe os pares a um fator 3 desse valor.
+    """
+    values = table(series, low, high)
+    R1 = values
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if mode == "series":
+            ideal = target - R1
+        elif mode == "parallel":
+            ideal = 1.0 / (1.0 / target - 1.0 / R1)
+        elif mode == "ratio":
+            if not (0 < target < 1):
+                raise ValueError("A razão do divisor deve estar entre 0 e 1")
+            ideal = R1 * target / (1 - target)
+        else:
+            raise ValueError(f"Modo desconhecido: {mode}")
+    valid = np.isfinite(ideal) & (ideal > 0)
+    R1, ideal = R1[valid], ideal[valid]
+
+    lower, upper = _neighbors(values, ideal)
+    R1 = np.concatenate([R1, R1])
+    R2 = values[np.concatenate([lower, upper])]
+    value = pair_value(R1, R2, mode)
+    error = value / target - 1
+
+    keep = np.ones(R1.size, dtype=bool)
+    if mode != "ratio":
+        keep &= R1 >= R2  # (a, b) e (b, a) são o mesmo par
+    elif total is not None:
+        keep &= np.abs(np.log((R1 + R2) / total)) <= np.log(3.0)
+    R1, R2, value, error = R1[keep], R2[keep], value[keep], error[keep]
+
+    # Remove pares repetidos (vizinhos inferior e superior iguais)
+    _, unique = np.unique(np.stack([R1, R2]), axis=1, return_index=True)
+    R1, R2, value, error = R1[unique], R2[unique], value[unique], error[unique]
+
+    if mode == "ratio" and total is not None:
+        order = np.lexsort((np.abs(np.log((R1 + R2) / total)), np.abs(error)))
+    else:
+        order = np.lexsort((-R2, np.abs(error)))
+    order = order[:top]
+    return PairResult(R1[order], R2[order], value[order], error[order])
@@ -0,0 +1,253 @@
+"""
+export_io.py
+------------
+Exportação binária de formas de onda e tabelas de varredura.
+
+Três formatos, todos legíveis sem passar por texto:
+
+* .npy - formato nativo do NumPy. NpyWriter grava em blocos: o
+  cabeçalho é reservado com espaço para o maior tamanho possível e
+  reescrito com a forma final ao fechar, então arquivos de vários
+  gigabytes são escritos sem nunca estarem inteiros na memória, e
+  np.load(caminho, mmap_mode="r") os lê de volta sob demanda.
+
+* .raw - dados binários crus precedidos de um pequeno cabeçalho JSON
+  (magic, tamanho do cabeçalho, dtype, forma, metadados), alinhado a 64
+  bytes para que open_raw devolva um np.memmap direto sobre o arquivo.
+  Útil para ferramentas que não leem .npy: basta pular data_offset bytes.
+
+* .npz - vários arrays num zip (np.savez), para exportar uma tela
+  inteira de uma vez; não permite memmap.
+
+Tabelas (colunas 1-D do mesmo comprimento, ex.: entradas e saídas de
+uma varredura) viram arrays estruturados, um campo por coluna, de modo
+que os nomes das colunas viajam junto com os dados.
+"""
+
+import json
+import os
+from typing import Dict, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+RAW_MAGIC = b"VSRAW\x00"
+RAW_VERSION = 1
+ALIGNMENT = 64
+FORMATS = ("npy", "npz", "raw")
+
+_NPY_MAGIC = b"\x93NUMPY"
+# Maior primeira dimensão reservada no cabeçalho de um arquivo em escrita
+_MAX_ROWS = 10 ** 18
+
+
+class RawHeader(NamedTuple):
+    dtype: np.dtype
+    shape: Tuple[int, ...]
+    data_offset: int
+    metadata: dict
+
+
+# ==================== TABELAS ====================
+
+def table_dtype(columns: Sequence[str], dtype=np.float64) -> np.dtype:
+    """dtype estruturado com um campo `dtype` por coluna."""
+    return np.dtype([(str(name), dtype) for name in columns])
+
+
+def as_table(columns: Mapping[str, np.ndarray]) -> np.ndarray:
+    """Colunas 1-D de mesmo comprimento -> array estruturado (uma linha por índice)."""
+    arrays = {name: np.asarray(values) for name, values in columns.items()}
+    lengths = {a.shape for a in arrays.values()}
+    if len(lengths) != 1 or len(next(iter(lengths))) != 1:
+        raise ValueError("As colunas de uma tabela devem ser 1-D e do mesmo tamanho")
+    table = np.empty(next(iter(lengths))[0],
+                     dtype=[(name, a.dtype) for name, a in arrays.items()])
+    for name, values in arrays.items():
+        table[name] = values
+    return table
+
+
+def _single_array(arrays: Mapping[str, np.ndarray]) -> np.ndarray:
+    """O array a gravar em .npy/.raw: o único dado ou a tabela das colunas."""
+    if len(arrays) == 1:
+        return np.asarray(next(iter(arrays.values())))
+    try:
+        return as_table(arrays)
+    except ValueError:
+        raise ValueError("Arrays de formas diferentes: exporte em .npz") from None
+
+
+# ==================== .NPY EM BLOCOS ====================
+
+def _npy_header(dtype: np.dtype, shape: Tuple[int, ...], size: int = 0) -> bytes:
+    """Cabeçalho .npy versão 1.0, completado com espaços até `size` bytes."""
+    text = repr({"descr": np.lib.format.dtype_to_descr(dtype), "fortran_order": False,
+                 "shape": tuple(shape)})
+    total = len(_NPY_MAGIC) + 4 + len(text) + 1
+    size = max(size, -(-total // ALIGNMENT) * ALIGNMENT)
+    text = text + " " * (size - total) + "\n"
+    if size - len(_NPY_MAGIC) - 4 > 0xFFFF:
+        raise ValueError("Cabeçalho .npy grande demais (dtype com campos demais)")
+    return _NPY_MAGIC + bytes([1, 0]) + (size - len(_NPY_MAGIC) - 4).to_bytes(2, "little") \
+        + text.encode("latin1")
+
+
+class _BlockWriter:
+    """Base dos gravadores em blocos: append() ao longo do primeiro eixo."""
+
+    def __init__(self, path: str, dtype, row_shape: Tuple[int, ...] = ()) -> None:
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        self.row_shape = tuple(int(n) for n in row_shape)
+        self.rows = 0
+        self._file = open(path, "wb")
+        self._file.write(self._header(_MAX_ROWS))
+        self._reserved = self._file.tell()
+
+    def _header(self, rows: int, size: int = 0) -> bytes:
+        raise NotImplementedError
+
+    def append(self, block) -> None:
+        """Acrescenta linhas (forma (n,) + row_shape; tabelas: array estruturado)."""
+        block = np.asarray(block)
+        if self.dtype.names and block.dtype != self.dtype:
+            block = _cast_table(block, self.dtype)
+        else:
+            block = block.astype(self.dtype, copy=False)
+        if block.shape[1:] != self.row_shape:
+            block = block.reshape((-1,) + self.row_shape)
+        self._file.write(np.ascontiguousarray(block).tobytes())
+        self.rows += block.shape[0]
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        self._file.seek(0)
+        self._file.write(self._header(self.rows, self._reserved))
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _cast_table(block: np.ndarray, dtype: np.dtype) -> np.ndarray:
+    """Tabela com campos de mesmo nome convertida para `dtype`."""
+    table = np.empty(block.shape, dtype=dtype)
+    for name in dtype.names:
+        table[name] = block[name]
+    return table
+
+
+class NpyWriter(_BlockWriter):
+    """Grava um .npy incrementalmente; np.load(mmap_mode="r") lê o resultado."""
+
+    def _header(self, rows: int, size: int = 0) -> bytes:
+        return _npy_header(self.dtype, (rows,) + self.row_shape, size)
+
+
+# ==================== .RAW COM CABEÇALHO JSON ====================
+
+def _raw_header(dtype: np.dtype, shape: Tuple[int, ...], metadata: dict,
+                size: int = 0) -> bytes:
+    descr = np.lib.format.dtype_to_descr(dtype)
+    text = json.dumps({"version": RAW_VERSION, "dtype": descr, "shape": list(shape),
+                       "order": "C", "metadata": metadata}, ensure_ascii=False)
+    data = text.encode("utf-8")
+    total = len(RAW_MAGIC) + 4 + len(data)
+    size = max(size, -(-total // ALIGNMENT) * ALIGNMENT)
+    return RAW_MAGIC + (size - len(RAW_MAGIC) - 4).to_bytes(4, "little") \
+        + data + b" " * (size - total)
+
+
+class RawWriter(_BlockWriter):
+    """Grava um .raw incrementalmente (cabeçalho JSON reescrito ao fechar)."""
+
+    def __init__(self, path: str, dtype, row_shape: Tuple[int, ...] = (),
+                 metadata: Optional[dict] = None) -> None:
+        self.metadata = dict(metadata or {})
+        super().__init__(path, dtype, row_shape)
+
+    def _header(self, rows: int, size: int = 0) -> bytes:
+        return _raw_header(self.dtype, (rows,) + self.row_shape, self.metadata, size)
+
+
+def _descr_from_json(descr):
+    """Descrição de dtype vinda do JSON, com as tuplas de volta (campos e formas)."""
+    if not isinstance(descr, list):
+        return descr
+    fields = []
+    for name, field, *shape in descr:
+        fields.append((name, _descr_from_json(field)) + tuple(tuple(s) for s in shape))
+    return fields
+
+
+def read_raw_header(path: str) -> RawHeader:
+    with open(path, "rb") as f:
+        magic = f.read(len(RAW_MAGIC))
+        if magic != RAW_MAGIC:
+            raise ValueError(f"{path}: não é um arquivo .raw do Visual Spreadsheets")
+        length = int.from_bytes(f.read(4), "little")
+        header = json.loads(f.read(length).decode("utf-8"))
+    if header.get("version") != RAW_VERSION:
+        raise ValueError(f"{path}: versão de cabeçalho não suportada: {header.get('version')}")
+    dtype = np.lib.format.descr_to_dtype(_descr_from_json(header["dtype"]))
+    return RawHeader(dtype, tuple(header["shape"]), len(RAW_MAGIC) + 4 + length,
+                     header.get("metadata", {}))
+
+
+def open_raw(path: str, mode: str = "r") -> Tuple[np.ndarray, RawHeader]:
+    """(np.memmap sobre os dados, cabeçalho) sem ler o arquivo para a memória."""
+    header = read_raw_header(path)
+    if not all(header.shape):
+        return np.empty(header.shape, dtype=header.dtype), header
+    return np.memmap(path, dtype=header.dtype, mode=mode, offset=header.data_offset,
+                     shape=header.shape), header
+
+
+# ==================== GRAVAÇÃO E LEITURA ====================
+
+def format_of(path: str) -> str:
+    extension = os.path.splitext(path)[1].lower().lstrip(".")
+    if extension not in FORMATS:
+        raise ValueError(f"Extensão não suportada: {path} (use .npy, .npz ou .raw)")
+    return extension
+
+
+def save(path: str, arrays: Mapping[str, np.ndarray],
+         metadata: Optional[dict] = None) -> None:
+    """Grava `arrays` no formato dado pela extensão de `path`.
+
+    .npz guarda cada array com o seu nome (e os metadados em "metadata",
+    como texto JSON, nome que fica reservado); .npy e .raw aceitam um único array ou colunas
+    1-D do mesmo tamanho, gravadas como tabela. Os dados são escritos em
+    blocos, sem cópia intermediária do arquivo inteiro.
+    """
+    fmt = format_of(path)
+    if fmt == "npz":
+        if "metadata" in arrays:
+            raise ValueError('"metadata" é reservado para os metadados do .npz')
+        extra = {"metadata": np.array(json.dumps(metadata or {}, ensure_ascii=False))}
+        np.savez(path, **{name: np.asarray(a) for name, a in arrays.items()}, **extra)
+        return
+    data = np.atleast_1d(_single_array(arrays))
+    writer = NpyWriter(path, data.dtype, data.shape[1:]) if fmt == "npy" else \
+        RawWriter(path, data.dtype, data.shape[1:], metadata)
+    # Blocos de ~16 MB: a conversão para bytes nunca duplica o array inteiro
+    block = max(1, (16 << 20) // max(data[:1].nbytes, 1))
+    with writer:
+        for start in range(0, len(data), block):
+            writer.append(data[start:start + block])
+
+
+def load(path: str) -> Dict[str, np.ndarray]:
+    """Arrays de um arquivo exportado; .npy e .raw vêm como memmap (leitura sob demanda)."""
+    fmt = format_of(path)
+    if fmt == "npz":
+        with np.load(path) as archive:
+            return {name: archive[name] for name in archive.files}
+    if fmt == "npy":
+        return {"data": np.load(path, mmap_mode="r")}
+    return {"data": open_raw(path)[0]}
@@ -0,0 +1,245 @@
+"""
+live_plot.py
+------------
+Atualização rápida de gráficos matplotlib por artistas persistentes e
+blitting.
+
+Em vez de limpar o Axes (ax.cla()) e recriar linhas, preenchimentos,
+grade, rótulos e legenda a cada cálculo, cada tela cria seus artistas
+uma única vez como "animados" e depois só troca os dados deles
+(set_data/set_verts). O fundo estático (eixos, grade, rótulos, faixas
+fixas) é renderizado uma vez e guardado; a cada atualização ele é
+restaurado e apenas os artistas animados são redesenhados e copiados
+para a tela (blit).
+
+Uma renderização completa só acontece quando os limites dos eixos
+mudam - e os limites têm histerese: só são refeitos quando os dados
+saem da área visível ou passam a ocupar pouco dela.
+
+O canvas é recebido pronto (FigureCanvasTkAgg na interface, ou
+FigureCanvasAgg para medições sem display).
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from matplotlib.artist import Artist
+
+import tracing
+
+
+class LivePlot:
+    """Artistas persistentes de um Axes com redesenho por blitting."""
+
+    def __init__(self, canvas, ax, fill_fraction: float = 0.4) -> None:
+        self.canvas = canvas
+        self.ax = ax
+        self.figure = ax.figure
+        self.fill_fraction = fill_fraction
+        self.artists: Dict[str, Artist] = {}
+        self._animated: List[Artist] = [ax.title]
+        self._fills: Dict[str, np.ndarray] = {}
+        self._legend = None
+        self._legend_best = False
+        self._legend_sources: List[Artist] = []
+        self._background = None
+        self._needs_full = True
+        ax.title.set_animated(True)
+        self.full_draws = 0
+        self.blits = 0
+        canvas.mpl_connect("draw_event", self._on_draw)
+
+    # ==================== CRIAÇÃO ====================
+
+    def _add(self, name: str, artist: Artist) -> Artist:
+        # Invisível até o primeiro redraw(), quando os dados já foram definidos
+        artist.set_animated(True)
+        artist.set_visible(False)
+        self.artists[name] = artist
+        self._animated.append(artist)
+        self._needs_full = True
+        return artist
+
+    def line(self, name: str, x=(), y=(), *args, **kwargs):
+        """Cria uma linha (mesmos argumentos de ax.plot)."""
+        artist, = self.ax.plot(x, y, *args, **kwargs)
+        return self._add(name, artist)
+
+    def step(self, name: str, x=(), y=(), **kwargs):
+        """Linha em degraus (drawstyle steps-post), como ax.step(where="post")."""
+        return self.line(name, x, y, drawstyle="steps-post", **kwargs)
+
+    def fill_between(self, name: str, x=(0, 0), y1=(0, 0), y2=0, **kwargs):
+        """Cria uma área preenchida entre y1 e y2."""
+        artist = self.ax.fill_between(x, y1, y2, **kwargs)
+        self._add(name, artist)
+        self.set_fill(name, x, y1, y2)
+        return artist
+
+    def hline(self, name: str, y: float = 0.0, **kwargs):
+        return self._add(name, self.ax.axhline(y, **kwargs))
+
+    def vline(self, name: str, x: float = 0.0, **kwargs):
+        return self._add(name, self.ax.axvline(x, **kwargs))
+
+    def annotate(self, name: str, text: str = "", xy=(0, 0), xytext=(0, 0), **kwargs):
+        return self._add(name, self.ax.annotate(text, xy=xy, xytext=xytext, **kwargs))
+
+    def image(self, name: str, **kwargs):
+        """Cria uma imagem (mesmos argumentos de ax.imshow, sem os dados)."""
+        kwargs.setdefault("aspect", "auto")
+        kwargs.setdefault("origin", "lower")
+        return self._add(name, self.ax.imshow(np.zeros((1, 1)), **kwargs))
+
+    def legend(self, **kwargs):
+        """Legenda animada: os textos acompanham os rótulos dos artistas."""
+        handles, labels = self.ax.get_legend_handles_labels()
+        self._legend = self.ax.legend(handles, labels, **kwargs)
+        self._legend_best = self._legend._loc in (0, "best")
+        for handle in self._legend.legend_handles:
+            handle.set_visible(True)  # as cópias herdam a invisibilidade inicial
+        self._legend.set_animated(True)
+        self._legend_sources = list(handles)
+        self._needs_full = True
+        return self._legend
+
+    # ==================== ATUALIZAÇÃO ====================
+
+    def set_line(self, name: str, x, y, label: Optional[str] = None) -> None:
+        artist = self.artists[name]
+        artist.set_data(x, y)
+        if label is not None:
+            artist.set_label(label)
+
+    def set_fill(self, name: str, x, y1, y2=0) -> None:
+        x = np.asarray(x, dtype=float)
+        y1 = np.broadcast_to(np.asarray(y1, dtype=float), x.shape)
+        y2 = np.broadcast_to(np.asarray(y2, dtype=float), x.shape)
+        verts = np.column_stack([np.concatenate([x, x[::-1]]),
+                                 np.concatenate([y1, y2[::-1]])])
+        self.artists[name].set_verts([verts])
+        self._fills[name] = verts
+
+    def set_hline(self, name: str, y: float, label: Optional[str] = None) -> None:
+        artist = self.artists[name]
+        artist.set_ydata([y, y])
+        if label is not None:
+            artist.set_label(label)
+
+    def set_vline(self, name: str, x: float, label: Optional[str] = None) -> None:
+        artist = self.artists[name]
+        artist.set_xdata([x, x])
+        if label is not None:
+            artist.set_label(label)
+
+    def set_annotation(self, name: str, text: str, xy, xytext,
+                       color: Optional[str] = None) -> None:
+        artist = self.artists[name]
+        artist.set_text(text)
+        artist.xy = xy
+        artist.set_position(xytext)
+        if color is not None:
+            artist.set_color(color)
+            if artist.arrow_patch is not None:
+                artist.arrow_patch.set_color(color)
+
+    def set_image(self, name: str, data, extent, vmax: Optional[float] = None) -> None:
+        """Troca os dados da imagem; extent = (x0, x1, y0, y1) em coordenadas de dados."""
+        artist = self.artists[name]
+        limits = self.ax.get_xlim(), self.ax.get_ylim()
+        artist.set_data(data)
+        artist.set_extent(extent)  # com autoscale ligado, muda os limites
+        artist.set_clim(0, vmax if vmax is not None else max(float(np.max(data)), 1e-12))
+        if (self.ax.get_xlim(), self.ax.get_ylim()) != limits:
+            self._needs_full = True
+
+    def set_title(self, text: str) -> None:
+        self.ax.title.set_text(text)
+
+    # ==================== LIMITES ====================
+
+    def _data_limits(self) -> Tuple[Tuple[float, float], Tuple[float, float]]:
+        """Limites que o autoscale do matplotlib escolheria para os dados atuais."""
+        ax = self.ax
+        ax.relim()
+        for verts in self._fills.values():
+            if verts.size:
+                ax.update_datalim(verts)
+        xlim, ylim = ax.get_xlim(), ax.get_ylim()
+        ax.set_autoscale_on(True)
+        ax.autoscale_view()
+        new = ax.get_xlim(), ax.get_ylim()
+        ax.set_xlim(xlim)
+        ax.set_ylim(ylim)
+        return new
+
+    def _keep(self, current: Sequence[float], wanted: Sequence[float]) -> bool:
+        """Mantém os limites se os dados cabem e ocupam boa parte deles."""
+        lo, hi = min(current), max(current)
+        w_lo, w_hi = min(wanted), max(wanted)
+        span = hi - lo
+        if span <= 0 or w_lo < lo or w_hi > hi:
+            return False
+        return (w_hi - w_lo) >= self.fill_fraction * span
+
+    def rescale(self, xlim: Optional[Sequence[float]] = None,
+                ylim: Optional[Sequence[float]] = None) -> None:
+        """Ajusta os limites (fixos, se dados, ou automáticos com histerese)."""
+        ax = self.ax
+        keep_x = keep_y = False
+        if xlim is None or ylim is None:
+            auto_x, auto_y = self._data_limits()
+            if xlim is None:
+                xlim, keep_x = auto_x, self._keep(ax.get_xlim(), auto_x)
+            if ylim is None:
+                ylim, keep_y = auto_y, self._keep(ax.get_ylim(), auto_y)
+        for current, wanted, keep, setter in ((ax.get_xlim(), xlim, keep_x, ax.set_xlim),
+                                              (ax.get_ylim(), ylim, keep_y, ax.set_ylim)):
+            if keep or tuple(current) == tuple(wanted):
+                continue
+            if not np.all(np.isfinite(wanted)) or wanted[0] == wanted[1]:
+                continue
+            setter(wanted)
+            self._needs_full = True
+
+    # ==================== DESENHO ====================
+
+    def _on_draw(self, event) -> None:
+        """Após cada renderização completa: guarda o fundo e desenha os animados."""
+        if event is not None and event.canvas is not self.canvas:
+            return
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        if self._legend_best:
+            # "best" é recalculado a cada desenho e custa mais que o resto do
+            # blit; a posição é escolhida só nas renderizações completas
+            self._legend.set_loc("best")
+            self._draw_animated()
+            corner = self._legend.get_window_extent().p0
+            self._legend.set_loc(tuple(self.ax.transAxes.inverted().transform(corner)))
+            return
+        self._draw_animated()
+
+    def _draw_animated(self) -> None:
+        if self._legend is not None:
+            for text, source in zip(self._legend.get_texts(), self._legend_sources):
+                text.set_text(source.get_label())
+        for artist in self._animated:
+            self.figure.draw_artist(artist)
+        if self._legend is not None:
+            self.figure.draw_artist(self._legend)
+
+    def redraw(self, full: bool = False) -> None:
+        """Redesenha: blit dos artistas animados, ou completo se necessário."""
+        for artist in self.artists.values():
+            artist.set_visible(True)
+        if full or self._needs_full or self._background is None:
+            self._needs_full = False
+            self.full_draws += 1
+            with tracing.span("canvas.draw", "draw"):
+                self.canvas.draw()
+            return
+        with tracing.span("blit", "draw"):
+            self.canvas.restore_region(self._background)
+            self._draw_animated()
+            self.canvas.blit(self.figure.bbox)
+        self.blits += 1
@@ -0,0 +1,338 @@
+"""
+nodal.py
+--------
+Análise nodal modificada (MNA) de redes DC com resistores e fontes.
+
+Uma Netlist guarda os elementos R, V e I como arrays (nó a, nó b,
+valor); o nó 0 é a terra. NodalSystem monta o sistema
+
+    | G   B | |v|   |i|
+    | Bᵀ  0 | |j| = |e|
+
+de uma só vez a partir de listas de coordenadas (sem laço por
+elemento) e o fatora uma única vez: trocar só os valores das fontes
+custa apenas uma substituição direta/inversa, e vários conjuntos de
+fontes podem ser resolvidos numa mesma chamada.
+
+Redes pequenas usam matriz densa com fatoração LU. Acima de DENSE_LIMIT
+incógnitas a matriz é esparsa e fatorada por scipy.sparse.linalg.splu,
+de modo que escadas, malhas e grades com 10⁵ nós resolvem em frações de
+segundo. O SciPy é opcional: sem ele a matriz densa é usada até
+DENSE_MAX incógnitas e redes maiores são recusadas.
+"""
+
+import re
+import warnings
+from typing import Dict, List, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+GROUND = "0"
+
+# Acima deste número de incógnitas a fatoração esparsa já é mais rápida
+# que a densa (medido em grades e escadas: as duas empatam perto de 200)
+DENSE_LIMIT = 200
+
+# Sem o SciPy, limite da solução densa (O(n²) de memória, O(n³) de fatoração)
+DENSE_MAX = 1500
+
+
+class NodalSolution(NamedTuple):
+    node_voltages: np.ndarray      # tensão de cada nó (V), terra incluída no índice 0
+    resistor_currents: np.ndarray  # corrente de a para b em cada resistor (A)
+    source_currents: np.ndarray    # corrente fornecida por cada fonte de tensão (A)
+
+
+# ==================== NETLIST ====================
+
+class Netlist:
+    """Elementos R, V e I entre nós (nomes ou índices inteiros, 0 = terra).
+
+    Fonte de tensão (pos, neg, V): v(pos) - v(neg) = V.
+    Fonte de corrente (a, b, I): I sai do nó a e entra no nó b pela fonte.
+    """
+
+    def __init__(self) -> None:
+        self._index: Dict[str, int] = {GROUND: 0, "gnd": 0}
+        self.num_nodes = 1
+        self._elements: Dict[str, Tuple[List[np.ndarray], ...]] = {
+            kind: ([], [], []) for kind in "RVI"
+        }
+
+    # ---------- nós ----------
+
+    def node(self, name) -> int:
+        """Índice do nó `name`, criado se ainda não existir."""
+        if not isinstance(name, str):
+            return int(name)
+        key = name.strip()
+        if key.lower() == "gnd":
+            return 0
+        if key not in self._index:
+            self._index[key] = self.num_nodes
+            self.num_nodes += 1
+        return self._index[key]
+
+    def index(self, name: str) -> int:
+        """Índice de um nó nomeado existente (KeyError se não existir)."""
+        return self._index[name]
+
+    @property
+    def names(self) -> Dict[str, int]:
+        return {name: i for name, i in self._index.items() if name != "gnd"}
+
+    def new_nodes(self, count: int) -> np.ndarray:
+        """Reserva `count` nós anônimos e devolve seus índices."""
+        first = self.num_nodes
+        self.num_nodes += int(count)
+        return np.arange(first, self.num_nodes)
+
+    def _nodes(self, nodes) -> np.ndarray:
+        if isinstance(nodes, str):
+            return np.array([self.node(nodes)])
+        nodes = np.asarray(nodes)
+        if nodes.dtype.kind in "USO":
+            return np.array([self.node(str(n)) for n in nodes.ravel()])
+        nodes = nodes.astype(np.intp).ravel()
+        if nodes.size and (nodes.min() < 0 or nodes.max() >= self.num_nodes):
+            raise ValueError("Índice de nó fora da netlist")
+        return nodes
+
+    # ---------- elementos ----------
+
+    def _add(self, kind: str, a, b, value) -> None:
+        a, b = self._nodes(a), self._nodes(b)
+        value = np.asarray(value, dtype=float).ravel()
+        a, b, value = np.broadcast_arrays(a, b, value)
+        for column, data in zip(self._elements[kind], (a, b, value)):
+            column.append(np.array(data))
+
+    def add_resistors(self, a, b, R) -> None:
+        self._add("R", a, b, R)
+
+    def add_voltage_sources(self, pos, neg, V) -> None:
+        self._add("V", pos, neg, V)
+
+    def add_current_sources(self, a, b, I) -> None:
+        self._add("I", a, b, I)
+
+    def elements(self, kind: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(a, b, valor) de todos os elementos do tipo 'R', 'V' ou 'I'."""
+        columns = self._elements[kind]
+        if not columns[0]:
+            return (np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp), np.zeros(0))
+        for column in columns:
+            if len(column) > 1:
+                column[:] = [np.concatenate(column)]
+        return columns[0][0], columns[1][0], columns[2][0]
+
+
+# ==================== SOLUÇÃO ====================
+
+_SINGULAR = "Rede singular: nó flutuante ou laço de fontes de tensão"
+
+
+def _dense_solver(matrix: np.ndarray):
+    """Fatoração LU densa; devolve a função que resolve para um lado direito.
+
+    Com o SciPy a matriz é fatorada uma única vez (scipy.linalg.lu_factor)
+    e cada chamada é só a substituição direta/inversa; sem ele cada
+    chamada refaz np.linalg.solve sobre a matriz guardada. Em ambos os
+    casos evita-se a inversa explícita, mais cara e menos precisa.
+    """
+    try:
+        from scipy import linalg
+    except ImportError:
+        def solve(rhs):
+            try:
+                return np.linalg.solve(matrix, rhs)
+            except np.linalg.LinAlgError:
+                raise ValueError(_SINGULAR)
+        return solve
+
+    with warnings.catch_warnings():
+        # Pivô nulo (rede singular) é detectado abaixo, sem aviso
+        warnings.simplefilter("ignore", linalg.LinAlgWarning)
+        lu, piv = linalg.lu_factor(matrix, check_finite=False)
+    if not np.all(np.diag(lu)):
+        raise ValueError(_SINGULAR)
+    return lambda rhs: linalg.lu_solve((lu, piv), rhs, check_finite=False)
+
+class NodalSystem:
+    """Sistema MNA montado e fatorado; resolve para quaisquer valores de fonte."""
+
+    def __init__(self, netlist: Netlist) -> None:
+        self.netlist = netlist
+        a, b, R = netlist.elements("R")
+        pos, neg, self.default_voltages = netlist.elements("V")
+        self._i_from, self._i_to, self.default_currents = netlist.elements("I")
+        if not np.all((R > 0) & np.isfinite(R)):
+            raise ValueError("As resistências devem ser positivas e finitas")
+        self._a, self._b, self._g = a, b, 1 / R
+
+        n = netlist.num_nodes - 1
+        m = pos.size
+        self.size = n + m
+        if self.size == 0:
+            raise ValueError("Netlist vazia")
+
+        # Estampas: linha/coluna k-1 para o nó k; a terra (-1) é descartada
+        g = self._g
+        source_rows = n + np.arange(m)
+        rows = np.concatenate([a - 1, b - 1, a - 1, b - 1,
+                               pos - 1, neg - 1, source_rows, source_rows])
+        cols = np.concatenate([a - 1, b - 1, b - 1, a - 1,
+                               source_rows, source_rows, pos - 1, neg - 1])
+        ones = np.ones(m)
+        vals = np.concatenate([g, g, -g, -g, ones, -ones, ones, -ones])
+        keep = (rows >= 0) & (cols >= 0)
+        rows, cols, vals = rows[keep], cols[keep], vals[keep]
+
+        self.sparse = self.size > DENSE_LIMIT
+        if self.sparse:
+            try:
+                from scipy import sparse
+                from scipy.sparse import linalg as sparse_linalg
+            except ImportError:
+                if self.size > DENSE_MAX:
+                    raise ImportError(f"Redes com mais de {DENSE_MAX} incógnitas "
+                                      f"exigem o SciPy (scipy.sparse)")
+                self.sparse = False
+        if self.sparse:
+            matrix = sparse.csc_matrix((vals, (rows, cols)), shape=(self.size, self.size))
+            try:
+                # A estrutura é simétrica: ordenação por grau mínimo em A + Aᵀ
+                self._solve = sparse_linalg.splu(matrix, permc_spec="MMD_AT_PLUS_A").solve
+            except RuntimeError:
+                raise ValueError(_SINGULAR)
+        else:
+            matrix = np.zeros((self.size, self.size))
+            np.add.at(matrix, (rows, cols), vals)
+            self._solve = _dense_solver(matrix)
+
+    def solve(self, voltages=None, currents=None) -> NodalSolution:
+        """Resolve para os valores de fonte dados (padrão: os da netlist).
+
+        `voltages` e `currents` têm as fontes no último eixo; eixos
+        anteriores formam um lote de casos resolvidos de uma vez com a
+        mesma fatoração, e aparecem à frente em cada campo do resultado.
+        """
+        V = self.default_voltages if voltages is None else np.asarray(voltages, dtype=float)
+        I = self.default_currents if currents is None else np.asarray(currents, dtype=float)
+        m, p = self.default_voltages.size, self.default_currents.size
+        if V.shape[-1:] != (m,) or I.shape[-1:] != (p,):
+            raise ValueError("Número de valores diferente do número de fontes")
+        batch = np.broadcast_shapes(V.shape[:-1], I.shape[:-1])
+        cases = int(np.prod(batch))
+        V = np.broadcast_to(V, batch + (m,)).reshape(cases, m).T
+        I = np.broadcast_to(I, batch + (p,)).reshape(cases, p).T
+
+        n = self.size - m
+        rhs = np.zeros((self.size, cases))
+        for nodes, sign in ((self._i_to, 1.0), (self._i_from, -1.0)):
+            inside = nodes > 0
+            np.add.at(rhs, nodes[inside] - 1, sign * I[inside])
+        rhs[n:] = V
+        x = self._solve(rhs)
+
+        v = np.zeros((n + 1, x.shape[1]))
+        v[1:] = x[:n]
+        i_r = (v[self._a] - v[self._b]) * self._g[:, np.newaxis]
+        # A incógnita j é a corrente que entra no terminal + da fonte
+        return NodalSolution(*(field.T.reshape(batch + field.shape[:1])
+                               for field in (v, i_r, -x[n:])))
+
+
+def solve(netlist: Netlist) -> NodalSolution:
+    """Monta, fatora e resolve a netlist com os valores de fonte dela."""
+    return NodalSystem(netlist).solve()
+
+
+# ==================== LEITURA DE TEXTO ====================
+
+_VALUE = re.compile(r"^([+-]?(?:\d+\.?\d*|\.\d+)(?:e[+-]?\d+)?)(meg|[fpnuµmkgt])?[a-zω]*$",
+                    re.IGNORECASE)
+_SCALE = {"f": 1e-15, "p": 1e-12, "n": 1e-9, "u": 1e-6, "µ": 1e-6, "m": 1e-3,
+          "k": 1e3, "meg": 1e6, "g": 1e9, "t": 1e12}
+
+
+def parse_value(text: str) -> float:
+    """Valor com sufixo SPICE: '4.7k', '10u', '2meg', '1e-3' (m = mili)."""
+    match = _VALUE.match(text.strip())
+    if match is None:
+        raise ValueError(f"Valor inválido: {text!r}")
+    number, suffix = match.groups()
+    return float(number) * (_SCALE[suffix.lower()] if suffix else 1.0)
+
+
+def parse_netlist(text: str) -> Netlist:
+    """Netlist no formato SPICE simplificado, um elemento por linha.
+
+        * comentário
+        R1 entrada saida 4.7k
+        V1 entrada 0 12
+        I1 0 saida 1m
+
+    O tipo vem da primeira letra do nome (R, V ou I); '0' ou 'gnd' é a
+    terra e '.end' encerra a leitura.
+    """
+    netlist = Netlist()
+    for number, line in enumerate(text.splitlines(), 1):
+        fields = line.split(";")[0].split()
+        if not fields or fields[0].startswith("*"):
+            continue
+        if fields[0].lower() == ".end":
+            break
+        kind = fields[0][0].upper()
+        if kind not in "RVI" or len(fields) != 4:
+            raise ValueError(f"Linha {number}: esperado 'R|V|I<nome> nó nó valor'")
+        try:
+            value = parse_value(fields[3])
+        except ValueError as exc:
+            raise ValueError(f"Linha {number}: {exc}")
+        netlist._add(kind, fields[1], fields[2], value)
+    return netlist
+
+
+# ==================== REDES PRONTAS ====================
+
+def voltage_divider_netlist(Vin: float, R1: float, R2: float) -> Netlist:
+    """Vin -- R1 -- saida -- R2 -- terra."""
+    netlist = Netlist()
+    netlist.add_voltage_sources("entrada", GROUND, Vin)
+    netlist.add_resistors("entrada", "saida", R1)
+    netlist.add_resistors("saida", GROUND, R2)
+    return netlist
+
+
+def current_divider_netlist(Iin: float, resistors: Sequence[float]) -> Netlist:
+    """Fonte de corrente Iin alimentando resistores em paralelo (nó 'saida')."""
+    netlist = Netlist()
+    node = netlist.node("saida")
+    netlist.add_current_sources(GROUND, node, Iin)
+    netlist.add_resistors(node, 0, resistors)
+    return netlist
+
+
+def ladder_netlist(stages: int, R_series: float, R_shunt: float, Vin: float) -> Netlist:
+    """Escada R-2R genérica: `stages` seções série/derivação a partir de Vin."""
+    netlist = Netlist()
+    source = netlist.node("entrada")
+    netlist.add_voltage_sources(source, 0, Vin)
+    taps = netlist.new_nodes(stages)
+    netlist.add_resistors(np.append(source, taps[:-1]), taps, R_series)
+    netlist.add_resistors(taps, 0, R_shunt)
+    return netlist
+
+
+def grid_netlist(rows: int, cols: int, R: float, V: float) -> Netlist:
+    """Grade retangular de resistores iguais, V no canto (0, 0) e terra no oposto."""
+    if rows * cols < 2:
+        raise ValueError("A grade precisa de pelo menos dois nós")
+    netlist = Netlist()
+    corner = netlist.node("entrada")
+    ids = np.concatenate([[corner], netlist.new_nodes(rows * cols - 2), [0]]).reshape(rows, cols)
+    netlist.add_voltage_sources(corner, 0, V)
+    netlist.add_resistors(ids[:, :-1], ids[:, 1:], R)
+    netlist.add_resistors(ids[:-1, :], ids[1:, :], R)
+    return netlist
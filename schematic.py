@@ -0,0 +1,646 @@
+"""
+schematic.py
+------------
+Esquemas de circuito do Canvas a partir de uma lista de exibição.
+
+Um Schematic descreve o circuito em coordenadas de projeto: fios,
+resistores, capacitores, indutores, diodos, fontes, terra, rótulos e
+campos de valor. compile() expande essa descrição uma única vez numa
+lista de exibição - primitivas do Canvas (line, rectangle, oval, arc,
+polygon, text) com coordenadas e opções já resolvidas. Os esquemas das
+telas ficam em LIBRARY e get() guarda cada um já compilado, então
+reconstruir uma tela não recalcula a geometria.
+
+SchematicView cria os itens de cada lista no Canvas uma vez. Depois:
+
+* redimensionar o Canvas só move os itens (coords) e ajusta as fontes;
+* trocar de variante (ex.: RLC série/paralelo) esconde e mostra grupos
+  de itens já criados;
+* annotate() troca o texto dos campos de valor (itens marcados
+  "value:<nome>"), sem criar itens novos.
+"""
+
+import functools
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import tracing
+
+WIRE = dict(fill="white", width=2)
+LABEL_FONT = ("Arial", 13, "bold")
+VALUE_FONT = ("Arial", 10, "bold")
+
+
+class Component(NamedTuple):
+    kind: str          # resistor, capacitor, wire, text, value...
+    args: tuple
+    options: tuple     # pares (nome, valor), para a descrição ser imutável
+
+
+class Primitive(NamedTuple):
+    kind: str                      # tipo de item do Canvas (create_<kind>)
+    coords: Tuple[float, ...]      # em coordenadas de projeto
+    options: tuple                 # pares (nome, valor) passados ao create_<kind>
+    name: Optional[str] = None     # campo de valor atualizado por annotate()
+
+
+# ==================== MODELO ====================
+
+class Schematic:
+    """Descrição declarativa de um esquema com área de projeto width × height."""
+
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        self.components: List[Component] = []
+        self._display: Optional[Tuple[Primitive, ...]] = None
+
+    def _add(self, kind: str, *args, **options) -> None:
+        self.components.append(Component(kind, args, tuple(options.items())))
+        self._display = None
+
+    def wire(self, *points: float, **options) -> None:
+        """Fio (polilinha); `options` sobrepõe cor, espessura e seta."""
+        self._add("wire", *points, **options)
+
+    def resistor(self, x1: float, y1: float, x2: float, y2: float, vertical: bool = False) -> None:
+        self._add("resistor", x1, y1, x2, y2, vertical)
+
+    def capacitor(self, x: float, y: float, vertical: bool = False) -> None:
+        self._add("capacitor", x, y, vertical)
+
+    def inductor(self, x1: float, y1: float, x2: float, y2: float, vertical: bool = False) -> None:
+        self._add("inductor", x1, y1, x2, y2, vertical)
+
+    def diode(self, x: float, y: float, direction: str = "right") -> None:
+        self._add("diode", x, y, direction)
+
+    def ground(self, x: float, y: float) -> None:
+        self._add("ground", x, y)
+
+    def voltage_source(self, x: float, y: float, label: str = "V") -> None:
+        self._add("voltage_source", x, y, label)
+
+    def current_source(self, x: float, y: float, label: str = "I") -> None:
+        self._add("current_source", x, y, label)
+
+    def node(self, x: float, y: float) -> None:
+        """Ponto de junção."""
+        self._add("node", x, y)
+
+    def box(self, x1: float, y1: float, x2: float, y2: float, **options) -> None:
+        self._add("box", x1, y1, x2, y2, **options)
+
+    def polygon(self, *points: float, **options) -> None:
+        self._add("polygon", *points, **options)
+
+    def oval(self, x1: float, y1: float, x2: float, y2: float, **options) -> None:
+        self._add("oval", x1, y1, x2, y2, **options)
+
+    def text(self, x: float, y: float, text: str, fill: str = "red",
+             font: tuple = LABEL_FONT, **options) -> None:
+        self._add("text", x, y, text=text, fill=fill, font=font, **options)
+
+    def value(self, name: str, x: float, y: float, text: str = "", anchor: str = "w",
+              fill: str = "cyan", font: tuple = VALUE_FONT) -> None:
+        """Campo de valor calculado: texto trocado por SchematicView.annotate(nome=...)."""
+        self._add("value", x, y, name, text=text, anchor=anchor, fill=fill, font=font)
+
+    def compile(self) -> Tuple[Primitive, ...]:
+        """Lista de exibição (calculada uma vez e guardada)."""
+        if self._display is None:
+            display: List[Primitive] = []
+            for component in self.components:
+                _EXPAND[component.kind](display, *component.args, **dict(component.options))
+            self._display = tuple(display)
+        return self._display
+
+
+# ==================== EXPANSÃO EM PRIMITIVAS ====================
+
+def _line(display, *coords, **options) -> None:
+    display.append(Primitive("line", coords, tuple({**WIRE, **options}.items())))
+
+
+def _expand_resistor(display, x1, y1, x2, y2, vertical) -> None:
+    if vertical:
+        mid = (y1 + y2) / 2
+        height = abs(y2 - y1)
+        width = height * 0.3
+        display.append(Primitive("rectangle", (x1 - width/2, mid - height*0.3,
+                                               x1 + width/2, mid + height*0.3),
+                                 (("outline", "white"), ("width", 2))))
+        _line(display, x1, y1, x1, mid - height*0.3)
+        _line(display, x1, mid + height*0.3, x1, y2)
+    else:
+        mid = (x1 + x2) / 2
+        length = abs(x2 - x1)
+        height = length * 0.15
+        display.append(Primitive("rectangle", (mid - length*0.25, y1 - height,
+                                               mid + length*0.25, y1 + height),
+                                 (("outline", "white"), ("width", 2))))
+        _line(display, x1, y1, mid - length*0.25, y1)
+        _line(display, mid + length*0.25, y1, x2, y1)
+
+
+def _expand_capacitor(display, x, y, vertical) -> None:
+    if vertical:
+        _line(display, x-15, y, x+15, y, width=3)
+        _line(display, x-15, y+5, x+15, y+5, width=3)
+    else:
+        _line(display, x, y-15, x, y+15, width=3)
+        _line(display, x+5, y-15, x+5, y+15, width=3)
+
+
+def _expand_inductor(display, x1, y1, x2, y2, vertical, n_loops=4) -> None:
+    arc = (("outline", "white"), ("width", 2), ("style", "arc"), ("extent", 180))
+    if vertical:
+        dy = (y2 - y1) / (n_loops * 2)
+        for i in range(n_loops):
+            y_start = y1 + i * 2 * dy
+            display.append(Primitive("arc", (x1 - 10, y_start, x1 + 10, y_start + 2*dy),
+                                     arc + (("start", 270),)))
+        return
+    dx = (x2 - x1) / (n_loops * 2)
+    for i in range(n_loops):
+        x_start = x1 + i * 2 * dx
+        display.append(Primitive("arc", (x_start, y1 - 10, x_start + 2*dx, y1 + 10),
+                                 arc + (("start", 180),)))
+
+
+def _expand_diode(display, x, y, direction) -> None:
+    body = (("outline", "white"), ("fill", "black"), ("width", 2))
+    if direction == "right":
+        display.append(Primitive("polygon", (x-8, y-8, x-8, y+8, x+8, y), body))
+        _line(display, x+8, y-8, x+8, y+8)     # barra do catodo
+    elif direction == "down":
+        display.append(Primitive("polygon", (x-8, y-8, x+8, y-8, x, y+8), body))
+        _line(display, x-8, y+8, x+8, y+8)
+
+
+def _expand_ground(display, x, y) -> None:
+    _line(display, x, y, x, y+10)
+    _line(display, x-15, y+10, x+15, y+10, width=3)
+    _line(display, x-10, y+15, x+10, y+15)
+    _line(display, x-5, y+20, x+5, y+20, width=1)
+
+
+def _source_circle(display, x, y) -> None:
+    display.append(Primitive("oval", (x-20, y-20, x+20, y+20), (("outline", "white"), ("width", 2))))
+
+
+def _expand_voltage_source(display, x, y, label) -> None:
+    _source_circle(display, x, y)
+    _expand_text(display, x, y-5, text="+", fill="white", font=("Arial", 14, "bold"))
+    _expand_text(display, x, y+8, text="−", fill="white", font=("Arial", 14, "bold"))
+    _expand_text(display, x+35, y, text=label, fill="red", font=("Arial", 11, "bold"))
+
+
+def _expand_current_source(display, x, y, label) -> None:
+    _source_circle(display, x, y)
+    _line(display, x, y+12, x, y-12, arrow="last")
+    _expand_text(display, x+35, y, text=label, fill="red", font=("Arial", 11, "bold"))
+
+
+def _expand_node(display, x, y) -> None:
+    display.append(Primitive("oval", (x-5, y-5, x+5, y+5), (("fill", "white"), ("outline", "white"))))
+
+
+def _expand_shape(kind: str) -> Callable:
+    def expand(display, *coords, **options) -> None:
+        display.append(Primitive(kind, coords, tuple(options.items())))
+    return expand
+
+
+def _expand_text(display, x, y, **options) -> None:
+    display.append(Primitive("text", (x, y), tuple(options.items())))
+
+
+def _expand_value(display, x, y, name, **options) -> None:
+    display.append(Primitive("text", (x, y), tuple(options.items()), name))
+
+
+_EXPAND: Dict[str, Callable] = {
+    "wire": _line,
+    "resistor": _expand_resistor,
+    "capacitor": _expand_capacitor,
+    "inductor": _expand_inductor,
+    "diode": _expand_diode,
+    "ground": _expand_ground,
+    "voltage_source": _expand_voltage_source,
+    "current_source": _expand_current_source,
+    "node": _expand_node,
+    "box": _expand_shape("rectangle"),
+    "polygon": _expand_shape("polygon"),
+    "oval": _expand_shape("oval"),
+    "text": _expand_text,
+    "value": _expand_value,
+}
+
+
+# ==================== VISUALIZAÇÃO NO CANVAS ====================
+
+class _Group(NamedTuple):
+    tag: str
+    items: List[Tuple[int, Primitive]]
+
+
+def _scaled_font(font: tuple, scale: float) -> tuple:
+    return (font[0], max(1, round(font[1] * scale))) + tuple(font[2:])
+
+
+class SchematicView:
+    """Itens de um Canvas criados uma vez a partir das listas de exibição."""
+
+    def __init__(self, canvas, schematic: Optional[Schematic] = None) -> None:
+        self.canvas = canvas
+        self.groups: Dict[int, _Group] = {}    # id do Schematic -> itens criados
+        self.shown: Optional[Schematic] = None
+        self.values: Dict[str, str] = {}
+        self.scale = 1.0
+        self.offset = (0.0, 0.0)
+        # Borda e realce ficam fora da área de desenho
+        self._inset = sum(int(canvas.cget(option) or 0)
+                          for option in ("highlightthickness", "borderwidth"))
+        canvas.bind("<Configure>", self._on_configure, add="+")
+        if schematic is not None:
+            self.show(schematic)
+
+    def _place(self, coords: Tuple[float, ...]) -> List[float]:
+        scale, (dx, dy) = self.scale, self.offset
+        return [c * scale + (dy if i % 2 else dx) for i, c in enumerate(coords)]
+
+    def _options(self, primitive: Primitive) -> dict:
+        options = dict(primitive.options)
+        if "font" in options and self.scale != 1.0:
+            options["font"] = _scaled_font(options["font"], self.scale)
+        if primitive.name is not None:
+            options["text"] = self.values.get(primitive.name, options.get("text", ""))
+        return options
+
+    def show(self, schematic: Schematic) -> None:
+        """Mostra `schematic` (criando seus itens na primeira vez) e esconde o anterior."""
+        if schematic is self.shown:
+            return
+        group = self.groups.get(id(schematic))
+        if group is None:
+            with tracing.span("schematic.create", "draw"):
+                tag = f"schematic{len(self.groups)}"
+                items = []
+                for primitive in schematic.compile():
+                    tags = (tag,) if primitive.name is None else (tag, f"value:{primitive.name}")
+                    item = getattr(self.canvas, "create_" + primitive.kind)(
+                        *self._place(primitive.coords), tags=tags, **self._options(primitive))
+                    items.append((item, primitive))
+                group = self.groups[id(schematic)] = _Group(tag, items)
+        else:
+            self.canvas.itemconfigure(group.tag, state="normal")
+        if self.shown is not None:
+            self.canvas.itemconfigure(self.groups[id(self.shown)].tag, state="hidden")
+        self.shown = schematic
+
+    def annotate(self, **values: str) -> None:
+        """Troca o texto dos campos de valor (em todas as variantes já criadas)."""
+        for name, text in values.items():
+            if self.values.get(name) != text:
+                self.values[name] = text
+                self.canvas.itemconfigure(f"value:{name}", text=text)
+
+    def fit(self, width: float, height: float) -> None:
+        """Escala o esquema para caber em width × height, mantendo a proporção."""
+        if self.shown is None or width <= 1 or height <= 1:
+            return
+        scale = min(width / self.shown.width, height / self.shown.height)
+        offset = ((width - self.shown.width * scale) / 2,
+                  (height - self.shown.height * scale) / 2)
+        if abs(scale - self.scale) < 1e-3 and offset == self.offset:
+            return
+        fonts_changed = (round(scale * 100) != round(self.scale * 100))
+        self.scale, self.offset = scale, offset
+        with tracing.span("schematic.fit", "draw"):
+            for group in self.groups.values():
+                for item, primitive in group.items:
+                    self.canvas.coords(item, *self._place(primitive.coords))
+                    font = dict(primitive.options).get("font")
+                    if font is not None and fonts_changed:
+                        self.canvas.itemconfigure(item, font=_scaled_font(font, scale))
+
+    def _on_configure(self, event) -> None:
+        self.fit(event.width - 2 * self._inset, event.height - 2 * self._inset)
+
+
+# ==================== ESQUEMAS DAS TELAS ====================
+
+def _ohms_law() -> Schematic:
+    s = Schematic(400, 350)
+    s.voltage_source(80, 150, "VCC")
+    s.wire(80, 130, 80, 80)                 # fio superior
+    s.wire(80, 170, 80, 220)                # fio inferior
+    s.wire(80, 80, 320, 80)
+    s.resistor(200, 80, 320, 80)
+    s.text(260, 60, "R", font=("Arial", 14, "bold"))
+    s.value("R", 260, 112, anchor="center")
+    s.value("V", 100, 176)
+    s.wire(320, 80, 320, 220)               # fio direito
+    s.wire(80, 220, 320, 220)               # fio inferior
+    s.ground(200, 220)
+    s.wire(340, 150, 360, 150, fill="yellow", arrow="last")   # seta de corrente
+    s.text(380, 150, "I", fill="cyan")
+    s.value("I", 375, 172, anchor="center")
+    return s
+
+
+def _voltage_divider() -> Schematic:
+    s = Schematic(400, 450)
+    s.voltage_source(80, 180, "Vin")
+    s.wire(80, 160, 80, 80)
+    s.wire(80, 200, 80, 280)
+    s.wire(80, 80, 200, 80)
+    s.resistor(200, 80, 200, 160, vertical=True)
+    s.text(230, 120, "R1")
+    s.value("R1", 218, 138)
+    s.wire(200, 160, 200, 180)              # ponto médio
+    s.node(200, 180)
+    s.wire(200, 180, 300, 180)
+    s.text(340, 180, "Vout", fill="cyan")
+    s.value("Vout", 340, 200, anchor="center")
+    s.resistor(200, 200, 200, 280, vertical=True)
+    s.text(230, 240, "R2")
+    s.value("R2", 218, 258)
+    s.wire(80, 280, 200, 280)
+    s.wire(200, 280, 200, 300)
+    s.ground(200, 300)
+    return s
+
+
+def _current_divider(shown: int) -> Schematic:
+    """Até três ramos desenhados; os demais viram o campo "extra"."""
+    s = Schematic(400, 380)
+    s.current_source(60, 190, "Iin")
+    s.wire(60, 170, 60, 80)
+    s.wire(60, 210, 60, 300)
+    last_x = 160 + 90 * (shown - 1)
+    s.wire(60, 80, last_x, 80)
+    s.wire(60, 300, last_x, 300)
+    s.node(110, 80)
+    s.text(110, 60, "V", fill="cyan")
+    s.value("V", 125, 60)
+    for k in range(shown):
+        x = 160 + 90 * k
+        s.wire(x, 80, x, 150)
+        s.resistor(x, 150, x, 230, vertical=True)
+        s.wire(x, 230, x, 300)
+        s.text(x + 28, 190, f"R{k+1}", font=("Arial", 12, "bold"))
+        s.wire(x - 15, 105, x - 15, 130, fill="yellow", arrow="last")
+        s.text(x - 30, 117, f"I{k+1}", fill="cyan", font=("Arial", 10, "bold"))
+    s.value("extra", last_x, 330, anchor="center", fill="gray", font=("Arial", 11, "bold"))
+    s.ground(110, 300)
+    return s
+
+
+def _rc_circuit() -> Schematic:
+    s = Schematic(400, 350)
+    s.voltage_source(80, 150, "V")
+    s.wire(80, 130, 80, 80)
+    s.wire(80, 170, 80, 220)
+    s.wire(80, 80, 150, 80)
+    s.resistor(150, 80, 250, 80)
+    s.text(200, 60, "R")
+    s.value("R", 200, 105, anchor="center")
+    s.wire(250, 80, 320, 80)
+    s.wire(320, 80, 320, 140)
+    s.capacitor(320, 150, vertical=True)
+    s.text(350, 150, "C")
+    s.value("C", 338, 170)
+    s.wire(320, 160, 320, 220)
+    s.wire(80, 220, 320, 220)
+    s.ground(200, 220)
+    return s
+
+
+def _rlc(topology: str) -> Schematic:
+    """RLC série (fonte de tensão) ou paralelo (fonte de corrente)."""
+    s = Schematic(400, 330)
+    if topology == "série":
+        s.voltage_source(60, 175, "Vs")
+        s.wire(60, 155, 60, 80)
+        s.wire(60, 195, 60, 270)
+        s.resistor(60, 80, 180, 80)
+        s.text(120, 58, "R")
+        s.value("R", 120, 38, anchor="center")
+        s.wire(180, 80, 200, 80)
+        s.inductor(200, 80, 280, 80)
+        s.text(240, 58, "L")
+        s.value("L", 240, 38, anchor="center")
+        s.wire(280, 80, 340, 80)
+        s.wire(340, 80, 340, 170)
+        s.capacitor(340, 170, vertical=True)
+        s.text(370, 172, "C")
+        s.text(370, 200, "vC", fill="cyan", font=("Arial", 11, "bold"))
+        s.wire(340, 175, 340, 270)
+        s.text(150, 105, "i →", fill="cyan", font=("Arial", 11, "bold"))
+    else:
+        s.current_source(60, 175, "Is")
+        s.wire(60, 155, 60, 80)
+        s.wire(60, 195, 60, 270)
+        s.wire(60, 80, 340, 80)
+        s.resistor(160, 80, 160, 270, vertical=True)
+        s.text(185, 175, "R")
+        s.value("R", 192, 195)
+        s.wire(250, 80, 250, 135)
+        s.inductor(250, 135, 250, 215, vertical=True)
+        s.wire(250, 215, 250, 270)
+        s.text(280, 160, "L")
+        s.value("L", 264, 140)
+        s.text(282, 185, "iL↓", fill="cyan", font=("Arial", 11, "bold"))
+        s.wire(340, 80, 340, 170)
+        s.capacitor(340, 170, vertical=True)
+        s.wire(340, 175, 340, 270)
+        s.text(370, 172, "C")
+        s.text(300, 60, "+ v", fill="cyan", font=("Arial", 11, "bold"))
+    s.value("C", 370, 150, anchor="center")
+    s.wire(60, 270, 340, 270)
+    s.ground(200, 270)
+    return s
+
+
+def _astable_555() -> Schematic:
+    s = Schematic(450, 400)
+    s.text(80, 30, "VCC", font=("Arial", 12, "bold"))
+    s.wire(80, 40, 80, 60)
+    s.resistor(80, 60, 80, 120, vertical=True)
+    s.text(110, 90, "R1", font=("Arial", 12, "bold"))
+    s.value("R1", 96, 104)
+    s.node(80, 120)                         # ponto A
+    s.wire(80, 120, 200, 120)
+    s.wire(80, 120, 80, 140)
+    s.resistor(80, 140, 80, 200, vertical=True)
+    s.text(110, 170, "R2", font=("Arial", 12, "bold"))
+    s.value("R2", 96, 184)
+    s.node(80, 200)                         # pontos B e C
+    s.wire(80, 200, 200, 200)
+    s.wire(80, 200, 80, 220)
+    s.capacitor(80, 230, vertical=True)
+    s.text(110, 230, "C", font=("Arial", 12, "bold"))
+    s.value("C", 96, 246)
+    s.wire(80, 240, 80, 280)
+    s.ground(80, 280)
+    s.wire(200, 280, 80, 280)
+    # CI 555 e pinos
+    s.box(200, 100, 320, 300, outline="white", width=2, fill="#1a1a1a")
+    s.text(260, 120, "555", fill="cyan", font=("Arial", 16, "bold"))
+    s.text(260, 140, "TIMER", fill="white", font=("Arial", 10))
+    for y, pin in ((120, "7"), (160, "6"), (200, "2"), (240, "1")):
+        s.text(180, y, pin, fill="yellow", font=("Arial", 9))
+    s.wire(320, 180, 370, 180)              # saída
+    s.text(340, 165, "3", fill="yellow", font=("Arial", 9))
+    s.text(395, 180, "vout", fill="cyan", font=("Arial", 12, "bold"))
+    s.value("f", 395, 198, anchor="center")
+    s.wire(200, 240, 180, 240)              # pino 1 (GND)
+    s.wire(180, 240, 180, 280)
+    s.wire(260, 100, 260, 60)               # pinos 4 e 8 (VCC e reset)
+    s.wire(260, 60, 80, 60)
+    return s
+
+
+def _buck_converter() -> Schematic:
+    s = Schematic(500, 350)
+    s.voltage_source(60, 150, "Vin")
+    s.wire(60, 130, 60, 80)
+    s.wire(60, 170, 60, 220)
+    # Chave (MOSFET)
+    s.wire(60, 80, 140, 80)
+    s.box(140, 60, 180, 100, outline="cyan", width=2, fill="#003333")
+    s.text(160, 80, "S", fill="white", font=("Arial", 14, "bold"))
+    s.text(160, 45, "PWM", fill="yellow", font=("Arial", 10, "bold"))
+    # Diodo de roda livre
+    s.wire(180, 80, 200, 80)
+    s.node(200, 80)
+    s.wire(200, 80, 200, 160)
+    s.diode(140, 160, direction="right")
+    s.wire(120, 160, 60, 160)
+    s.text(105, 145, "D", fill="white", font=("Arial", 11))
+    # Indutor
+    s.wire(200, 80, 220, 80)
+    s.inductor(220, 80, 300, 80)
+    s.text(260, 60, "L")
+    s.value("L", 260, 42, anchor="center")
+    # Capacitor de saída
+    s.wire(300, 80, 350, 80)
+    s.wire(350, 80, 350, 130)
+    s.capacitor(350, 140, vertical=True)
+    s.text(380, 140, "C")
+    s.value("C", 356, 185)
+    s.wire(350, 150, 350, 220)
+    # Carga
+    s.wire(350, 80, 420, 80)
+    s.resistor(420, 80, 420, 160, vertical=True)
+    s.text(450, 120, "R")
+    s.value("R", 436, 138)
+    s.wire(420, 160, 420, 220)
+    s.text(460, 80, "Vout", fill="cyan", font=("Arial", 12, "bold"))
+    s.value("Vout", 460, 98, anchor="center")
+    s.wire(60, 220, 420, 220)
+    s.ground(240, 220)
+    return s
+
+
+def _rl_response() -> Schematic:
+    s = Schematic(400, 350)
+    s.voltage_source(80, 150, "V")
+    s.wire(80, 130, 80, 80)
+    s.wire(80, 170, 80, 220)
+    s.wire(80, 80, 150, 80)
+    s.resistor(150, 80, 250, 80)
+    s.text(200, 60, "R")
+    s.value("R", 200, 105, anchor="center")
+    s.wire(250, 80, 320, 80)
+    s.wire(320, 80, 320, 100)
+    s.inductor(310, 110, 330, 190)
+    s.text(350, 150, "L")
+    s.value("L", 338, 170)
+    s.wire(320, 190, 320, 220)
+    s.wire(80, 220, 320, 220)
+    s.ground(200, 220)
+    return s
+
+
+def _common_emitter() -> Schematic:
+    s = Schematic(450, 500)
+    s.value("VCC", 225, 25, text="VCC = 12V", anchor="center", fill="red",
+            font=("Arial", 13, "bold"))
+    s.wire(225, 35, 225, 50)
+    # RC e coletor (saída)
+    s.resistor(225, 50, 225, 120, vertical=True)
+    s.text(255, 85, "RC", font=("Arial", 12, "bold"))
+    s.value("RC", 243, 102)
+    s.wire(225, 120, 225, 160)
+    s.node(225, 160)
+    s.wire(225, 160, 320, 160)
+    s.text(360, 160, "Vout", fill="cyan")
+    s.capacitor(340, 160, vertical=False)
+    s.text(340, 140, "Co", fill="white", font=("Arial", 10))
+    # Transistor (símbolo simplificado)
+    s.oval(195, 160, 255, 220, outline="white", width=2)
+    s.text(225, 190, "Q1", fill="yellow", font=("Arial", 11, "bold"))
+    s.wire(225, 160, 225, 175)
+    s.text(210, 165, "C", fill="lightblue", font=("Arial", 9))
+    s.wire(195, 190, 210, 190)
+    s.text(185, 190, "B", fill="lightblue", font=("Arial", 9))
+    s.wire(225, 205, 225, 220)
+    s.wire(225, 220, 225, 240, width=3)
+    s.polygon(225, 235, 220, 225, 230, 225, fill="white", outline="white")   # seta do emissor
+    s.text(210, 225, "E", fill="lightblue", font=("Arial", 9))
+    # Divisor da base
+    s.wire(100, 50, 100, 70)
+    s.resistor(100, 70, 100, 140, vertical=True)
+    s.text(75, 105, "R1", font=("Arial", 12, "bold"))
+    s.value("R1", 88, 122, anchor="e")
+    s.wire(100, 140, 100, 190)
+    s.node(100, 190)
+    s.wire(100, 190, 150, 190)
+    s.capacitor(130, 190, vertical=False)
+    s.text(130, 170, "Ci", fill="white", font=("Arial", 10))
+    s.wire(150, 190, 195, 190)
+    s.wire(100, 190, 50, 190)               # entrada
+    s.text(25, 190, "Vin", font=("Arial", 12, "bold"))
+    s.wire(100, 190, 100, 210)
+    s.resistor(100, 210, 100, 280, vertical=True)
+    s.text(75, 245, "R2", font=("Arial", 12, "bold"))
+    s.value("R2", 88, 262, anchor="e")
+    # RE e bypass
+    s.wire(225, 240, 225, 260)
+    s.resistor(225, 260, 225, 330, vertical=True)
+    s.text(255, 295, "RE", font=("Arial", 12, "bold"))
+    s.value("RE", 243, 312)
+    s.wire(225, 295, 280, 295)
+    s.capacitor(290, 295, vertical=True)
+    s.text(320, 295, "CE", fill="white", font=("Arial", 10))
+    s.wire(290, 305, 290, 350)
+    # Terra comum
+    s.wire(100, 280, 100, 350)
+    s.wire(225, 330, 225, 350)
+    s.wire(290, 350, 100, 350)
+    s.wire(100, 50, 225, 50)
+    s.ground(190, 350)
+    return s
+
+
+LIBRARY: Dict[str, Callable[..., Schematic]] = {
+    "ohms_law": _ohms_law,
+    "voltage_divider": _voltage_divider,
+    "current_divider": _current_divider,
+    "rc_circuit": _rc_circuit,
+    "rlc": _rlc,
+    "astable_555": _astable_555,
+    "buck_converter": _buck_converter,
+    "rl_response": _rl_response,
+    "common_emitter": _common_emitter,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def get(name: str, *args) -> Schematic:
+    """Esquema `name` da biblioteca, montado e compilado uma vez por processo."""
+    schematic = LIBRARY[name](*args)
+    schematic.compile()
+    return schematic
@@ -0,0 +1,212 @@
+"""
+screen_cache.py
+---------------
+Cache LRU das telas da interface Tk.
+
+Cada tela é construída uma única vez dentro de seu próprio Frame; ao
+navegar para outra tela o Frame é apenas escondido (pack_forget) e, ao
+voltar, reexibido - sem recriar rótulos, entradas, esquemas nem as
+figuras matplotlib. O cache é limitado pelo número de telas e por uma
+estimativa da memória ocupada; a tela usada há mais tempo é destruída
+primeiro, mas os valores digitados nela são guardados (por rótulo do
+campo) e devolvidos quando ela for reconstruída.
+"""
+
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import tkinter as tk
+from tkinter import ttk
+
+# Custo aproximado de um widget Tk comum (estrutura Tcl + objeto Python)
+WIDGET_BYTES = 2048
+
+
+class _Screen(NamedTuple):
+    frame: tk.Frame
+    fields: Dict[str, tk.Entry]   # rótulo do campo -> entrada
+    images: Tuple[str, ...]       # imagens Tk criadas pela tela (figuras)
+
+
+class ScreenCache:
+    """Telas construídas, da menos para a mais recentemente usada.
+
+    `on_discard(key)` é chamada sempre que uma tela é destruída (remoção
+    pelo limite do cache, discard ou clear), para que quem guardou
+    referências à tela (callbacks, figuras) as solte junto com ela.
+    """
+
+    def __init__(self, container: tk.Frame, max_screens: int = 8,
+                 max_bytes: int = 64 << 20,
+                 on_discard: Optional[Callable[[str], None]] = None) -> None:
+        self.container = container
+        self.max_screens = max_screens
+        self.max_bytes = max_bytes
+        self.on_discard = on_discard
+        self.current: Optional[str] = None
+        self._screens: "OrderedDict[str, _Screen]" = OrderedDict()
+        self._saved: Dict[str, Dict[str, str]] = {}
+        self._building: Optional[Dict[str, tk.Entry]] = None
+        self._restoring: Dict[str, str] = {}
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._screens
+
+    def __len__(self) -> int:
+        return len(self._screens)
+
+    # ==================== EXIBIÇÃO ====================
+
+    def show(self, key: str, build: Callable[[tk.Frame], None]) -> tk.Frame:
+        """Exibe a tela `key`, construindo-a com build(frame) se não estiver no cache."""
+        screen = self._screens.get(key)
+        if screen is not None and screen.frame.winfo_exists():
+            self._hide_current()
+            self._screens.move_to_end(key)
+            screen.frame.pack(fill="both", expand=True)
+            self.current = key
+            return screen.frame
+        self._screens.pop(key, None)
+
+        self._hide_current()
+        frame = tk.Frame(self.container, bg="black")
+        frame.pack(fill="both", expand=True)
+        self.current = key
+        images_before = set(self._image_names())
+        self._building = {}
+        self._restoring = self._saved.pop(key, {})
+        try:
+            build(frame)
+        finally:
+            fields, self._building = self._building, None
+            self._restoring = {}
+        images = tuple(name for name in self._image_names() if name not in images_before)
+        self._screens[key] = _Screen(frame, fields, images)
+        self._evict()
+        return frame
+
+    def _hide_current(self) -> None:
+        screen = self._screens.get(self.current)
+        if screen is not None and screen.frame.winfo_exists():
+            screen.frame.pack_forget()
+
+    # ==================== CAMPOS ====================
+
+    def field_value(self, label: str, default: str) -> str:
+        """Valor inicial de um campo: o guardado na remoção da tela, ou o padrão."""
+        return self._restoring.get(label, default)
+
+    def register_field(self, label: str, entry: tk.Entry) -> None:
+        """Associa uma entrada da tela em construção ao seu rótulo."""
+        if self._building is not None:
+            self._building[label] = entry
+
+    def entry(self, key: str, label: str) -> tk.Entry:
+        """Entrada registrada com `label` na tela `key` (que deve estar no cache)."""
+        return self._screens[key].fields[label]
+
+    def _snapshot(self, screen: _Screen) -> Dict[str, str]:
+        return {label: entry.get() for label, entry in screen.fields.items()
+                if entry.winfo_exists()}
+
+    def values(self) -> Dict[str, Dict[str, str]]:
+        """Valores de todas as telas: as do cache e as já removidas dele."""
+        values = {key: dict(fields) for key, fields in self._saved.items()}
+        for key, screen in self._screens.items():
+            values[key] = self._snapshot(screen)
+        return values
+
+    def restore_values(self, values: Dict[str, Dict[str, str]],
+                       in_place: Iterable[str] = ()) -> List[str]:
+        """Substitui os valores de todas as telas pelos de `values`.
+
+        As telas em cache listadas em `in_place` recebem os valores nas
+        próprias entradas (cada uma recebe o evento virtual <<FieldRestored>>)
+        e continuam construídas; as demais telas em cache são destruídas e
+        reconstruídas com os novos valores quando forem exibidas (telas
+        cujos valores não mudam ficam como estão). Devolve as telas
+        atualizadas no lugar.
+        """
+        in_place = set(in_place)
+        updated = []
+        self._saved = {key: dict(fields) for key, fields in values.items()
+                       if key not in self._screens}
+        for key in list(self._screens):
+            screen = self._screens[key]
+            fields = values.get(key, {})
+            if self._snapshot(screen) == fields:
+                continue
+            if key not in in_place or set(fields) != set(screen.fields):
+                self.discard(key, keep_values=False)
+                if fields:
+                    self._saved[key] = dict(fields)
+                continue
+            for label, entry in screen.fields.items():
+                if not entry.winfo_exists() or entry.get() == fields[label]:
+                    continue
+                if isinstance(entry, ttk.Combobox):   # somente leitura: insert não vale
+                    entry.set(fields[label])
+                else:
+                    entry.delete(0, tk.END)
+                    entry.insert(0, fields[label])
+                entry.event_generate("<<FieldRestored>>")
+            updated.append(key)
+        return updated
+
+    # ==================== MEMÓRIA ====================
+
+    def _image_names(self):
+        return self.container.tk.call("image", "names")
+
+    def estimate_bytes(self, key: str) -> int:
+        """Estimativa da memória da tela: imagens das figuras + widgets."""
+        screen = self._screens[key]
+        tk_call = self.container.tk.call
+        total = 0
+        for name in screen.images:
+            try:
+                width = int(tk_call("image", "width", name))
+                height = int(tk_call("image", "height", name))
+            except tk.TclError:
+                continue
+            # Imagem Tk + buffer do renderizador Agg, ambos RGBA
+            total += 2 * 4 * width * height
+        stack = [screen.frame]
+        while stack:
+            widget = stack.pop()
+            total += WIDGET_BYTES
+            stack.extend(widget.winfo_children())
+        return total
+
+    def total_bytes(self) -> int:
+        return sum(self.estimate_bytes(key) for key in self._screens)
+
+    def _evict(self) -> None:
+        """Remove as telas menos usadas até respeitar os limites."""
+        sizes = {key: self.estimate_bytes(key) for key in self._screens}
+        total = sum(sizes.values())
+        for key in list(self._screens):
+            if len(self._screens) <= self.max_screens and total <= self.max_bytes:
+                break
+            if key == self.current:
+                continue
+            self.discard(key)
+            total -= sizes[key]
+
+    def discard(self, key: str, keep_values: bool = True) -> None:
+        """Destrói uma tela, guardando (opcionalmente) os valores digitados."""
+        screen = self._screens.pop(key)
+        if keep_values:
+            self._saved[key] = self._snapshot(screen)
+        if key == self.current:
+            self.current = None
+        screen.frame.destroy()
+        if self.on_discard is not None:
+            self.on_discard(key)
+
+    def clear(self, keep_values: bool = False) -> None:
+        """Destrói todas as telas (e esquece os valores, salvo keep_values)."""
+        for key in list(self._screens):
+            self.discard(key, keep_values)
+        if not keep_values:
+            self._saved.clear()
@@ -0,0 +1,129 @@
+"""
+session_io.py
+-------------
+Sessões salvas (Arquivo > Salvar/Abrir Configuração).
+
+Uma sessão guarda os valores digitados em todas as telas, a tela ativa,
+as opções da interface e, opcionalmente, os resultados das últimas
+simulações. O arquivo .vss é um zip sem compressão:
+
+* session.json - formato, versão, tela ativa, valores por tela
+  ({tela: {rótulo: texto}}), opções e o índice dos arrays;
+* arrays/<tela>/<nome>.npy - um membro .npy por array de resultado.
+
+Abrir uma sessão lê só o JSON (poucos kB, sem importar numpy); cada
+array é lido do zip apenas quando alguém o pede, então trocar entre
+centenas de variantes de projeto custa milissegundos mesmo quando elas
+carregam varreduras grandes.
+"""
+
+import json
+import os
+import time
+import zipfile
+from typing import Callable, Dict, Mapping, NamedTuple, Optional
+
+FORMAT_NAME = "visual-spreadsheets-session"
+FORMAT_VERSION = 1
+EXTENSION = ".vss"
+
+_INDEX = "session.json"
+_ARRAYS = "arrays"
+
+
+class Session(NamedTuple):
+    active: Optional[str]                       # tela exibida ao salvar (nome do show_*)
+    values: Dict[str, Dict[str, str]]           # tela -> rótulo do campo -> texto digitado
+    options: Dict[str, object]                  # opções da interface (ex.: live_update)
+    arrays: Dict[str, Dict[str, Callable]]      # tela -> nome -> leitura sob demanda
+    saved_at: str
+
+
+# ==================== GRAVAÇÃO ====================
+
+def _member(screen: str, name: str) -> str:
+    return f"{_ARRAYS}/{screen}/{name}.npy"
+
+
+def save(path: str, active: Optional[str], values: Mapping[str, Mapping[str, str]],
+         options: Optional[Mapping[str, object]] = None,
+         arrays: Optional[Mapping[str, Mapping[str, object]]] = None) -> None:
+    """Grava a sessão em `path`, substituindo o arquivo anterior de uma vez.
+
+    `arrays` é {tela: {nome: array}}; sem ele a sessão guarda só os
+    valores e nem o numpy é importado.
+    """
+    index = {
+        "format": FORMAT_NAME,
+        "version": FORMAT_VERSION,
+        "saved_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "active": active,
+        "values": {screen: dict(fields) for screen, fields in values.items() if fields},
+        "options": dict(options or {}),
+        "arrays": {screen: sorted(data) for screen, data in (arrays or {}).items() if data},
+    }
+    # Grava ao lado do destino e renomeia: uma falha no meio não corrompe a sessão anterior
+    temporary = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temporary, "wb") as f, zipfile.ZipFile(f, "w", zipfile.ZIP_STORED) as archive:
+            archive.writestr(_INDEX, json.dumps(index, ensure_ascii=False, indent=1))
+            if index["arrays"]:
+                import numpy as np
+                for screen, names in index["arrays"].items():
+                    for name in names:
+                        with archive.open(_member(screen, name), "w", force_zip64=True) as member:
+                            np.lib.format.write_array(member, np.asanyarray(arrays[screen][name]),
+                                                      allow_pickle=False)
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.unlink(temporary)
+        raise
+
+
+# ==================== LEITURA ====================
+
+def _lazy_array(path: str, member: str) -> Callable:
+    """Função que lê `member` do zip quando chamada (e guarda o resultado)."""
+    cache = []
+
+    def read():
+        if not cache:
+            import numpy as np
+            with zipfile.ZipFile(path) as archive, archive.open(member) as f:
+                cache.append(np.lib.format.read_array(f, allow_pickle=False))
+        return cache[0]
+    return read
+
+
+def load(path: str) -> Session:
+    """Lê o índice da sessão; os arrays ficam no arquivo até serem pedidos."""
+    try:
+        with zipfile.ZipFile(path) as archive:
+            index = json.loads(archive.read(_INDEX).decode("utf-8"))
+    except (zipfile.BadZipFile, KeyError, UnicodeDecodeError, json.JSONDecodeError):
+        raise ValueError(f"{path}: não é uma sessão do Visual Spreadsheets") from None
+    if not isinstance(index, dict) or index.get("format") != FORMAT_NAME:
+        raise ValueError(f"{path}: não é uma sessão do Visual Spreadsheets")
+    version = index.get("version")
+    if not isinstance(version, int) or version > FORMAT_VERSION:
+        raise ValueError(f"{path}: versão de sessão não suportada: {version} "
+                         f"(esta versão lê até {FORMAT_VERSION})")
+    active = index.get("active")
+    values = index.get("values", {})
+    options = index.get("options", {})
+    names = index.get("arrays", {})
+    # O índice vem do arquivo: a estrutura é conferida antes de qualquer uso
+    if not (isinstance(active, (str, type(None)))
+            and isinstance(values, dict)
+            and all(isinstance(fields, dict) for fields in values.values())
+            and isinstance(options, dict)
+            and isinstance(names, dict)
+            and all(isinstance(members, list) and all(isinstance(n, str) for n in members)
+                    for members in names.values())):
+        raise ValueError(f"{path}: não é uma sessão do Visual Spreadsheets (índice inválido)")
+    values = {str(screen): {str(label): str(text) for label, text in fields.items()}
+              for screen, fields in values.items()}
+    arrays = {screen: {name: _lazy_array(path, _member(screen, name)) for name in members}
+              for screen, members in names.items()}
+    return Session(active, values, dict(options), arrays, str(index.get("saved_at", "")))
@@ -0,0 +1,109 @@
+"""
+spectrum.py
+-----------
+Espectro harmônico, THD e valor RMS de formas de onda periódicas.
+
+Dois caminhos:
+
+* Forma fechada (rectangular_wave): para a onda retangular ideal de
+  ciclo de trabalho D e amplitude A = Vhigh - Vlow, a n-ésima harmônica
+  tem amplitude de pico 2·|A|·|sin(n·π·D)|/(n·π). Milhares de harmônicas
+  custam uma única expressão vetorizada.
+
+* FFT (sampled_wave): np.fft.rfft de uma forma de onda amostrada ou
+  simulada, com número inteiro de períodos na janela para que cada
+  harmônica caia exatamente em um bin (sem vazamento espectral).
+
+Nos dois casos o THD usa Parseval: a potência AC total (RMS² - DC²)
+menos a da fundamental é a soma de todas as harmônicas, não só das
+listadas, de modo que o valor não depende de quantas são mostradas.
+"""
+
+import math
+from typing import NamedTuple
+
+import numpy as np
+
+
+class Spectrum(NamedTuple):
+    frequencies: np.ndarray    # n·f0 para n = 1..N (Hz)
+    amplitudes: np.ndarray     # amplitude de pico de cada harmônica (V)
+    dc: float                  # valor médio (V)
+    rms: float                 # valor RMS total, incluindo DC (V)
+    thd: float                 # distorção harmônica total (razão; nan sem fundamental)
+
+
+def _thd(rms: float, dc: float, fundamental: float) -> float:
+    """THD por Parseval: sqrt(V_ac² - V1²)/V1, com V1 o RMS da fundamental."""
+    v1 = fundamental / math.sqrt(2)
+    if v1 <= 0:
+        return math.nan
+    ac2 = rms * rms - dc * dc
+    return math.sqrt(max(ac2 - v1 * v1, 0.0)) / v1
+
+
+def rectangular_wave(t_high: float, period: float, high: float, low: float,
+                     harmonics: int) -> Spectrum:
+    """Série de Fourier fechada da onda retangular ideal (N harmônicas)."""
+    if period <= 0:
+        raise ValueError("O período deve ser positivo")
+    if harmonics < 1:
+        raise ValueError("O número de harmônicas deve ser pelo menos 1")
+    D = min(max(t_high / period, 0.0), 1.0)
+    A = high - low
+    n = np.arange(1, int(harmonics) + 1)
+    amplitudes = 2 * abs(A) / (np.pi * n) * np.abs(np.sin(np.pi * n * D))
+    dc = low + A * D
+    rms = math.sqrt(D * high * high + (1 - D) * low * low)
+    return Spectrum(n / period, amplitudes, dc, rms, _thd(rms, dc, amplitudes[0]))
+
+
+def sampled_wave(v, duration: float, fundamental: float, harmonics: int) -> Spectrum:
+    """Espectro por FFT de amostras uniformes cobrindo `duration` segundos.
+
+    A janela deve conter um número inteiro de períodos de `fundamental`;
+    a harmônica n é lida no bin n·(períodos na janela). Harmônicas acima
+    da frequência de Nyquist aparecem com amplitude zero.
+    """
+    v = np.asarray(v, dtype=float)
+    if duration <= 0 or fundamental <= 0:
+        raise ValueError("Duração e frequência fundamental devem ser positivas")
+    if harmonics < 1:
+        raise ValueError("O número de harmônicas deve ser pelo menos 1")
+    periods = max(int(round(fundamental * duration)), 1)
+    X = np.fft.rfft(v)
+    n = np.arange(1, int(harmonics) + 1)
+    bins = n * periods
+    amplitudes = np.zeros(n.size)
+    valid = bins < X.size
+    # Amplitude de pico de um só lado; o bin de Nyquist (N par) não é duplicado
+    scale = np.where(2 * bins[valid] == v.size, 1.0, 2.0) / v.size
+    amplitudes[valid] = scale * np.abs(X[bins[valid]])
+    dc = X[0].real / v.size
+    rms = math.sqrt(float(np.mean(v * v)))
+    return Spectrum(n * (periods / duration), amplitudes, dc, rms,
+                    _thd(rms, dc, amplitudes[0]))
+
+
+def to_dbv(amplitudes, floor_db: float = -120.0):
+    """Amplitudes de pico em dBV (referência 1 V RMS), limitadas por baixo."""
+    rms = np.asarray(amplitudes, dtype=float) / math.sqrt(2)
+    with np.errstate(divide="ignore"):
+        return np.maximum(20 * np.log10(rms), floor_db)
+
+
+def log_column_peaks(frequencies, values, columns: int, f_min: float, f_max: float):
+    """Maior valor por coluna de pixels de um eixo de frequência logarítmico.
+
+    Hastes que partem de um piso comum e caem na mesma coluna se
+    sobrepõem; basta desenhar a mais alta de cada coluna. Devolve
+    (frequências, valores) só das harmônicas mantidas.
+    """
+    frequencies = np.asarray(frequencies, dtype=float)
+    values = np.asarray(values, dtype=float)
+    if frequencies.size <= columns:
+        return frequencies, values
+    span = math.log(f_max / f_min)
+    column = ((np.log(frequencies / f_min) / span) * columns).astype(int)
+    starts = np.flatnonzero(np.diff(column, prepend=column[0] - 1))
+    return frequencies[starts], np.maximum.reduceat(values, starts)
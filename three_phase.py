@@ -0,0 +1,263 @@
+"""
+three_phase.py
+--------------
+Sistemas trifásicos equilibrados e desequilibrados, com cargas em
+estrela (com ou sem neutro) ou em triângulo, por fasores complexos em
+valores eficazes.
+
+Toda grandeza de fase é um array complexo com as fases a, b e c no
+último eixo (forma (..., 3)); os eixos anteriores são lotes de
+conjuntos de cargas ou as linhas de um perfil no tempo. Cada análise é
+uma única avaliação NumPy sobre o lote inteiro: um ano de dados
+horários (8760 × 3) ou 10⁶ linhas não passam por laço Python algum.
+
+Convenções:
+
+* fonte equilibrada: Va = VL/√3 ∠0°, com Vb e Vc atrasadas de 120° e
+  240° na sequência abc (adiantadas na acb);
+* estrela com neutro: cada carga vê a tensão de fase da fonte e
+  In = Ia + Ib + Ic;
+* estrela sem neutro: o centro da estrela se desloca de
+  VnN = Σ(Yk·Vk)/ΣYk (Millman) e In = 0;
+* triângulo: cargas Zab, Zbc e Zca entre as linhas, com Ia = Iab - Ica,
+  Ib = Ibc - Iab e Ic = Ica - Ibc;
+* potência por fase S = V·I* (P = Re S, Q = Im S, aparente = |S|).
+
+As cargas são internamente admitâncias, então uma fase em aberto
+(admitância 0, ou potência 0 num perfil) não gera divisão por zero.
+Divisões por zero restantes (curto-circuito, Z = 0) não levantam
+exceção: o resultado fica inf/nan, como em circuit_solvers.
+"""
+
+import math
+from typing import Dict, NamedTuple, Tuple
+
+import numpy as np
+
+CONNECTIONS = ("estrela", "triângulo")
+SEQUENCES = ("abc", "acb")
+PROFILE_COLUMNS = ("Pa", "Qa", "Pb", "Qb", "Pc", "Qc")
+
+A = np.exp(2j * np.pi / 3)      # operador a = 1∠120°
+# Multiplicadores das fases a, b, c de uma fonte equilibrada
+_ROTATION = {"abc": np.array([1, A * A, A]), "acb": np.array([1, A, A * A])}
+# Componentes simétricas: [x0, x1, x2] = FORTESCUE @ [xa, xb, xc]
+FORTESCUE = np.array([[1, 1, 1], [1, A, A * A], [1, A * A, A]]) / 3
+
+
+class ThreePhaseResult(NamedTuple):
+    V_phase: np.ndarray        # tensão sobre cada carga (V): fase-neutro na estrela, de linha no triângulo
+    I_phase: np.ndarray        # corrente em cada carga (A)
+    V_line: np.ndarray         # tensões de linha Vab, Vbc, Vca (V)
+    I_line: np.ndarray         # correntes de linha Ia, Ib, Ic (A)
+    I_neutral: np.ndarray      # corrente de neutro (A; 0 sem neutro e no triângulo)
+    V_neutral: np.ndarray      # deslocamento do centro da estrela VnN (V; 0 com neutro)
+    S: np.ndarray              # potência complexa por fase (VA)
+    P: np.ndarray              # potência ativa por fase (W)
+    Q: np.ndarray              # potência reativa por fase (var)
+    apparent: np.ndarray       # potência aparente por fase (VA)
+    P_total: np.ndarray        # soma das potências ativas (W)
+    Q_total: np.ndarray        # soma das potências reativas (var)
+    apparent_total: np.ndarray # |S total| (VA)
+    power_factor: np.ndarray   # P total / |S total|
+    unbalance: np.ndarray      # desequilíbrio de corrente |I2|/|I1| das linhas
+
+
+def _phases(values) -> np.ndarray:
+    """Array complexo (..., 3); um escalar vale para as três fases."""
+    values = np.asarray(values, dtype=complex)
+    if values.ndim == 0:
+        values = np.broadcast_to(values, (3,))
+    if values.shape[-1] != 3:
+        raise ValueError(f"O último eixo deve ter as 3 fases (forma recebida {values.shape})")
+    return values
+
+
+def source_voltages(V_line, sequence: str = "abc") -> np.ndarray:
+    """Tensões fase-neutro de uma fonte equilibrada de tensão de linha VL (eficaz)."""
+    if sequence not in SEQUENCES:
+        raise ValueError(f"Sequência desconhecida: {sequence} (use {', '.join(SEQUENCES)})")
+    V = np.asarray(V_line, dtype=float)[..., np.newaxis] / math.sqrt(3)
+    return V * _ROTATION[sequence]
+
+
+def line_voltages(V_phase) -> np.ndarray:
+    """Vab, Vbc, Vca a partir das tensões de fase (Vab = Va - Vb...)."""
+    V_phase = _phases(V_phase)
+    return V_phase - np.roll(V_phase, -1, axis=-1)
+
+
+def symmetrical_components(values) -> np.ndarray:
+    """Componentes de sequência zero, positiva e negativa no último eixo."""
+    return _phases(values) @ FORTESCUE.T
+
+
+def unbalance(values) -> np.ndarray:
+    """Fator de desequilíbrio |x2|/|x1| (0 num sistema equilibrado).
+
+    Na sequência acb os papéis se invertem, então a razão é sempre a da
+    menor sobre a maior das duas componentes.
+    """
+    components = np.abs(symmetrical_components(values))
+    low = np.minimum(components[..., 1], components[..., 2])
+    high = np.maximum(components[..., 1], components[..., 2])
+    return np.where(high > 0, low / np.where(high > 0, high, 1.0), 0.0)[()]
+
+
+def _result(V_phase, I_phase, V_line, I_line, I_neutral, V_neutral) -> ThreePhaseResult:
+    S = V_phase * np.conj(I_phase)
+    S_total = S.sum(axis=-1)
+    apparent_total = np.abs(S_total)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        power_factor = np.where(apparent_total > 0,
+                                S_total.real / np.where(apparent_total > 0, apparent_total, 1.0), 1.0)
+    return ThreePhaseResult(V_phase, I_phase, V_line, I_line, I_neutral[()], V_neutral[()],
+                            S, S.real, S.imag, np.abs(S), S_total.real[()], S_total.imag[()],
+                            apparent_total[()], power_factor[()], unbalance(I_line))
+
+
+# ==================== CARGAS EM ESTRELA E TRIÂNGULO ====================
+
+def wye_admittances(V_source, Y, neutral: bool = True) -> ThreePhaseResult:
+    """Carga em estrela de admitâncias Ya, Yb, Yc (S) sob as tensões de fase da fonte."""
+    V = _phases(V_source)
+    Y = _phases(Y)
+    V, Y = np.broadcast_arrays(V, Y)
+    if neutral:
+        V_neutral = np.zeros(V.shape[:-1], dtype=complex)
+        V_load = V
+    else:
+        # Millman; sem carga alguma (ΣY = 0) o centro fica no neutro da fonte
+        total = Y.sum(axis=-1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            V_neutral = np.where(total != 0, (Y * V).sum(axis=-1) / np.where(total != 0, total, 1.0),
+                                 0.0)
+        V_load = V - V_neutral[..., np.newaxis]
+    I = Y * V_load
+    I_neutral = I.sum(axis=-1) if neutral else np.zeros(V.shape[:-1], dtype=complex)
+    return _result(V_load, I, line_voltages(V), I, I_neutral, V_neutral)
+
+
+def delta_admittances(V_source, Y) -> ThreePhaseResult:
+    """Carga em triângulo de admitâncias Yab, Ybc, Yca (S) sob as tensões de fase da fonte."""
+    V = _phases(V_source)
+    Y = _phases(Y)
+    V_line = line_voltages(V)
+    V_line, Y = np.broadcast_arrays(V_line, Y)
+    I_phase = Y * V_line
+    I_line = I_phase - np.roll(I_phase, 1, axis=-1)
+    zeros = np.zeros(V_line.shape[:-1], dtype=complex)
+    return _result(V_line, I_phase, V_line, I_line, zeros, zeros)
+
+
+def _admittances(Z) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return 1 / _phases(Z)
+
+
+def wye_load(V_source, Z, neutral: bool = True) -> ThreePhaseResult:
+    """Carga em estrela de impedâncias Za, Zb, Zc (Ω)."""
+    return wye_admittances(V_source, _admittances(Z), neutral)
+
+
+def delta_load(V_source, Z) -> ThreePhaseResult:
+    """Carga em triângulo de impedâncias Zab, Zbc, Zca (Ω)."""
+    return delta_admittances(V_source, _admittances(Z))
+
+
+def analyze(connection: str, V_line, Z, neutral: bool = True,
+            sequence: str = "abc") -> ThreePhaseResult:
+    """Carga de impedâncias (..., 3) alimentada por uma fonte equilibrada de tensão VL."""
+    V = source_voltages(V_line, sequence)
+    if connection == CONNECTIONS[0]:
+        return wye_load(V, Z, neutral)
+    if connection == CONNECTIONS[1]:
+        return delta_load(V, Z)
+    raise ValueError(f"Ligação desconhecida: {connection}")
+
+
+# ==================== PERFIS DE CARGA ====================
+
+def power_admittances(V, P, Q) -> np.ndarray:
+    """Admitâncias que absorvem P + jQ sob as tensões V: Y = (P - jQ)/|V|²."""
+    P = np.asarray(P, dtype=float)
+    Q = np.asarray(Q, dtype=float)
+    magnitude = np.abs(np.asarray(V))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (P - 1j * Q) / (magnitude * magnitude)
+
+
+def profile(connection: str, V_line, P, Q, neutral: bool = True,
+            sequence: str = "abc") -> ThreePhaseResult:
+    """Análise de um perfil de potências por fase, P e Q de forma (n, 3).
+
+    Cada linha (ex.: uma hora) vira uma carga de impedância constante
+    que absorve P + jQ na tensão nominal - exato na estrela com neutro,
+    em que cada fase vê a tensão da fonte; na estrela sem neutro e no
+    triângulo desequilibrados, as potências resultantes são as dessa
+    carga equivalente. No triângulo as colunas a, b, c são os ramos ab,
+    bc e ca.
+    """
+    V = source_voltages(V_line, sequence)
+    if connection == CONNECTIONS[0]:
+        return wye_admittances(V, power_admittances(V, P, Q), neutral)
+    if connection == CONNECTIONS[1]:
+        return delta_admittances(V, power_admittances(line_voltages(V), P, Q))
+    raise ValueError(f"Ligação desconhecida: {connection}")
+
+
+def synthetic_profile(hours: int = 8760, peak: float = 10000.0, power_factor: float = 0.92,
+                      seed: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    """Perfil horário de demonstração (P, Q), forma (hours, 3), em W e var.
+
+    Curva diária residencial (vale de madrugada, pico à noite), variação
+    sazonal, fases com participações diferentes e ruído por hora.
+    """
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(hours), dtype=float)
+    hour = t % 24
+    daily = (0.45 + 0.25 * np.exp(-((hour - 12) / 3.0) ** 2)
+             + 0.55 * np.exp(-((hour - 19.5) / 2.0) ** 2))
+    seasonal = 1 + 0.15 * np.cos(2 * np.pi * t / 8760)
+    share = np.array([1.0, 0.8, 0.65])
+    noise = rng.lognormal(0.0, 0.12, size=(t.size, 3))
+    P = peak / daily.max() * (daily * seasonal)[:, np.newaxis] * share * noise
+    pf = np.clip(power_factor + rng.normal(0.0, 0.02, size=P.shape), 0.5, 1.0)
+    Q = P * np.tan(np.arccos(pf))
+    return P, Q
+
+
+def _profile_arrays(columns: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    missing = [name for name in PROFILE_COLUMNS[::2] if name not in columns]
+    if missing:
+        raise ValueError(f"Faltam as colunas {', '.join(missing)} no perfil")
+    P = np.column_stack([np.asarray(columns[name], dtype=float) for name in PROFILE_COLUMNS[::2]])
+    Q = np.column_stack([np.asarray(columns[name], dtype=float) if name in columns
+                         else np.zeros(len(P)) for name in PROFILE_COLUMNS[1::2]])
+    return P, Q
+
+
+def load_profile(path: str) -> Tuple[np.ndarray, np.ndarray]:
+    """(P, Q) de forma (n, 3) das colunas Pa, Qa, Pb, Qb, Pc, Qc de um arquivo.
+
+    Aceita CSV/JSONL (lidos em blocos, como no modo em lote) e os
+    arquivos exportados .npz, .npy e .raw (tabela com essas colunas). As
+    colunas Q são opcionais (0 var).
+    """
+    # Importados aqui: batch_cli importa circuit_solvers, que importa este módulo
+    import batch_cli
+    import export_io
+
+    fmt = batch_cli.detect_format(path)
+    if fmt in batch_cli.READERS:
+        blocks: Dict[str, list] = {}
+        with open(path, encoding="utf-8", newline="") as stream:
+            for chunk in batch_cli.READERS[fmt](stream, PROFILE_COLUMNS, batch_cli.DEFAULT_CHUNK):
+                for name, values in chunk.values.items():
+                    blocks.setdefault(name, []).append(values)
+        return _profile_arrays({name: np.concatenate(parts) for name, parts in blocks.items()})
+    arrays = export_io.load(path)
+    table = arrays.get("data")
+    if table is not None and table.dtype.names:
+        arrays = {name: table[name] for name in table.dtype.names}
+    return _profile_arrays(arrays)
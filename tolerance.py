@@ -0,0 +1,292 @@
+"""
+tolerance.py
+------------
+Análise de tolerância por Monte Carlo sobre os circuitos registrados em
+circuit_solvers.CIRCUITS.
+
+As amostras são geradas em blocos como arrays NumPy (nunca um laço
+Python por amostra): primeiro pontos uniformes em (0, 1)^d - pseudo-
+aleatórios ou quase-aleatórios (Halton/Sobol) - e depois transformados
+pela inversa da distribuição escolhida para cada componente.
+"""
+
+import math
+from typing import Callable, Dict, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+import circuit_solvers as cs
+
+DISTRIBUTIONS = {
+    "uniform": "Uniforme",
+    "gaussian": "Gaussiana (±3σ)",
+    "binned": "Gaussiana Selecionada (série E)",
+}
+
+SAMPLERS = {
+    "random": "Pseudo-aleatório",
+    "halton": "Quase-aleatório (Halton)",
+    "sobol": "Quase-aleatório (Sobol)",
+}
+
+# Tolerâncias comerciais das séries E (E6 a E192 e faixas de precisão).
+# Peças de uma faixa costumam vir de lotes dos quais as peças da faixa
+# mais estreita seguinte já foram separadas, deixando um "buraco" no
+# centro da distribuição.
+TOLERANCE_GRADES = (0.20, 0.10, 0.05, 0.02, 0.01, 0.005, 0.0025, 0.001)
+
+_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53)
+
+# Números de direção de Joe & Kuo (new-joe-kuo-6.21201): (s, a, m_1..m_s)
+# para as dimensões 2 em diante; a dimensão 1 usa m_k = 1.
+_SOBOL_DIRECTIONS = (
+    (1, 0, (1,)),
+    (2, 1, (1, 3)),
+    (3, 1, (1, 3, 1)),
+    (3, 2, (1, 1, 1)),
+    (4, 1, (1, 1, 3, 3)),
+    (4, 4, (1, 3, 5, 13)),
+    (5, 2, (1, 1, 5, 5, 17)),
+    (5, 4, (1, 1, 5, 5, 5)),
+    (5, 7, (1, 1, 7, 11, 19)),
+    (5, 11, (1, 1, 5, 1, 1)),
+    (5, 13, (1, 1, 1, 3, 11)),
+    (5, 14, (1, 3, 5, 5, 31)),
+)
+_SOBOL_BITS = 32
+_SOBOL_MAX_DIMS = len(_SOBOL_DIRECTIONS) + 1
+
+
+class ComponentTolerance(NamedTuple):
+    nominal: float
+    tolerance: float  # fração, ex.: 0.05 para ±5%
+    distribution: str = "gaussian"
+
+
+class ToleranceSummary(NamedTuple):
+    mean: float
+    std: float
+    minimum: float
+    maximum: float
+    percentiles: Dict[float, float]
+    yield_fraction: float
+    n_valid: int
+
+
+# ==================== AMOSTRAGEM UNIFORME ====================
+
+def _radical_inverse(index: np.ndarray, base: int) -> np.ndarray:
+    """Inverso radical de cada índice na base dada (sequência de van der Corput)."""
+    result = np.zeros(index.shape, dtype=float)
+    remaining = index.copy()
+    factor = 1.0 / base
+    while np.any(remaining):
+        remaining, digit = np.divmod(remaining, base)
+        result += digit * factor
+        factor /= base
+    return result
+
+
+def halton(n: int, dims: int, start: int = 0, rng=None) -> np.ndarray:
+    """Pontos de Halton (n, dims) com rotação aleatória de Cranley-Patterson."""
+    if dims > len(_PRIMES):
+        raise ValueError(f"Halton suporta no máximo {len(_PRIMES)} dimensões")
+    rng = np.random.default_rng(rng)
+    shift = rng.random(dims)
+    index = np.arange(start + 1, start + n + 1, dtype=np.int64)
+    points = np.empty((n, dims))
+    for d in range(dims):
+        points[:, d] = _radical_inverse(index, _PRIMES[d])
+    return (points + shift) % 1.0
+
+
+def _sobol_vectors(dims: int) -> np.ndarray:
+    """Tabela (dims, bits) de números de direção V_k = m_k · 2^(bits-k)."""
+    bits = _SOBOL_BITS
+    table = np.zeros((dims, bits), dtype=np.uint64)
+    table[0] = [1 << (bits - k - 1) for k in range(bits)]
+    for d in range(1, dims):
+        s, a, m_init = _SOBOL_DIRECTIONS[d - 1]
+        m = list(m_init)
+        for k in range(s, bits):
+            value = m[k - s] ^ (m[k - s] << s)
+            for j in range(1, s):
+                if (a >> (s - 1 - j)) & 1:
+                    value ^= m[k - j] << j
+            m.append(value)
+        table[d] = [m[k] << (bits - k - 1) for k in range(bits)]
+    return table
+
+
+def sobol(n: int, dims: int, start: int = 0, rng=None) -> np.ndarray:
+    """Pontos de Sobol (n, dims) em código Gray, com deslocamento digital aleatório."""
+    if dims > _SOBOL_MAX_DIMS:
+        raise ValueError(f"Sobol suporta no máximo {_SOBOL_MAX_DIMS} dimensões")
+    if dims == 0:
+        return np.empty((n, 0))
+    rng = np.random.default_rng(rng)
+    shift = rng.integers(0, 1 << _SOBOL_BITS, size=dims, dtype=np.uint64)
+    index = np.arange(start, start + n, dtype=np.uint64)
+    gray = index ^ (index >> np.uint64(1))
+    vectors = _sobol_vectors(dims)
+    points = np.empty((n, dims))
+    for d in range(dims):
+        x = np.full(n, shift[d], dtype=np.uint64)
+        for k in range(_SOBOL_BITS):
+            bit = (gray >> np.uint64(k)) & np.uint64(1)
+            x ^= bit * vectors[d, k]
+        points[:, d] = (x.astype(float) + 0.5) / float(1 << _SOBOL_BITS)
+    return points
+
+
+def sample_unit(n: int, dims: int, sampler: str = "random",
+                start: int = 0, rng=None) -> np.ndarray:
+    """Pontos uniformes (n, dims) em (0, 1) pelo amostrador escolhido.
+
+    `start` permite gerar a sequência em blocos; para as sequências
+    quase-aleatórias, o mesmo `rng` deve ser usado em todos os blocos.
+    """
+    if sampler == "halton":
+        return halton(n, dims, start, rng)
+    if sampler == "sobol":
+        return sobol(n, dims, start, rng)
+    if sampler == "random":
+        return np.random.default_rng(rng).random((n, dims))
+    raise ValueError(f"Amostrador desconhecido: {sampler}")
+
+
+# ==================== DISTRIBUIÇÕES ====================
+
+def _norm_cdf(x: float) -> float:
+    return 0.5 * (1.0 + math.erf(x / math.sqrt(2.0)))
+
+
+def norm_ppf(p) -> np.ndarray:
+    """Inversa da normal padrão (aproximação racional de Acklam, erro < 1.2e-9)."""
+    a = (-3.969683028665376e+01, 2.209460984245205e+02, -2.759285104469687e+02,
+         1.383577518672690e+02, -3.066479806614716e+01, 2.506628277459239e+00)
+    b = (-5.447609879822406e+01, 1.615858368580409e+02, -1.556989798598866e+02,
+         6.680131188771972e+01, -1.328068155288572e+01)
+    c = (-7.784894002430293e-03, -3.223964580411365e-01, -2.400758277161838e+00,
+         -2.549732539343734e+00, 4.374664141464968e+00, 2.938163982698783e+00)
+    d = (7.784695709041462e-03, 3.224671290700398e-01, 2.445134137142996e+00,
+         3.754408661907416e+00)
+    p = np.asarray(p, dtype=float)
+    low = 0.02425
+    x = np.empty_like(p)
+
+    central = (p >= low) & (p <= 1 - low)
+    q = p[central] - 0.5
+    r = q * q
+    x[central] = (((((a[0]*r + a[1])*r + a[2])*r + a[3])*r + a[4])*r + a[5]) * q / \
+                 (((((b[0]*r + b[1])*r + b[2])*r + b[3])*r + b[4])*r + 1)
+
+    tail = ~central
+    q = np.sqrt(-2 * np.log(np.where(p[tail] < 0.5, p[tail], 1 - p[tail])))
+    value = (((((c[0]*q + c[1])*q + c[2])*q + c[3])*q + c[4])*q + c[5]) / \
+            ((((d[0]*q + d[1])*q + d[2])*q + d[3])*q + 1)
+    x[tail] = np.where(p[tail] < 0.5, value, -value)
+    return x
+
+
+def inner_grade(tolerance: float) -> float:
+    """Tolerância da faixa comercial imediatamente mais estreita."""
+    for grade in TOLERANCE_GRADES:
+        if grade < tolerance * (1 - 1e-9):
+            return grade
+    return tolerance / 2
+
+
+def deviation_from_unit(u, tolerance: float, distribution: str) -> np.ndarray:
+    """Transforma u ~ U(0,1) no desvio relativo do componente (ex.: +0.013)."""
+    u = np.asarray(u, dtype=float)
+    if tolerance == 0:
+        return np.zeros_like(u)
+    if distribution == "uniform":
+        return tolerance * (2 * u - 1)
+
+    # Gaussiana truncada em ±3σ = ±tolerância (peças fora são rejeitadas)
+    p_low = _norm_cdf(-3.0)
+    if distribution == "gaussian":
+        p = p_low + u * (1 - 2 * p_low)
+    elif distribution == "binned":
+        # Remove a faixa central |x| < tolerância mais estreita
+        k = 3.0 * inner_grade(tolerance) / tolerance
+        p_gap_low = _norm_cdf(-k)
+        half = p_gap_low - p_low
+        p = p_low + 2 * half * u
+        p = np.where(u < 0.5, p, p + (1 - 2 * p_gap_low))
+    else:
+        raise ValueError(f"Distribuição desconhecida: {distribution}")
+    return tolerance / 3.0 * norm_ppf(p)
+
+
+# ==================== MONTE CARLO ====================
+
+def monte_carlo(circuit: str, components: Dict[str, ComponentTolerance],
+                n: int = 1_000_000, sampler: str = "random",
+                outputs: Optional[Sequence[str]] = None, seed=None,
+                chunk_size: int = 1 << 18,
+                progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, np.ndarray]:
+    """Amostra os componentes e avalia as saídas do circuito.
+
+    Entradas do circuito ausentes em `components` (ou com tolerância
+    zero) ficam no valor nominal/padrão e não consomem dimensão do
+    amostrador. Devolve um dicionário saída -> array de n amostras.
+    `progress(feitas, n)` é chamada após cada bloco (e pode interromper
+    a análise levantando uma exceção).
+    """
+    spec = cs.CIRCUITS[circuit]
+    if outputs is None:
+        outputs = [o.name for o in spec.outputs]
+    varied = [name for name, comp in components.items() if comp.tolerance != 0]
+    fixed = {name: comp.nominal for name, comp in components.items()}
+    rng = np.random.default_rng(seed)
+    quasi_seed = int(rng.integers(1 << 63))
+
+    results = {name: np.empty(n) for name in outputs}
+    for start in range(0, n, chunk_size):
+        count = min(chunk_size, n - start)
+        if sampler == "random":
+            u = rng.random((count, len(varied)))
+        else:
+            # Mesma semente em todos os blocos: a sequência continua de onde parou
+            u = sample_unit(count, len(varied), sampler, start, quasi_seed)
+        values = dict(fixed)
+        for d, name in enumerate(varied):
+            comp = components[name]
+            values[name] = comp.nominal * (
+                1 + deviation_from_unit(u[:, d], comp.tolerance, comp.distribution)
+            )
+        result = cs.evaluate(circuit, values)
+        for name in outputs:
+            results[name][start:start + count] = getattr(result, name)
+        if progress is not None:
+            progress(start + count, n)
+    return results
+
+
+def summarize(values: np.ndarray, low: Optional[float] = None,
+              high: Optional[float] = None,
+              percentiles: Sequence[float] = (0.135, 2.275, 50.0, 97.725, 99.865)
+              ) -> ToleranceSummary:
+    """Estatísticas, percentis e rendimento dentro dos limites de especificação."""
+    values = np.asarray(values, dtype=float)
+    valid = values[np.isfinite(values)]
+    if valid.size == 0:
+        nan = float("nan")
+        return ToleranceSummary(nan, nan, nan, nan, {p: nan for p in percentiles}, 0.0, 0)
+    passed = np.ones(valid.shape, dtype=bool)
+    if low is not None:
+        passed &= valid >= low
+    if high is not None:
+        passed &= valid <= high
+    return ToleranceSummary(
+        mean=float(valid.mean()),
+        std=float(valid.std()),
+        minimum=float(valid.min()),
+        maximum=float(valid.max()),
+        percentiles=dict(zip(percentiles, np.percentile(valid, percentiles).tolist())),
+        yield_fraction=float(passed.sum()) / values.size,
+        n_valid=int(valid.size),
+    )
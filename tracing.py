@@ -0,0 +1,253 @@
+"""
+tracing.py
+----------
+Rastreamento leve dos caminhos quentes da interface.
+
+Cada trecho medido (span) vira um registro num buffer circular de
+tamanho fixo: nome, categoria, início e duração em nanossegundos e a
+thread. Com o rastreamento desligado (padrão) span() devolve um
+contexto vazio compartilhado e os decoradores chamam a função direto -
+o custo é uma leitura de atributo por chamada.
+
+Categorias usadas pela interface:
+
+* screen - construção de uma tela show_* (só quando não está no cache);
+* action - um cálculo (botão, controle deslizante), dividido nas fases
+  parse (leitura das entradas), math (solvers) e update (rótulos e
+  artistas), marcadas com phase() dentro da função;
+* draw   - renderização matplotlib (canvas.draw) e blit;
+* tk     - do fim de uma ação até o Tk ficar ocioso (geometria e
+  redesenho dos widgets).
+
+export_chrome() grava o buffer no formato Trace Event do Chrome
+(chrome://tracing, ui.perfetto.dev), com os spans aninhados por thread.
+"""
+
+import functools
+import itertools
+import json
+import os
+import threading
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+DEFAULT_CAPACITY = 1 << 16
+
+
+class Span(NamedTuple):
+    name: str
+    category: str
+    start_ns: int      # relativo ao início do rastreador
+    duration_ns: int
+    thread: int
+
+
+class SpanStats(NamedTuple):
+    count: int
+    total_ns: int
+    max_ns: int
+    last_ns: int
+
+
+class _NullSpan:
+    """Contexto vazio devolvido por span() com o rastreamento desligado."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _ActiveSpan:
+    def __init__(self, tracer: "Tracer", name: str, category: str) -> None:
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.tracer.record(self.name, self.category, self.start, time.perf_counter_ns())
+
+
+def _short_name(function: Callable) -> str:
+    """'Classe.show_x.<locals>.calculate' -> 'show_x.calculate'."""
+    parts = [p for p in function.__qualname__.split(".") if p != "<locals>"]
+    return ".".join(parts[-2:])
+
+
+class Tracer:
+    """Buffer circular de spans; os mais antigos são sobrescritos."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        self.capacity = int(capacity)
+        self.enabled = False
+        # Agenda uma função para quando o laço de eventos ficar ocioso
+        # (root.after_idle na interface); None desliga os spans "tk"
+        self.idle_hook: Optional[Callable[[Callable[[], None]], object]] = None
+        self._epoch = time.perf_counter_ns()
+        self._local = threading.local()
+        self.clear()
+
+    # ==================== BUFFER ====================
+
+    def clear(self) -> None:
+        self._names: List[Optional[str]] = [None] * self.capacity
+        self._categories: List[Optional[str]] = [None] * self.capacity
+        self._starts = [0] * self.capacity
+        self._durations = [0] * self.capacity
+        self._threads = [0] * self.capacity
+        self._counter = itertools.count()   # next() é atômico sob o GIL
+        self._written = 0
+
+    def record(self, name: str, category: str, start_ns: int, end_ns: int) -> None:
+        """Grava um span medido com time.perf_counter_ns()."""
+        n = next(self._counter)
+        slot = n % self.capacity
+        self._names[slot] = name
+        self._categories[slot] = category
+        self._starts[slot] = start_ns - self._epoch
+        self._durations[slot] = end_ns - start_ns
+        self._threads[slot] = threading.get_ident()
+        self._written = n + 1
+
+    def __len__(self) -> int:
+        return min(self._written, self.capacity)
+
+    def events(self, last: Optional[int] = None) -> List[Span]:
+        """Spans no buffer (os `last` mais recentes), em ordem de gravação."""
+        count = len(self) if last is None else min(last, len(self))
+        first = self._written - count
+        spans = []
+        for n in range(first, self._written):
+            slot = n % self.capacity
+            if self._names[slot] is not None:
+                spans.append(Span(self._names[slot], self._categories[slot], self._starts[slot],
+                                  self._durations[slot], self._threads[slot]))
+        return spans
+
+    # ==================== MEDIÇÃO ====================
+
+    def span(self, name: str, category: str = "app"):
+        """Contexto que mede o bloco (vazio com o rastreamento desligado)."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _ActiveSpan(self, name, category)
+
+    def _frames(self) -> list:
+        frames = getattr(self._local, "frames", None)
+        if frames is None:
+            frames = self._local.frames = []
+        return frames
+
+    def traced(self, name: Optional[str] = None, category: str = "app",
+               first_phase: Optional[str] = None, idle: bool = False) -> Callable:
+        """Decorador que mede cada chamada da função.
+
+        Com `first_phase`, phase() dentro da função divide a chamada em
+        fases (a primeira com esse nome); com `idle`, a chamada mais
+        externa também registra o tempo até o laço de eventos ficar ocioso.
+        """
+        def decorate(function: Callable) -> Callable:
+            label = name or _short_name(function)
+
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                frames = self._frames()
+                start = time.perf_counter_ns()
+                # [fase atual, início da fase, houve troca de fase]
+                frame = [first_phase, start, False]
+                frames.append(frame)
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    end = time.perf_counter_ns()
+                    frames.pop()
+                    if frame[2] and frame[0] is not None:
+                        self.record(frame[0], "phase", frame[1], end)
+                    self.record(label, category, start, end)
+                    if idle and not frames and self.idle_hook is not None:
+                        self.idle_hook(functools.partial(self._idle_done, end))
+            return wrapper
+        return decorate
+
+    def _idle_done(self, start_ns: int) -> None:
+        self.record("tk idle (layout/redesenho)", "tk", start_ns, time.perf_counter_ns())
+
+    def phase(self, name: str) -> None:
+        """Encerra a fase atual da função rastreada e começa `name`."""
+        if not self.enabled:
+            return
+        frames = self._frames()
+        if not frames or frames[-1][0] is None:
+            return
+        frame = frames[-1]
+        now = time.perf_counter_ns()
+        self.record(frame[0], "phase", frame[1], now)
+        frame[0], frame[1], frame[2] = name, now, True
+
+    # ==================== RESUMO E EXPORTAÇÃO ====================
+
+    def stats(self, last: Optional[int] = None) -> Dict[Tuple[str, str], SpanStats]:
+        """(categoria, nome) -> contagem, total, máximo e último (ns)."""
+        table: Dict[Tuple[str, str], List[int]] = {}
+        for span in self.events(last):
+            entry = table.setdefault((span.category, span.name), [0, 0, 0, 0])
+            entry[0] += 1
+            entry[1] += span.duration_ns
+            entry[2] = max(entry[2], span.duration_ns)
+            entry[3] = span.duration_ns
+        return {key: SpanStats(*value) for key, value in table.items()}
+
+    def chrome_trace(self) -> dict:
+        """Buffer no formato Trace Event do Chrome (eventos "X" em μs)."""
+        pid = os.getpid()
+        names = {t.ident: t.name for t in threading.enumerate()}
+        events = [{"name": s.name, "cat": s.category, "ph": "X", "ts": s.start_ns / 1e3,
+                   "dur": s.duration_ns / 1e3, "pid": pid, "tid": s.thread}
+                  for s in sorted(self.events(), key=lambda s: (s.start_ns, -s.duration_ns))]
+        for tid in sorted({e["tid"] for e in events}):
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                           "args": {"name": names.get(tid, f"thread-{tid}")}})
+        return {"traceEvents": events, "displayTimeUnit": "ms",
+                "otherData": {"capacity": self.capacity, "recorded": self._written}}
+
+    def export_chrome(self, path: str) -> int:
+        """Grava o buffer como JSON do Chrome; devolve o número de spans."""
+        trace = self.chrome_trace()
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(trace, f, ensure_ascii=False)
+        return sum(event["ph"] == "X" for event in trace["traceEvents"])
+
+
+# ==================== RASTREADOR GLOBAL ====================
+
+TRACER = Tracer()
+
+
+def span(name: str, category: str = "app"):
+    if not TRACER.enabled:
+        return _NULL_SPAN
+    return _ActiveSpan(TRACER, name, category)
+
+
+def traced(name: Optional[str] = None, category: str = "app") -> Callable:
+    return TRACER.traced(name, category)
+
+
+def action(function: Callable) -> Callable:
+    """Decorador dos cálculos da interface: fases parse/math/update e ociosidade do Tk."""
+    return TRACER.traced(category="action", first_phase="parse", idle=True)(function)
+
+
+def phase(name: str) -> None:
+    if TRACER.enabled:
+        TRACER.phase(name)
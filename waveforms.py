@@ -0,0 +1,141 @@
+"""
+waveforms.py
+------------
+Geração vetorizada de formas de onda periódicas para os gráficos.
+
+As ondas são devolvidas como vértices (t, v) prontos para ax.plot e
+fill_between: cada transição aparece como dois pontos no mesmo instante,
+de modo que a interpolação linear desenha as bordas verticais. Todos os
+ciclos são montados de uma vez por broadcasting, sem laço em Python.
+
+Quando há mais ciclos do que colunas de pixels no gráfico, desenhar
+cada borda não acrescenta nada visível e só custa tempo de renderização.
+Nesse caso a onda é reduzida a um envelope mínimo/máximo por coluna
+(dois vértices por coluna), como faz um osciloscópio digital: o traço
+ocupa exatamente os pixels que ocuparia a onda completa.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+def square_wave(t_high, period: float, cycles: int, high: float = 1.0,
+                low: float = 0.0, columns: Optional[int] = None
+                ) -> Tuple[np.ndarray, np.ndarray]:
+    """Vértices de `cycles` ciclos de uma onda quadrada começando em t = 0.
+
+    `t_high` é o tempo em nível alto de cada ciclo (escalar, ou um valor
+    por ciclo para representar ciclo de trabalho variável). Se `columns`
+    for dado e a onda tiver mais vértices do que 2·columns, devolve o
+    envelope mínimo/máximo por coluna em vez dos vértices.
+    """
+    cycles = int(cycles)
+    if cycles < 1:
+        raise ValueError("O número de ciclos deve ser pelo menos 1")
+    if period <= 0:
+        raise ValueError("O período deve ser positivo")
+    t_high = np.clip(np.asarray(t_high, dtype=float), 0.0, period)
+    flat = t_high.ndim == 0 and (t_high <= 0 or t_high >= period)
+    if columns is not None and t_high.ndim == 0 and (cycles >= columns or flat):
+        # Onda periódica com ao menos um período inteiro por coluna: todas
+        # as colunas vão de low a high, sem precisar gerar as bordas. Com
+        # ciclo de trabalho 0% ou 100% não há bordas: o nível é constante.
+        edges = np.linspace(0.0, cycles * period, int(columns) + 1)
+        centers = np.repeat((edges[:-1] + edges[1:]) / 2, 2)
+        if flat:
+            return centers, np.full(centers.size, high if t_high >= period else low)
+        return centers, np.tile(np.array([min(low, high), max(low, high)], dtype=float),
+                                int(columns))
+    t_high = np.broadcast_to(t_high, (cycles,))
+
+    # Cada ciclo: sobe em k·T, desce em k·T + t_high; ponto final em N·T
+    starts = np.arange(cycles) * period
+    t = np.empty((cycles, 4))
+    t[:, 0] = t[:, 1] = starts
+    t[:, 2] = t[:, 3] = starts + t_high
+    t = np.append(t.ravel(), cycles * period)
+    v = np.append(np.tile(np.array([low, high, high, low], dtype=float), cycles), low)
+
+    if columns is not None and t.size > 2 * columns:
+        return minmax_envelope(t, v, columns)
+    return t, v
+
+
+def minmax_envelope(t: np.ndarray, v: np.ndarray, columns: int
+                    ) -> Tuple[np.ndarray, np.ndarray]:
+    """Reduz uma polilinha (t crescente) a mínimo e máximo por coluna.
+
+    O intervalo [t[0], t[-1]] é dividido em `columns` colunas iguais;
+    cada coluna vira dois vértices no seu centro (mínimo e máximo dos
+    vértices dentro dela e dos valores interpolados nas suas bordas).
+    """
+    t = np.asarray(t, dtype=float)
+    v = np.asarray(v, dtype=float)
+    columns = max(int(columns), 1)
+    edges = np.linspace(t[0], t[-1], columns + 1)
+    at_edges = np.interp(edges, t, v)
+    lo = np.minimum(at_edges[:-1], at_edges[1:])
+    hi = np.maximum(at_edges[:-1], at_edges[1:])
+
+    # Vértices com edges[j] <= t < edges[j+1] pertencem à coluna j
+    first = np.searchsorted(t, edges[:-1], side="left")
+    count = np.diff(np.append(first, t.size))
+    filled = count > 0
+    starts = first[filled]
+    lo[filled] = np.minimum(lo[filled], np.minimum.reduceat(v, starts))
+    hi[filled] = np.maximum(hi[filled], np.maximum.reduceat(v, starts))
+
+    centers = (edges[:-1] + edges[1:]) / 2
+    return np.repeat(centers, 2), np.column_stack([lo, hi]).ravel()
+
+
+def envelope_band(t: np.ndarray, v: np.ndarray
+                  ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Separa um envelope de minmax_envelope em (x, mínimo, máximo).
+
+    Para desenhar, a faixa entre mínimo e máximo (e o seu contorno) é
+    muito mais barata de rasterizar do que o zigue-zague original, que
+    cruza cada linha de varredura duas vezes por coluna.
+    """
+    return t[::2], v[0::2], v[1::2]
+
+
+def sample_square(t_high, period: float, cycles: int, samples_per_cycle: int,
+                  high: float = 1.0, low: float = 0.0) -> np.ndarray:
+    """Amostras uniformes de `cycles` ciclos da onda quadrada (para FFT).
+
+    A amostra k vale high se cair no trecho alto do seu ciclo; a janela
+    cobre exatamente os ciclos pedidos, sem repetir a primeira amostra.
+    """
+    if period <= 0:
+        raise ValueError("O período deve ser positivo")
+    phase = np.arange(int(cycles) * int(samples_per_cycle)) % samples_per_cycle
+    return np.where(phase < t_high / period * samples_per_cycle, high, low).astype(float)
+
+
+def curve_density(curves: np.ndarray, rows: int, low: float, high: float) -> np.ndarray:
+    """Quantas curvas passam por cada pixel: imagem (rows, amostras).
+
+    Para sobrepor milhares de curvas amostradas na resolução horizontal
+    do gráfico: em vez de desenhar cada uma (custo proporcional ao
+    número de curvas na rasterização), cada amostra incrementa o pixel
+    da sua linha, numa única contagem vetorizada.
+    """
+    curves = np.asarray(curves, dtype=float).reshape(-1, np.shape(curves)[-1])
+    samples = curves.shape[1]
+    if high <= low:
+        high = low + 1.0
+    # Operações no lugar: com milhões de amostras o custo é de memória.
+    # Linhas fora da faixa (e nan) vão para duas linhas extras, descartadas.
+    row = curves - low
+    row *= rows / (high - low)
+    np.nan_to_num(row, copy=False, nan=-1.0)
+    np.floor(row, out=row)
+    np.clip(row, -1, rows, out=row)
+    index = row.astype(np.intp)
+    index += 1
+    index *= samples
+    index += np.arange(samples)
+    counts = np.bincount(index.ravel(), minlength=(rows + 2) * samples)
+    return counts.reshape(rows + 2, samples)[1:-1]